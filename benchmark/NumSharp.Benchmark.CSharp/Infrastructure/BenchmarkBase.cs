@@ -24,11 +24,55 @@ public abstract class BenchmarkBase
     /// </summary>
     protected const int Seed = 42;
 
+    /// <summary>
+    /// Directory of shared .npy operands written by numpy_benchmark.py --operand-cache
+    /// (environment variable NUMSHARP_OPERAND_CACHE). When a matching file exists, the random
+    /// and positive arrays are loaded from it so NumSharp and NumPy time bit-identical inputs.
+    /// </summary>
+    protected static readonly string? OperandCacheDir =
+        Environment.GetEnvironmentVariable("NUMSHARP_OPERAND_CACHE");
+
+    /// <summary>
+    /// Load a cached operand ("random-float64-1000-s42.npy"), or null when the cache is off,
+    /// the file does not exist, or the dtype has no NumPy equivalent (Char, Decimal).
+    /// </summary>
+    protected static NDArray? TryLoadOperand(string recipe, int n, NPTypeCode dtype, int seed)
+    {
+        if (string.IsNullOrEmpty(OperandCacheDir))
+            return null;
+
+        var name = dtype switch
+        {
+            NPTypeCode.Boolean => "bool",
+            NPTypeCode.Byte => "uint8",
+            NPTypeCode.SByte => "int8",
+            NPTypeCode.Int16 => "int16",
+            NPTypeCode.UInt16 => "uint16",
+            NPTypeCode.Int32 => "int32",
+            NPTypeCode.UInt32 => "uint32",
+            NPTypeCode.Int64 => "int64",
+            NPTypeCode.UInt64 => "uint64",
+            NPTypeCode.Half => "float16",
+            NPTypeCode.Single => "float32",
+            NPTypeCode.Double => "float64",
+            NPTypeCode.Complex => "complex128",
+            _ => null
+        };
+        if (name == null)
+            return null;
+
+        var path = Path.Combine(OperandCacheDir, $"{recipe}-{name}-{n}-s{seed}.npy");
+        return File.Exists(path) ? np.load_npy(path) : null;
+    }
+
     /// <summary>
     /// Create a random array of the specified type and size.
     /// </summary>
     protected static NDArray CreateRandomArray(int n, NPTypeCode dtype, int seed = Seed)
     {
+        if (TryLoadOperand("random", n, dtype, seed) is { } cached)
+            return cached;
+
         np.random.seed(seed);
 
         return dtype switch
@@ -78,6 +122,9 @@ public abstract class BenchmarkBase
     /// </summary>
     protected static NDArray CreatePositiveArray(int n, NPTypeCode dtype, int seed = Seed)
     {
+        if (TryLoadOperand("positive", n, dtype, seed) is { } cached)
+            return cached;
+
         np.random.seed(seed);
 
         return dtype switch
@@ -117,6 +117,19 @@ public class OfficialBenchmarkConfig : ManualConfig
         AddColumn(RankColumn.Arabic);
 
         WithSummaryStyle(SummaryStyle.Default.WithMaxParameterColumnWidth(40));
+
+        // NUMSHARP_BENCH_SIZES=1000,100000 (run_benchmark.py --sizes) keeps only the cases whose
+        // N parameter is listed. The sizes are [Params] constants, so this is the one place a
+        // run can narrow them; classes without an N parameter always run.
+        var sizes = Environment.GetEnvironmentVariable("NUMSHARP_BENCH_SIZES");
+        if (!string.IsNullOrWhiteSpace(sizes))
+        {
+            var keep = sizes.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries)
+                .Select(int.Parse)
+                .ToHashSet();
+            AddFilter(new SimpleFilter(b =>
+                b.Parameters.Items.FirstOrDefault(p => p.Name == "N")?.Value is not int n || keep.Contains(n)));
+        }
     }
 }
 
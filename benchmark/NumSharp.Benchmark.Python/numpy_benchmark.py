@@ -9,10 +9,16 @@ These provide the baseline for comparing NumSharp performance against NumPy.
 Usage:
     python numpy_benchmark.py                    # Run all benchmarks
     python numpy_benchmark.py --suite dispatch   # Run specific suite
-    python numpy_benchmark.py --quick            # Quick run (fewer reps)
+    python numpy_benchmark.py --quick            # Quick run (looser CI, smaller budget)
+    python numpy_benchmark.py --fixed --iterations 50   # legacy fixed-count timing
     python numpy_benchmark.py --json             # Output JSON for parsing
     python numpy_benchmark.py --type int32       # Run specific type
     python numpy_benchmark.py --size 10000000   # Specific array size
+    python numpy_benchmark.py --cache-sizes --isolate --workers 8   # fresh pinned process per cell
+    python numpy_benchmark.py --sizes 1000,100000   # an explicit size list
+    python numpy_benchmark.py --suite linalg --blas-threads 1,all   # BLAS thread sweep (threadpoolctl)
+    python numpy_benchmark.py --cache-sizes --cache-mode both   # warm and cold-cache rows
+    python numpy_benchmark.py --output run.jsonl --resume   # crash-safe stream, skip rows already in it
 
 Requirements:
     pip install numpy tabulate
@@ -21,12 +27,30 @@ Requirements:
 import numpy as np
 import time
 import argparse
+import base64
+import itertools
 import json
+import math
+import os
 import sys
+import tracemalloc
+import zlib
+from array import array
 from dataclasses import dataclass, asdict
-from typing import Callable, List, Optional, Dict, Any
+from collections import OrderedDict
+from typing import Callable, List, Optional, Dict, Any, Tuple
 import statistics
 
+try:
+    import resource     # POSIX only; peak RSS is reported as 0 elsewhere
+except ImportError:
+    resource = None
+
+try:
+    from threadpoolctl import threadpool_info, threadpool_limits   # BLAS thread sweep
+except ImportError:
+    threadpool_info = threadpool_limits = None
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -82,26 +106,271 @@ class BenchmarkResult:
     stddev_ms: float
     min_ms: float
     max_ms: float
-    iterations: int
+    iterations: int             # timed samples actually used
     ops_per_sec: float
-    allocated_mb: float = 0.0
+    allocated_mb: float = 0.0   # peak traced bytes during one call (NumPy buffers included)
+    rss_peak_mb: float = 0.0    # process peak RSS after this row's cell ran
+    rss_delta_mb: float = 0.0   # growth of the peak RSS while the cell ran
+    median_ms: float = 0.0
+    ci_low_ms: float = 0.0      # 95% CI on the median (per call)
+    ci_high_ms: float = 0.0
+    inner_loops: int = 1        # calls per timed sample
+    bytes_moved: Optional[int] = None   # compulsory read+write bytes per call (TRAFFIC model)
+    gbps: Optional[float] = None
+    pct_peak: Optional[float] = None    # gbps as % of the run's STREAM peak
+    peak_gbps: Optional[float] = None
+    threads: Optional[int] = None       # BLAS thread count the op was pinned to (BLAS ops only)
+    cache: str = "warm"                 # "cold": caches evicted before every sample
+    p50_ms: float = 0.0                 # per-call latency percentiles over the timed samples
+    p90_ms: float = 0.0
+    p99_ms: float = 0.0
+    p999_ms: float = 0.0
+    histogram: Optional[List[list]] = None  # [[bucket lower bound ns, count], ...] (log-linear)
+    samples_ns: Optional[str] = None    # base64 float32 per-call ns of every sample (--keep-samples)
+
+
+@dataclass
+class TimingPolicy:
+    """How benchmark() decides how much to time an op.
+
+    Adaptive (default): calibrate the inner-loop repeat count until one sample takes at least
+    target_sample_ms (so 1K-element ops are not timed at timer resolution), then keep sampling
+    until the 95% CI on the median is within ci_rel_width of it, or the per-op time budget
+    runs out. adaptive=False is the legacy fixed warmup/iterations loop."""
+    adaptive: bool = True
+    target_sample_ms: float = 2.0
+    ci_rel_width: float = 0.02      # (ci_high - ci_low) / median
+    min_samples: int = 10
+    max_samples: int = 1000
+    budget_s: float = 2.0           # per timed op (one op x dtype x N)
+    keep_samples: bool = True       # store the raw samples in BenchmarkResult.samples_ns
+
+
+# Module-level so the many benchmark(..., iterations=iterations) call sites need no threading;
+# isolated workers receive it explicitly (spawned interpreters don't inherit globals).
+TIMING = TimingPolicy()
+
+
+def configure_timing(policy: TimingPolicy):
+    global TIMING
+    TIMING = policy
+
+
+def median_ci(sorted_times: List[float], z: float = 1.96) -> tuple:
+    """Distribution-free CI on the median from order statistics (normal approx. to the
+    binomial). Needs no assumption about the timing distribution, which is right-skewed."""
+    k = len(sorted_times)
+    half = z * math.sqrt(k) / 2
+    lo = max(int(math.floor(k / 2 - half)), 1)
+    hi = min(int(math.ceil(1 + k / 2 + half)), k)
+    return sorted_times[lo - 1], sorted_times[hi - 1]
+
+
+def percentile(sorted_times: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100) of an ascending list."""
+    k = max(int(math.ceil(q / 100 * len(sorted_times))), 1)
+    return sorted_times[k - 1]
+
+
+HISTOGRAM_SUB_BUCKETS = 16      # linear steps per power of two: <= 6.25% bucket width
 
-def benchmark(func: Callable, n: int, warmup: int = 10, iterations: int = 50) -> BenchmarkResult:
-    """Run a benchmark with proper warmup and statistical analysis."""
-    # Warmup
+
+def hdr_histogram(ns: List[float]) -> List[list]:
+    """HDR-style log-linear histogram: each power-of-two range [2^e, 2^(e+1)) is split into
+    HISTOGRAM_SUB_BUCKETS equal buckets, so the bucket width is a fixed share of the value
+    from a 100 ns call up to a 100 ms one. Returns only the non-empty buckets."""
+    counts: Dict[float, int] = {}
+    for v in ns:
+        if v < 1:
+            lower = 0.0
+        else:
+            base = 2.0 ** math.floor(math.log2(v))
+            lower = base + math.floor((v - base) / base * HISTOGRAM_SUB_BUCKETS) * base / HISTOGRAM_SUB_BUCKETS
+        counts[lower] = counts.get(lower, 0) + 1
+    return [[round(lower, 1), c] for lower, c in sorted(counts.items())]
+
+
+def encode_samples(times_ms: List[float]) -> str:
+    """Samples as base64 of little-endian float32 ns: ~5.3 bytes of JSON per sample."""
+    a = array("f", (t * 1e6 for t in times_ms))
+    if sys.byteorder != "little":
+        a.byteswap()
+    return base64.b64encode(a.tobytes()).decode("ascii")
+
+
+def decode_samples(text: str) -> List[float]:
+    """Inverse of encode_samples: per-call ns of each sample."""
+    a = array("f")
+    a.frombytes(base64.b64decode(text))
+    if sys.byteorder != "little":
+        a.byteswap()
+    return a.tolist()
+
+
+def _time_loop(func: Callable, loops: int) -> float:
+    """Wall time of `loops` back-to-back calls, in ms per call."""
+    it = itertools.repeat(None, loops)
+    start = time.perf_counter()
+    for _ in it:
+        func()
+    return (time.perf_counter() - start) * 1000 / loops
+
+
+def _sample_adaptive(func: Callable, warmup: int, policy: TimingPolicy) -> tuple:
+    """Return (per-call sample times in ms, inner loop count) under an adaptive policy."""
+    deadline = time.perf_counter() + policy.budget_s
+    warm_until = time.perf_counter() + policy.budget_s * 0.1
     for _ in range(warmup):
         func()
+        if time.perf_counter() > warm_until:
+            break
+
+    # Calibrate: grow the inner loop until one sample reaches the target duration.
+    loops = 1
+    while True:
+        per_call = _time_loop(func, loops)
+        if per_call * loops >= policy.target_sample_ms or time.perf_counter() > deadline:
+            break
+        grow = policy.target_sample_ms / max(per_call * loops, 1e-6) * 1.2
+        loops = int(loops * min(max(grow, 2.0), 100.0))
 
-    # Timed runs
     times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        func()
-        elapsed = (time.perf_counter() - start) * 1000  # ms
-        times.append(elapsed)
+    while len(times) < policy.max_samples:
+        times.append(_time_loop(func, loops))
+        k = len(times)
+        if k >= policy.min_samples:
+            lo, hi = median_ci(sorted(times))
+            med = statistics.median(times)
+            if med > 0 and (hi - lo) / med <= policy.ci_rel_width:
+                break
+        # Out of budget: keep what we have, but never report fewer than 3 samples.
+        if time.perf_counter() > deadline and k >= 3:
+            break
+    return times, loops
+
+
+# Cold-cache timing. Warm samples call an op back to back on the same operands, so at 1K/100K
+# the inputs and outputs sit in L1/L2 for the whole run. A cold sample first streams through
+# a scratch buffer of twice the last-level cache (read + write, so dirty lines from the
+# previous call are evicted too) and then times ONE call, which finds its operands in DRAM.
+LLC_FALLBACK_BYTES = 32 * 1024 ** 2
+_flush_buf: Optional[np.ndarray] = None
+
+
+def llc_bytes() -> int:
+    """Size of the largest cache of cpu0 (sysfs), or LLC_FALLBACK_BYTES when unavailable."""
+    best = 0
+    base = "/sys/devices/system/cpu/cpu0/cache"
+    try:
+        entries = os.listdir(base)
+    except OSError:
+        return LLC_FALLBACK_BYTES
+    for entry in entries:
+        if not entry.startswith("index"):
+            continue
+        try:
+            with open(f"{base}/{entry}/size") as f:
+                text = f.read().strip()
+        except OSError:
+            continue
+        scale = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}.get(text[-1:].upper(), 1)
+        best = max(best, int(text.rstrip("KMGkmg")) * scale)
+    return best or LLC_FALLBACK_BYTES
+
+
+def evict_caches():
+    """Touch 2x LLC of scratch memory so no earlier operand or output stays cached."""
+    global _flush_buf
+    if _flush_buf is None:
+        _flush_buf = np.zeros(2 * llc_bytes() // 8)
+    np.add(_flush_buf, 1.0, out=_flush_buf)
+
+
+def _time_cold(func: Callable) -> float:
+    evict_caches()
+    return _time_loop(func, 1)
+
+
+def _sample_cold(func: Callable, warmup: int, policy: TimingPolicy) -> tuple:
+    """Like _sample_adaptive, but every sample is one call after evict_caches(). The inner
+    loop cannot be grown (a second call would find the operands cached), so small-N samples
+    sit close to timer resolution; the CI rule still decides when there are enough."""
+    for _ in range(max(1, warmup)):     # first-call effects (lazy allocation, page faults,
+        func()                          # allocator growth) are not a cache effect
+    deadline = time.perf_counter() + policy.budget_s
+    times = []
+    while len(times) < policy.max_samples:
+        times.append(_time_cold(func))
+        k = len(times)
+        if k >= policy.min_samples:
+            lo, hi = median_ci(sorted(times))
+            med = statistics.median(times)
+            if med > 0 and (hi - lo) / med <= policy.ci_rel_width:
+                break
+        if time.perf_counter() > deadline and k >= 3:
+            break
+    return times, 1
+
+
+def measure_allocation(func: Callable) -> float:
+    """Peak bytes allocated by one untimed call, in MB.
+
+    NumPy reports every data buffer to tracemalloc under its own domain
+    (np.lib.tracemalloc_domain), so the traced peak covers array buffers and temporaries, not
+    just Python objects. The call's result is kept alive until the peak is read. This is the
+    high-water mark of live allocations (what a call needs), which for most ops equals the
+    total allocated per call; ops that free temporaries mid-call read lower than a cumulative
+    counter would."""
+    already = tracemalloc.is_tracing()
+    if not already:
+        tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        if not already:
+            tracemalloc.stop()
+    return max(peak - base, 0) / (1024 * 1024)
+
+
+def peak_rss_mb() -> float:
+    """Process peak resident set size so far, in MB (0.0 where getrusage is unavailable)."""
+    if resource is None:
+        return 0.0
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024   # bytes vs KiB
+
+
+def benchmark(func: Callable, n: int, warmup: int = 10, iterations: int = 50,
+              cold: bool = False) -> BenchmarkResult:
+    """Run a benchmark with proper warmup and statistical analysis.
+
+    Under the default adaptive TIMING policy `iterations` is ignored (the sample count is
+    decided by the CI stopping rule); with adaptive=False it is the fixed timed-run count.
+    cold=True evicts the caches before every (single-call) sample."""
+    if cold and TIMING.adaptive:
+        times, loops = _sample_cold(func, warmup, TIMING)
+    elif cold:
+        for _ in range(max(1, warmup)):
+            func()
+        times = [_time_cold(func) for _ in range(iterations)]
+        loops = 1
+    elif TIMING.adaptive:
+        times, loops = _sample_adaptive(func, warmup, TIMING)
+    else:
+        for _ in range(warmup):
+            func()
+        times = [_time_loop(func, 1) for _ in range(iterations)]
+        loops = 1
 
     mean = statistics.mean(times)
     stddev = statistics.stdev(times) if len(times) > 1 else 0
+    ordered = sorted(times)
+    ci_low, ci_high = median_ci(ordered)
+    allocated = measure_allocation(func)     # after timing: tracing slows allocation
 
     return BenchmarkResult(
         name=func.__name__ if hasattr(func, '__name__') else str(func),
@@ -113,8 +382,19 @@ def benchmark(func: Callable, n: int, warmup: int = 10, iterations: int = 50) ->
         stddev_ms=stddev,
         min_ms=min(times),
         max_ms=max(times),
-        iterations=iterations,
-        ops_per_sec=1000.0 / mean if mean > 0 else 0
+        iterations=len(times),
+        ops_per_sec=1000.0 / mean if mean > 0 else 0,
+        allocated_mb=allocated,
+        median_ms=statistics.median(times),
+        ci_low_ms=ci_low,
+        ci_high_ms=ci_high,
+        inner_loops=loops,
+        p50_ms=percentile(ordered, 50),
+        p90_ms=percentile(ordered, 90),
+        p99_ms=percentile(ordered, 99),
+        p999_ms=percentile(ordered, 99.9),
+        histogram=hdr_histogram([t * 1e6 for t in times]),
+        samples_ns=encode_samples(times) if TIMING.keep_samples else None,
     )
 
 def create_random_array(n: int, dtype_name: str, seed: int = 42) -> np.ndarray:
@@ -139,787 +419,791 @@ def create_positive_array(n: int, dtype_name: str, seed: int = 42) -> np.ndarray
     return (np.random.random(n) * 100 + 1).astype(dtype)
 
 # =============================================================================
-# Arithmetic Benchmarks
+# Operand recipes
 # =============================================================================
+#
+# Every operand an op needs is described by a hashable recipe tuple instead of being built
+# inline, so one (recipe, dtype, N) array is generated once and shared by every op and suite
+# that asks for it (the same 10M-element random array used to be regenerated for each suite).
+# Recipes may nest: SLICE/GT/MEAN take another recipe as their base.
+#
+# SEQ reproduces suites that drew several operands in a row after one np.random.seed: each
+# operand is the i-th draw of that stream, so the values match the original per-suite setup
+# (and the C# Setup methods, which still draw sequentially) instead of reseeding per operand.
+
+# Named shapes (functions of the cell N). "grid" is the near-square 2D layout the axis
+# reductions and manipulation ops use; "mat" caps matmul operands at 384x384.
+SHAPES = {
+    "n": lambda n: (n,),
+    "side": lambda n: (math.isqrt(n),),
+    "col": lambda n: (math.isqrt(n), 1),
+    "square": lambda n: (math.isqrt(n), math.isqrt(n)),
+    "grid": lambda n: (math.isqrt(n), n // math.isqrt(n)),
+    "grid_flat": lambda n: (math.isqrt(n) * (n // math.isqrt(n)),),
+    "mat": lambda n: (min(math.isqrt(n), 384),) * 2,
+    "cube": lambda n: (int(n ** (1 / 3)),) * 3,
+}
 
-def run_arithmetic_benchmarks(n: int, dtype_name: str, iterations: int) -> List[BenchmarkResult]:
-    """Benchmark arithmetic operations for a specific dtype.
 
-    Matches C# benchmark classes:
-    - AddBenchmarks: Add_Elementwise, NpAdd, Add_Scalar, Add_ScalarLiteral
-    - SubtractBenchmarks: Subtract_Elementwise, Subtract_Scalar, Subtract_ScalarLeft
-    - MultiplyBenchmarks: Multiply_Elementwise, Multiply_Square, Multiply_Scalar, Multiply_ScalarLiteral
-    - DivideBenchmarks: Divide_Elementwise, Divide_Scalar, Divide_ScalarLeft (CommonTypes only)
-    - ModuloBenchmarks: Modulo_Elementwise, Modulo_Scalar (CommonTypes only)
-    """
-    results = []
-    dtype = DTYPES[dtype_name]
+def RANDOM(seed, shape="n"):          return ("random", seed, shape)
+def POSITIVE(seed):                   return ("positive", seed)
+def SCALAR(value):                    return ("scalar", value)
+def ARRAY0(value):                    return ("array0", value)
+def U(lo, hi, seed, shape="n", cast=False): return ("uniform", lo, hi, seed, shape, cast)
+def UNIT(seed, shape="n"):            return ("unit", seed, shape)
+def ARANGE():                         return ("arange",)
+def EMPTY():                          return ("empty",)
+def SLICE(base, start, stop, step):   return ("slice", base, start, stop, step)
+def GT(base, threshold):              return ("gt", base, threshold)
+def MEAN(base):                       return ("mean", base)
 
-    np.random.seed(42)
-    a = create_random_array(n, dtype_name, seed=42)
-    b = create_random_array(n, dtype_name, seed=43)
-    b_positive = create_positive_array(n, dtype_name, seed=43)  # Avoid div by zero
-    scalar = dtype(5)
-    scalar2 = dtype(2)
-
-    # ========================================================================
-    # Add (matches AddBenchmarks.cs - ArithmeticTypes = 10 types)
-    # ========================================================================
-
-    # Add_Elementwise: a + b (element-wise)
-    def add_elementwise(): return a + b
-    r = benchmark(add_elementwise, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"a + b (element-wise) ({dtype_name})", "Add", "Arithmetic", dtype_name
-    results.append(r)
-
-    # NpAdd: np.add(a, b)
-    def np_add(): return np.add(a, b)
-    r = benchmark(np_add, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.add(a, b) ({dtype_name})", "Add", "Arithmetic", dtype_name
-    results.append(r)
-
-    # Add_Scalar: a + scalar
-    def add_scalar(): return a + scalar
-    r = benchmark(add_scalar, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"a + scalar ({dtype_name})", "Add", "Arithmetic", dtype_name
-    results.append(r)
-
-    # Add_ScalarLiteral: a + 5 (literal)
-    def add_scalar_literal(): return a + 5
-    r = benchmark(add_scalar_literal, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"a + 5 (literal) ({dtype_name})", "Add", "Arithmetic", dtype_name
-    results.append(r)
-
-    # ========================================================================
-    # Subtract (matches SubtractBenchmarks.cs - ArithmeticTypes = 10 types)
-    # ========================================================================
-
-    # Subtract_Elementwise: a - b (element-wise)
-    def sub_elementwise(): return a - b
-    r = benchmark(sub_elementwise, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"a - b (element-wise) ({dtype_name})", "Subtract", "Arithmetic", dtype_name
-    results.append(r)
-
-    # Subtract_Scalar: a - scalar
-    def sub_scalar(): return a - scalar
-    r = benchmark(sub_scalar, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"a - scalar ({dtype_name})", "Subtract", "Arithmetic", dtype_name
-    results.append(r)
-
-    # Subtract_ScalarLeft: scalar - a
-    def sub_scalar_left(): return scalar - a
-    r = benchmark(sub_scalar_left, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"scalar - a ({dtype_name})", "Subtract", "Arithmetic", dtype_name
-    results.append(r)
-
-    # ========================================================================
-    # Multiply (matches MultiplyBenchmarks.cs - ArithmeticTypes = 10 types)
-    # ========================================================================
-
-    # Multiply_Elementwise: a * b (element-wise)
-    def mul_elementwise(): return a * b
-    r = benchmark(mul_elementwise, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"a * b (element-wise) ({dtype_name})", "Multiply", "Arithmetic", dtype_name
-    results.append(r)
-
-    # Multiply_Square: a * a (square)
-    def mul_square(): return a * a
-    r = benchmark(mul_square, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"a * a (square) ({dtype_name})", "Multiply", "Arithmetic", dtype_name
-    results.append(r)
-
-    # Multiply_Scalar: a * scalar
-    def mul_scalar(): return a * scalar2
-    r = benchmark(mul_scalar, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"a * scalar ({dtype_name})", "Multiply", "Arithmetic", dtype_name
-    results.append(r)
-
-    # Multiply_ScalarLiteral: a * 2 (literal)
-    def mul_scalar_literal(): return a * 2
-    r = benchmark(mul_scalar_literal, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"a * 2 (literal) ({dtype_name})", "Multiply", "Arithmetic", dtype_name
-    results.append(r)
-
-    # ========================================================================
-    # Divide (matches DivideBenchmarks.cs - CommonTypes = 4 types)
-    # ========================================================================
-    if dtype_name in COMMON_DTYPES:
-        # Divide_Elementwise: a / b (element-wise)
-        def div_elementwise(): return a / b_positive
-        r = benchmark(div_elementwise, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"a / b (element-wise) ({dtype_name})", "Divide", "Arithmetic", dtype_name
-        results.append(r)
-
-        # Divide_Scalar: a / scalar
-        def div_scalar(): return a / scalar2
-        r = benchmark(div_scalar, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"a / scalar ({dtype_name})", "Divide", "Arithmetic", dtype_name
-        results.append(r)
-
-        # Divide_ScalarLeft: scalar / a
-        def div_scalar_left(): return scalar2 / b_positive
-        r = benchmark(div_scalar_left, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"scalar / a ({dtype_name})", "Divide", "Arithmetic", dtype_name
-        results.append(r)
-
-    # ========================================================================
-    # Modulo (matches ModuloBenchmarks.cs - CommonTypes = 4 types)
-    # ========================================================================
-    if dtype_name in COMMON_DTYPES:
-        # Modulo_Elementwise: a % b (element-wise)
-        def mod_elementwise(): return a % b_positive
-        r = benchmark(mod_elementwise, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"a % b (element-wise) ({dtype_name})", "Modulo", "Arithmetic", dtype_name
-        results.append(r)
-
-        # Modulo_Scalar: a % 7 (literal)
-        def mod_scalar(): return a % 7
-        r = benchmark(mod_scalar, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"a % 7 (literal) ({dtype_name})", "Modulo", "Arithmetic", dtype_name
-        results.append(r)
 
-    return results
+# Draws for SEQ: R is (random(shape) * (hi - lo) + lo) * unit, RI is randint(lo, hi, n).
+def R(lo=0, hi=1, shape="n", unit=1, cast=False): return ("random", lo, hi, shape, unit, cast)
+def RI(lo, hi):                       return ("randint", lo, hi)
 
-# =============================================================================
-# Unary Benchmarks
-# =============================================================================
 
-def run_unary_benchmarks(n: int, dtype_name: str, iterations: int) -> List[BenchmarkResult]:
-    """Benchmark unary operations for a specific dtype."""
-    results = []
+def SEQ(seed, *draws):
+    """One recipe per draw of a single np.random.seed(seed) stream, in draw order."""
+    return tuple(("seq", seed, draws[:i + 1]) for i in range(len(draws)))
 
-    a = create_random_array(n, dtype_name, seed=42)
-    a_positive = create_positive_array(n, dtype_name, seed=42)
-    a_small = (np.random.random(n) * 10).astype(DTYPES[dtype_name])  # For exp
-
-    # Math functions
-    def np_sqrt(): return np.sqrt(a_positive)
-    r = benchmark(np_sqrt, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.sqrt ({dtype_name})", "Math", "Unary", dtype_name
-    results.append(r)
-
-    def np_abs(): return np.abs(a)
-    r = benchmark(np_abs, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.abs ({dtype_name})", "Math", "Unary", dtype_name
-    results.append(r)
-
-    def np_sign(): return np.sign(a)
-    r = benchmark(np_sign, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.sign ({dtype_name})", "Math", "Unary", dtype_name
-    results.append(r)
-
-    # Rounding (float only)
-    if np.issubdtype(DTYPES[dtype_name], np.floating):
-        def np_floor(): return np.floor(a)
-        r = benchmark(np_floor, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.floor ({dtype_name})", "Rounding", "Unary", dtype_name
-        results.append(r)
-
-        def np_ceil(): return np.ceil(a)
-        r = benchmark(np_ceil, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.ceil ({dtype_name})", "Rounding", "Unary", dtype_name
-        results.append(r)
-
-        def np_round(): return np.round(a)
-        r = benchmark(np_round, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.round ({dtype_name})", "Rounding", "Unary", dtype_name
-        results.append(r)
-
-    # Exp/Log (float only)
-    if np.issubdtype(DTYPES[dtype_name], np.floating):
-        def np_exp(): return np.exp(a_small)
-        r = benchmark(np_exp, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.exp ({dtype_name})", "ExpLog", "Unary", dtype_name
-        results.append(r)
-
-        def np_log(): return np.log(a_positive)
-        r = benchmark(np_log, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.log ({dtype_name})", "ExpLog", "Unary", dtype_name
-        results.append(r)
-
-        def np_log10(): return np.log10(a_positive)
-        r = benchmark(np_log10, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.log10 ({dtype_name})", "ExpLog", "Unary", dtype_name
-        results.append(r)
-
-    # Trig (float only)
-    if np.issubdtype(DTYPES[dtype_name], np.floating):
-        angles = (np.random.random(n) * 4 - 2) * np.pi
-
-        def np_sin(): return np.sin(angles)
-        r = benchmark(np_sin, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.sin ({dtype_name})", "Trig", "Unary", dtype_name
-        results.append(r)
-
-        def np_cos(): return np.cos(angles)
-        r = benchmark(np_cos, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.cos ({dtype_name})", "Trig", "Unary", dtype_name
-        results.append(r)
-
-        def np_tan(): return np.tan(angles)
-        r = benchmark(np_tan, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.tan ({dtype_name})", "Trig", "Unary", dtype_name
-        results.append(r)
-
-    # Extra exp/log (mirror C# ExpLogBenchmarks: exp2, expm1, log2, log1p) — float only.
-    if np.issubdtype(DTYPES[dtype_name], np.floating):
-        def np_exp2(): return np.exp2(a_small)
-        r = benchmark(np_exp2, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.exp2 ({dtype_name})", "ExpLog", "Unary", dtype_name
-        results.append(r)
-
-        def np_expm1(): return np.expm1(a_small)
-        r = benchmark(np_expm1, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.expm1 ({dtype_name})", "ExpLog", "Unary", dtype_name
-        results.append(r)
-
-        def np_log2(): return np.log2(a_positive)
-        r = benchmark(np_log2, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.log2 ({dtype_name})", "ExpLog", "Unary", dtype_name
-        results.append(r)
-
-        def np_log1p(): return np.log1p(a_positive)
-        r = benchmark(np_log1p, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.log1p ({dtype_name})", "ExpLog", "Unary", dtype_name
-        results.append(r)
-
-    # Clip (mirror C# MathBenchmarks) + scalar Power (mirror C# PowerBenchmarks) — float only.
-    if np.issubdtype(DTYPES[dtype_name], np.floating):
-        def np_clip(): return np.clip(a, -10.0, 10.0)
-        r = benchmark(np_clip, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.clip(a, -10, 10) ({dtype_name})", "Math", "Unary", dtype_name
-        results.append(r)
-
-        def np_power2(): return np.power(a, 2)
-        r = benchmark(np_power2, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.power(a, 2) ({dtype_name})", "Power", "Unary", dtype_name
-        results.append(r)
-
-        def np_power3(): return np.power(a, 3)
-        r = benchmark(np_power3, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.power(a, 3) ({dtype_name})", "Power", "Unary", dtype_name
-        results.append(r)
-
-        def np_power_half(): return np.power(a_positive, 0.5)
-        r = benchmark(np_power_half, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.power(a, 0.5) ({dtype_name})", "Power", "Unary", dtype_name
-        results.append(r)
 
-    return results
+def _draw(draw: tuple, n: int, dtype_name: str) -> Any:
+    kind, *args = draw
+    if kind == "randint":
+        lo, hi = args
+        return np.random.randint(lo, hi, n, dtype=DTYPES[dtype_name])
+    lo, hi, shape, unit, cast = args
+    arr = (np.random.random(SHAPES[shape](n)) * (hi - lo) + lo) * unit
+    return arr.astype(DTYPES[dtype_name]) if cast else arr
 
-# =============================================================================
-# Reduction Benchmarks
-# =============================================================================
 
-def run_reduction_benchmarks(n: int, dtype_name: str, iterations: int) -> List[BenchmarkResult]:
-    """Benchmark reduction operations."""
-    results = []
+def _build(spec: tuple, n: int, dtype_name: str) -> Any:
+    kind, *args = spec
+    dtype = DTYPES[dtype_name]
+    if kind == "random":
+        seed, shape = args
+        shp = SHAPES[shape](n)
+        return create_random_array(math.prod(shp), dtype_name, seed=seed).reshape(shp)
+    if kind == "positive":
+        return create_positive_array(n, dtype_name, seed=args[0])
+    if kind == "scalar":
+        return dtype(args[0])
+    if kind == "array0":
+        return np.array(args[0])
+    if kind == "uniform":       # float64 in [lo, hi); cast=True converts to the cell dtype
+        lo, hi, seed, shape, cast = args
+        np.random.seed(seed)
+        arr = np.random.random(SHAPES[shape](n)) * (hi - lo) + lo
+        return arr.astype(dtype) if cast else arr
+    if kind == "unit":          # values in [0.5, 1.0): keeps products finite at every N
+        seed, shape = args
+        np.random.seed(seed)
+        shp = SHAPES[shape](n)
+        return (np.random.rand(math.prod(shp)) * 0.5 + 0.5).astype(dtype).reshape(shp)
+    if kind == "seq":           # replay the stream up to this draw
+        seed, draws = args
+        np.random.seed(seed)
+        for draw in draws[:-1]:
+            _draw(draw, n, dtype_name)
+        return _draw(draws[-1], n, dtype_name)
+    if kind == "arange":
+        return np.arange(n, dtype=dtype)
+    if kind == "empty":
+        return np.empty(n, dtype=dtype)
+    if kind == "slice":
+        base, start, stop, step = args
+        return operand(base, n, dtype_name)[start:stop:step]
+    if kind == "gt":
+        base, threshold = args
+        return operand(base, n, dtype_name) > threshold
+    if kind == "mean":
+        return np.mean(operand(args[0], n, dtype_name))
+    raise ValueError(f"unknown operand recipe: {kind}")
+
+
+# --operand-cache DIR persists generated operands as .npy files named after their full key,
+# e.g. random-float64-10000000-s42.npy, and maps them back read-only. Reruns skip generation
+# and the C# harness loads the same random/positive files (BenchmarkBase.TryLoadOperand), so
+# both sides of the merge time bit-identical data. Passed to spawned workers and to dotnet
+# through the environment.
+OPERAND_CACHE_ENV = "NUMSHARP_OPERAND_CACHE"
+PERSISTED_RECIPES = ("random", "positive", "uniform", "unit", "seq")
+
+
+def operand_file_name(spec: tuple, n: int, dtype_name: str) -> Optional[str]:
+    """Content-addressed .npy name for a generated operand, or None if it is not persisted
+    (scalars, cheap derived views/masks, and writable out buffers are always built)."""
+    kind, *args = spec
+    if kind not in PERSISTED_RECIPES:
+        return None
+    shape = "n"
+    if kind in ("random", "unit"):
+        seed, shape = args
+        stem = f"{kind}-{dtype_name}-{n}-s{seed}"
+    elif kind == "positive":
+        stem = f"positive-{dtype_name}-{n}-s{args[0]}"
+    elif kind == "seq":     # draw index plus a digest of the draws that led up to it
+        seed, draws = args
+        cast = draws[-1][0] == "randint" or draws[-1][-1]
+        digest = zlib.crc32(repr(draws).encode())
+        stem = f"seq-{dtype_name if cast else 'float64'}-{n}-s{seed}-d{len(draws) - 1}-{digest:08x}"
+    else:   # uniform: float64 unless cast to the cell dtype
+        lo, hi, seed, shape, cast = args
+        stem = f"uniform-{dtype_name if cast else 'float64'}-{n}-{lo:g}_{hi:g}-s{seed}"
+    return stem + ("" if shape == "n" else f"-{shape}") + ".npy"
+
+
+def _load_or_build(spec: tuple, n: int, dtype_name: str) -> Any:
+    cache_dir = os.environ.get(OPERAND_CACHE_ENV)
+    fname = operand_file_name(spec, n, dtype_name) if cache_dir else None
+    if fname is None:
+        return _build(spec, n, dtype_name)
+    path = os.path.join(cache_dir, fname)
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"          # parallel --isolate workers may race
+        with open(tmp, "wb") as f:
+            np.save(f, _build(spec, n, dtype_name))
+        os.replace(tmp, path)
+    # asarray drops the np.memmap subclass so op results are plain ndarrays.
+    return np.asarray(np.load(path, mmap_mode="r"))
+
+
+# (recipe, dtype, N) -> array, least recently used first. Bounded in bytes so a full sweep does
+# not keep every 10M-element operand of every dtype alive at once.
+OPERAND_CACHE_BYTES = 2 * 1024 ** 3
+_operands: "OrderedDict[tuple, Any]" = OrderedDict()
+
+
+def operand(spec: tuple, n: int, dtype_name: str) -> Any:
+    """Build (or reuse) the operand described by `spec` for one (dtype, N) cell."""
+    key = (spec, dtype_name, n)
+    if key in _operands:
+        _operands.move_to_end(key)
+        return _operands[key]
+    value = _load_or_build(spec, n, dtype_name)
+    _operands[key] = value
+    total = sum(getattr(v, "nbytes", 0) for v in _operands.values())
+    while total > OPERAND_CACHE_BYTES and len(_operands) > 1:
+        _, old = _operands.popitem(last=False)
+        total -= getattr(old, "nbytes", 0)
+    return value
 
-    a = create_random_array(n, dtype_name, seed=42)
-    rows = int(np.sqrt(n))
-    cols = n // rows
-    a_2d = create_random_array(rows * cols, dtype_name, seed=42).reshape(rows, cols)
-
-    # Sum
-    def np_sum(): return np.sum(a)
-    r = benchmark(np_sum, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.sum ({dtype_name})", "Sum", "Reduction", dtype_name
-    results.append(r)
-
-    def np_sum_axis0(): return np.sum(a_2d, axis=0)
-    r = benchmark(np_sum_axis0, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.sum axis=0 ({dtype_name})", "Sum", "Reduction", dtype_name
-    results.append(r)
-
-    def np_sum_axis1(): return np.sum(a_2d, axis=1)
-    r = benchmark(np_sum_axis1, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.sum axis=1 ({dtype_name})", "Sum", "Reduction", dtype_name
-    results.append(r)
-
-    # Mean
-    def np_mean(): return np.mean(a)
-    r = benchmark(np_mean, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.mean ({dtype_name})", "Mean", "Reduction", dtype_name
-    results.append(r)
-
-    # Var/Std (float only for accuracy)
-    if np.issubdtype(DTYPES[dtype_name], np.floating):
-        def np_var(): return np.var(a)
-        r = benchmark(np_var, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.var ({dtype_name})", "VarStd", "Reduction", dtype_name
-        results.append(r)
-
-        def np_std(): return np.std(a)
-        r = benchmark(np_std, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.std ({dtype_name})", "VarStd", "Reduction", dtype_name
-        results.append(r)
-
-    # Min/Max
-    def np_amin(): return np.amin(a)
-    r = benchmark(np_amin, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.amin ({dtype_name})", "MinMax", "Reduction", dtype_name
-    results.append(r)
-
-    def np_amax(): return np.amax(a)
-    r = benchmark(np_amax, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.amax ({dtype_name})", "MinMax", "Reduction", dtype_name
-    results.append(r)
-
-    # ArgMin/ArgMax
-    def np_argmin(): return np.argmin(a)
-    r = benchmark(np_argmin, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.argmin ({dtype_name})", "ArgMinMax", "Reduction", dtype_name
-    results.append(r)
-
-    def np_argmax(): return np.argmax(a)
-    r = benchmark(np_argmax, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.argmax ({dtype_name})", "ArgMinMax", "Reduction", dtype_name
-    results.append(r)
 
-    # Cumulative sum (mirror C# SumBenchmarks.CumSum) — all arithmetic dtypes.
-    def np_cumsum(): return np.cumsum(a)
-    r = benchmark(np_cumsum, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.cumsum ({dtype_name})", "Sum", "Reduction", dtype_name
-    results.append(r)
+# =============================================================================
+# Op registry
+# =============================================================================
+#
+# One Op per benchmarked expression. Ops are grouped; a group runs at one (dtype, N) and is
+# the unit the isolated scheduler ships to a worker. Op names MUST equal the C#
+# [Benchmark(Description=...)] (the dtype tag is appended unless suffix=False), and each
+# group lists its ops in the order the C# classes / reports expect.
+#
+# traffic = compulsory bytes per call: every full-size input stream read once plus every
+# full-size output stream written once (the STREAM convention — write-allocate and
+# temporaries are not counted, so an op that makes extra passes shows up as a low % of peak).
+# Each stream is an item-size kind:
+#   x  operand dtype            ?  bool (1 byte)
+#   f  true-divide result (float64 for integer operands, else the operand dtype)
+#   a  accumulator (cumsum/cumprod: int64/uint64 for narrower integers, else the operand dtype)
+#   d  float64
+# None = no meaningful compulsory stream: views (reshape/T/flip/slices return without touching
+# data), lazily zeroed calloc pages (zeros/empty), and ops dominated by non-streaming work
+# (sort/partition-based statistics, nonzero with data-dependent output, matmul).
+
+UNARY, BINARY, SCALAR_OP = (("x",), ("x",)), (("x", "x"), ("x",)), (("x",), ("x",))
+REDUCE, REDUCE2 = (("x",), ()), (("x", "x"), ())
+TO_BOOL, BINARY_TO_BOOL = (("x",), ("?",)), (("x", "x"), ("?",))
+DIVIDE, DIVIDE_SCALAR, ACCUMULATE = (("x", "x"), ("f",)), (("x",), ("f",)), (("x",), ("a",))
+COPY2 = (("x", "x"), ("x", "x"))
+
+
+@dataclass(frozen=True)
+class Op:
+    name: str
+    suite: str
+    category: str
+    expr: str                                   # timed expression over the operand names
+    traffic: Optional[tuple] = None
+    dtypes: Optional[Tuple[str, ...]] = None    # further restricts the group's dtype set
+    size: Optional[Callable[[int], int]] = None # timed n when it isn't the cell N
+    blas: bool = False                          # runs in BLAS: timed once per swept thread count
 
-    # Axis min/max + mean (mirror C# MinMaxBenchmarks / MeanBenchmarks axis variants).
-    def np_amin_axis0(): return np.amin(a_2d, axis=0)
-    r = benchmark(np_amin_axis0, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.amin axis=0 ({dtype_name})", "MinMax", "Reduction", dtype_name
-    results.append(r)
-
-    def np_amax_axis0(): return np.amax(a_2d, axis=0)
-    r = benchmark(np_amax_axis0, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.amax axis=0 ({dtype_name})", "MinMax", "Reduction", dtype_name
-    results.append(r)
-
-    def np_mean_axis0(): return np.mean(a_2d, axis=0)
-    r = benchmark(np_mean_axis0, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.mean axis=0 ({dtype_name})", "Mean", "Reduction", dtype_name
-    results.append(r)
-
-    def np_mean_axis1(): return np.mean(a_2d, axis=1)
-    r = benchmark(np_mean_axis1, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.mean axis=1 ({dtype_name})", "Mean", "Reduction", dtype_name
-    results.append(r)
 
-    # Axis var/std (mirror C# VarStdBenchmarks axis variants) — float only.
-    if np.issubdtype(DTYPES[dtype_name], np.floating):
-        def np_var_axis0(): return np.var(a_2d, axis=0)
-        r = benchmark(np_var_axis0, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.var axis=0 ({dtype_name})", "VarStd", "Reduction", dtype_name
-        results.append(r)
+@dataclass(frozen=True)
+class Group:
+    ops: Tuple[Op, ...]
+    operands: Dict[str, tuple]                  # expression name -> recipe
+    tag: Optional[str] = None                   # fixed dtype for dtype-less groups
+    suffix: bool = True                         # append " (dtype)" to op names
 
-        def np_std_axis0(): return np.std(a_2d, axis=0)
-        r = benchmark(np_std_axis0, n, iterations=iterations)
-        r.name, r.category, r.suite, r.dtype = f"np.std axis=0 ({dtype_name})", "VarStd", "Reduction", dtype_name
-        results.append(r)
 
-    return results
+REGISTRY: Dict[str, Group] = {}
 
-# =============================================================================
-# Broadcasting Benchmarks
-# =============================================================================
 
-def run_broadcast_benchmarks(n: int, iterations: int) -> List[BenchmarkResult]:
-    """Benchmark broadcasting operations."""
-    results = []
-    dtype_name = 'float64'
-
-    np.random.seed(42)
-    matrix_size = int(np.sqrt(n))
-    matrix = np.random.random((matrix_size, matrix_size)) * 100
-    row_vector = np.random.random(matrix_size) * 100
-    col_vector = np.random.random((matrix_size, 1)) * 100
-    scalar = np.array(42.0)
-
-    # Scalar broadcast
-    def broadcast_scalar(): return matrix + scalar
-    r = benchmark(broadcast_scalar, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "matrix + scalar", "Scalar", "Broadcasting", dtype_name
-    results.append(r)
-
-    # Row broadcast
-    def broadcast_row(): return matrix + row_vector
-    r = benchmark(broadcast_row, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "matrix + row_vector (N,M)+(M,)", "Row", "Broadcasting", dtype_name
-    results.append(r)
-
-    # Column broadcast
-    def broadcast_col(): return matrix + col_vector
-    r = benchmark(broadcast_col, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "matrix + col_vector (N,M)+(N,1)", "Column", "Broadcasting", dtype_name
-    results.append(r)
-
-    # broadcast_to
-    def broadcast_to_row(): return np.broadcast_to(row_vector, (matrix_size, matrix_size))
-    r = benchmark(broadcast_to_row, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.broadcast_to(row, (N,M))", "BroadcastTo", "Broadcasting", dtype_name
-    results.append(r)
+def op(category, name, expr=None, traffic=None, **kw) -> tuple:
+    return (category, name, expr or name, traffic, kw)
 
-    return results
 
-# =============================================================================
-# Creation Benchmarks
-# =============================================================================
+def define(group: str, suite: str, operands: Dict[str, tuple], ops: List[tuple],
+           tag: Optional[str] = None, suffix: bool = True):
+    entries = []
+    for category, name, expr, traffic, kw in ops:
+        if "dtypes" in kw:
+            kw["dtypes"] = tuple(kw["dtypes"])
+        entries.append(Op(name=name, suite=suite, category=category or suite, expr=expr,
+                          traffic=traffic, **kw))
+    REGISTRY[group] = Group(tuple(entries), operands, tag, suffix)
 
-def run_creation_benchmarks(n: int, dtype_name: str, iterations: int) -> List[BenchmarkResult]:
-    """Benchmark array creation functions."""
-    results = []
-    dtype = DTYPES[dtype_name]
-    source = create_random_array(n, dtype_name)
-
-    # Initialized arrays
-    def np_zeros(): return np.zeros(n, dtype=dtype)
-    r = benchmark(np_zeros, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.zeros ({dtype_name})", "Initialized", "Creation", dtype_name
-    results.append(r)
-
-    def np_ones(): return np.ones(n, dtype=dtype)
-    r = benchmark(np_ones, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.ones ({dtype_name})", "Initialized", "Creation", dtype_name
-    results.append(r)
-
-    def np_full(): return np.full(n, 42, dtype=dtype)
-    r = benchmark(np_full, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.full ({dtype_name})", "Initialized", "Creation", dtype_name
-    results.append(r)
-
-    def np_empty(): return np.empty(n, dtype=dtype)
-    r = benchmark(np_empty, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.empty ({dtype_name})", "Uninitialized", "Creation", dtype_name
-    results.append(r)
-
-    # Copy
-    def np_copy(): return np.copy(source)
-    r = benchmark(np_copy, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.copy ({dtype_name})", "Copy", "Creation", dtype_name
-    results.append(r)
-
-    # Like-based
-    def np_zeros_like(): return np.zeros_like(source)
-    r = benchmark(np_zeros_like, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = f"np.zeros_like ({dtype_name})", "Like", "Creation", dtype_name
-    results.append(r)
 
-    return results
+# dtype sets that mirror the C# TypeParameterSource collections.
+BITWISE_DTYPES = ['bool', 'uint8', 'int8', 'int16', 'uint16', 'int32', 'uint32', 'int64', 'uint64']
+FLOAT_DTYPES = ['float16', 'float32', 'float64']
+
+# --- Dispatch: different ways to perform c = a + b (int32) ---
+DISPATCH_A, DISPATCH_B = SEQ(42, RI(0, 100), RI(0, 100))
+define("dispatch", "Dispatch", {"a": DISPATCH_A, "b": DISPATCH_B, "c": EMPTY(),
+                                "scalar": SCALAR(42)}, [
+    op("Dispatch", "np.add(a, b, out=c)", "np.add(a, b, out=c)", BINARY),
+    op("Dispatch", "c = a + b (allocates)", "a + b", BINARY),
+    op("Dispatch", "np.add(a, scalar, out=c)", "np.add(a, scalar, out=c)", SCALAR_OP),
+], tag="int32", suffix=False)
+
+# --- Fusion: compound expressions NumPy cannot fuse (float64) ---
+FUSION_A, FUSION_B = SEQ(42, R(0, 10), R(0, 10))
+define("fusion", "Fusion", {"a": FUSION_A, "b": FUSION_B, "mean_val": MEAN(FUSION_A)}, [
+    op("Pattern1_Square", "NumPy: a * a", "a * a", UNARY),
+    op("Pattern2_AaBb", "NumPy: a*a + 2*b", "a*a + 2*b", BINARY),
+    op("Pattern3_Variance", "NumPy: sum((a-mean)**2)/N", "np.sum((a - mean_val) ** 2) / n", REDUCE),
+    op("Pattern3_Variance", "NumPy: np.var(a) [optimized]", "np.var(a)", REDUCE),
+    op("Pattern4_Polynomial", "NumPy: a**3 + a**2 + a", "a**3 + a**2 + a", UNARY),
+    op("Pattern4_Polynomial", "NumPy: a*a*a + a*a + a", "a*a*a + a*a + a", UNARY),
+    op("Pattern5_Euclidean", "NumPy: sqrt(a**2 + b**2)", "np.sqrt(a**2 + b**2)", BINARY),
+    op("Pattern5_Euclidean", "NumPy: np.hypot(a, b) [optimized]", "np.hypot(a, b)", BINARY),
+], tag="float64", suffix=False)
+
+# --- Arithmetic: Add/Subtract/Multiply (ArithmeticTypes), Divide/Modulo (CommonTypes) ---
+define("arithmetic", "Arithmetic", {"a": RANDOM(42), "b": RANDOM(43), "b_positive": POSITIVE(43),
+                                    "scalar": SCALAR(5), "scalar2": SCALAR(2)}, [
+    op("Add", "a + b (element-wise)", "a + b", BINARY),
+    op("Add", "np.add(a, b)", "np.add(a, b)", BINARY),
+    op("Add", "a + scalar", "a + scalar", SCALAR_OP),
+    op("Add", "a + 5 (literal)", "a + 5", SCALAR_OP),
+    op("Subtract", "a - b (element-wise)", "a - b", BINARY),
+    op("Subtract", "a - scalar", "a - scalar", SCALAR_OP),
+    op("Subtract", "scalar - a", "scalar - a", SCALAR_OP),
+    op("Multiply", "a * b (element-wise)", "a * b", BINARY),
+    op("Multiply", "a * a (square)", "a * a", UNARY),
+    op("Multiply", "a * scalar", "a * scalar2", SCALAR_OP),
+    op("Multiply", "a * 2 (literal)", "a * 2", SCALAR_OP),
+    op("Divide", "a / b (element-wise)", "a / b_positive", DIVIDE, dtypes=COMMON_DTYPES),
+    op("Divide", "a / scalar", "a / scalar2", DIVIDE_SCALAR, dtypes=COMMON_DTYPES),
+    op("Divide", "scalar / a", "scalar2 / b_positive", DIVIDE_SCALAR, dtypes=COMMON_DTYPES),
+    op("Modulo", "a % b (element-wise)", "a % b_positive", BINARY, dtypes=COMMON_DTYPES),
+    op("Modulo", "a % 7 (literal)", "a % 7", SCALAR_OP, dtypes=COMMON_DTYPES),
+])
+
+# --- Unary: math / rounding / exp-log / trig / power (transcendental dtypes) ---
+# a_small and angles continue the stream POSITIVE(42) reseeded (its draw is replayed first).
+_, UNARY_SMALL, UNARY_ANGLES = SEQ(42, R(), R(0, 10, cast=True), R(-2, 2, unit=math.pi))
+define("unary", "Unary", {"a": RANDOM(42), "a_positive": POSITIVE(42),
+                          "a_small": UNARY_SMALL,                              # exp input
+                          "angles": UNARY_ANGLES}, [
+    op("Math", "np.sqrt", "np.sqrt(a_positive)", UNARY),
+    op("Math", "np.abs", "np.abs(a)", UNARY),
+    op("Math", "np.sign", "np.sign(a)", UNARY),
+    op("Rounding", "np.floor", "np.floor(a)", UNARY),
+    op("Rounding", "np.ceil", "np.ceil(a)", UNARY),
+    op("Rounding", "np.round", "np.round(a)", UNARY),
+    op("ExpLog", "np.exp", "np.exp(a_small)", UNARY),
+    op("ExpLog", "np.log", "np.log(a_positive)", UNARY),
+    op("ExpLog", "np.log10", "np.log10(a_positive)", UNARY),
+    op("Trig", "np.sin", "np.sin(angles)", UNARY),
+    op("Trig", "np.cos", "np.cos(angles)", UNARY),
+    op("Trig", "np.tan", "np.tan(angles)", UNARY),
+    # Extra exp/log (mirror C# ExpLogBenchmarks: exp2, expm1, log2, log1p).
+    op("ExpLog", "np.exp2", "np.exp2(a_small)", UNARY),
+    op("ExpLog", "np.expm1", "np.expm1(a_small)", UNARY),
+    op("ExpLog", "np.log2", "np.log2(a_positive)", UNARY),
+    op("ExpLog", "np.log1p", "np.log1p(a_positive)", UNARY),
+    # Clip (mirror C# MathBenchmarks) + scalar Power (mirror C# PowerBenchmarks).
+    op("Math", "np.clip(a, -10, 10)", "np.clip(a, -10.0, 10.0)", UNARY),
+    op("Power", "np.power(a, 2)", "np.power(a, 2)", UNARY),
+    op("Power", "np.power(a, 3)", "np.power(a, 3)", UNARY),
+    op("Power", "np.power(a, 0.5)", "np.power(a_positive, 0.5)", UNARY),
+])
+
+# Extra unary math — mirrors the C# UnaryExtraBenchmarks class (also under the Unary namespace).
+define("unary_extra", "Unary", {"a": POSITIVE(42)}, [
+    op("", "np.cbrt(a)", "np.cbrt(a)", UNARY),
+    op("", "np.reciprocal(a)", "np.reciprocal(a)", UNARY),
+    op("", "np.square(a)", "np.square(a)", UNARY),
+    op("", "np.negative(a)", "np.negative(a)", UNARY),
+    op("", "np.positive(a)", "np.positive(a)", UNARY),
+    op("", "np.trunc(a)", "np.trunc(a)", UNARY),
+])
+
+# --- Reduction: full + axis (var/std float only) ---
+define("reduction", "Reduction", {"a": RANDOM(42), "a_2d": RANDOM(42, "grid")}, [
+    op("Sum", "np.sum", "np.sum(a)", REDUCE),
+    op("Sum", "np.sum axis=0", "np.sum(a_2d, axis=0)", REDUCE),
+    op("Sum", "np.sum axis=1", "np.sum(a_2d, axis=1)", REDUCE),
+    op("Mean", "np.mean", "np.mean(a)", REDUCE),
+    op("VarStd", "np.var", "np.var(a)", REDUCE, dtypes=FLOAT_DTYPES),
+    op("VarStd", "np.std", "np.std(a)", REDUCE, dtypes=FLOAT_DTYPES),
+    op("MinMax", "np.amin", "np.amin(a)", REDUCE),
+    op("MinMax", "np.amax", "np.amax(a)", REDUCE),
+    op("ArgMinMax", "np.argmin", "np.argmin(a)", REDUCE),
+    op("ArgMinMax", "np.argmax", "np.argmax(a)", REDUCE),
+    # Cumulative sum (mirror C# SumBenchmarks.CumSum) — all arithmetic dtypes.
+    op("Sum", "np.cumsum", "np.cumsum(a)", ACCUMULATE),
+    # Axis min/max + mean (mirror C# MinMaxBenchmarks / MeanBenchmarks axis variants).
+    op("MinMax", "np.amin axis=0", "np.amin(a_2d, axis=0)", REDUCE),
+    op("MinMax", "np.amax axis=0", "np.amax(a_2d, axis=0)", REDUCE),
+    op("Mean", "np.mean axis=0", "np.mean(a_2d, axis=0)", REDUCE),
+    op("Mean", "np.mean axis=1", "np.mean(a_2d, axis=1)", REDUCE),
+    # Axis var/std (mirror C# VarStdBenchmarks axis variants) — float only.
+    op("VarStd", "np.var axis=0", "np.var(a_2d, axis=0)", REDUCE, dtypes=FLOAT_DTYPES),
+    op("VarStd", "np.std axis=0", "np.std(a_2d, axis=0)", REDUCE, dtypes=FLOAT_DTYPES),
+])
+
+# NaN-aware reductions + cumprod — mirror C# NanReductionBenchmarks / CumulativeBenchmarks.
+define("nan_reduction", "Reduction", {"a": RANDOM(42)}, [
+    op("", "np.nansum(a)", traffic=REDUCE),
+    op("", "np.nanmean(a)", traffic=REDUCE),
+    op("", "np.nanmax(a)", traffic=REDUCE),
+    op("", "np.nanmin(a)", traffic=REDUCE),
+    op("", "np.nanstd(a)", traffic=REDUCE),
+    op("", "np.nanvar(a)", traffic=REDUCE),
+    op("", "np.nanprod(a)", traffic=REDUCE),
+    op("", "np.nanmedian(a)"),
+    op("", "np.nanpercentile(a, 50)"),
+    op("", "np.nanquantile(a, 0.5)"),
+])
+define("cumulative", "Reduction", {"a": RANDOM(42)}, [
+    op("", "np.cumprod(a)", traffic=ACCUMULATE),
+])
+
+# Product reduction (mirror C# ProdBenchmarks): full + axis. Values in [0.5, 1.0] keep the
+# product finite at every size (the C# class uses the same range), so this is overflow-safe
+# even at 10M, unlike a full-range random array.
+define("prod", "Reduction", {"a": UNIT(42), "a_2d": UNIT(42, "grid")}, [
+    op("", "np.prod", "np.prod(a)", REDUCE),
+    op("", "np.prod axis=0", "np.prod(a_2d, axis=0)", REDUCE),
+    op("", "np.prod axis=1", "np.prod(a_2d, axis=1)", REDUCE),
+])
+
+# --- Broadcasting (float64, sqrt(N) x sqrt(N) matrix; the vector operand is negligible) ---
+BC_MATRIX, BC_ROW, BC_COL = SEQ(42, R(0, 100, "square"), R(0, 100, "side"), R(0, 100, "col"))
+define("broadcast", "Broadcasting", {"matrix": BC_MATRIX, "row_vector": BC_ROW,
+                                     "col_vector": BC_COL, "scalar": ARRAY0(42.0)}, [
+    op("Scalar", "matrix + scalar", "matrix + scalar", SCALAR_OP),
+    op("Row", "matrix + row_vector (N,M)+(M,)", "matrix + row_vector", SCALAR_OP),
+    op("Column", "matrix + col_vector (N,M)+(N,1)", "matrix + col_vector", SCALAR_OP),
+    op("BroadcastTo", "np.broadcast_to(row, (N,M))", "np.broadcast_to(row_vector, (side, side))"),
+], tag="float64", suffix=False)
+
+# --- Creation (CommonTypes) ---
+define("creation", "Creation", {"source": RANDOM(42)}, [
+    op("Initialized", "np.zeros", "np.zeros(n, dtype=dt)"),
+    op("Initialized", "np.ones", "np.ones(n, dtype=dt)", ((), ("x",))),
+    op("Initialized", "np.full", "np.full(n, 42, dtype=dt)", ((), ("x",))),
+    op("Uninitialized", "np.empty", "np.empty(n, dtype=dt)"),
+    op("Copy", "np.copy", "np.copy(source)", UNARY),
+    op("Like", "np.zeros_like", "np.zeros_like(source)"),
+])
+
+# --- Manipulation (float64; mostly views, which have no traffic) ---
+# The unused 3D cube draw is kept so arr_1d_b comes from the same point of the stream.
+MANIP_1D, MANIP_2D, _, MANIP_1D_B = SEQ(42, R(0, 100, "grid_flat"), R(0, 100, "grid"),
+                                         R(0, 100, "cube"), R(0, 100, "grid_flat"))
+define("manipulation", "Manipulation", {"arr_1d": MANIP_1D, "arr_2d": MANIP_2D,
+                                        "arr_1d_b": MANIP_1D_B}, [
+    op("Reshape", "reshape 1D->2D", "arr_1d.reshape(rows, cols)"),
+    op("Reshape", "reshape 2D->1D", "arr_2d.reshape(-1)"),
+    op("Transpose", "a.T (2D)", "arr_2d.T"),
+    op("Transpose", "np.transpose (2D)", "np.transpose(arr_2d)"),
+    op("Flatten", "np.ravel", "np.ravel(arr_2d)"),
+    op("Flatten", "a.flatten", "arr_2d.flatten()", UNARY),
+    op("Stack", "np.concatenate", "np.concatenate([arr_1d, arr_1d_b])", COPY2),
+    op("Stack", "np.stack", "np.stack([arr_1d, arr_1d_b])", COPY2),
+    op("Flip", "np.flip", "np.flip(arr_2d)"),
+    op("Flip", "np.fliplr", "np.fliplr(arr_2d)"),
+    op("Flip", "np.flipud", "np.flipud(arr_2d)"),
+    op("Rot90", "np.rot90", "np.rot90(arr_2d)"),
+    op("Transpose", "np.permute_dims", "np.permute_dims(arr_2d)"),
+    op("Transpose", "np.matrix_transpose", "np.matrix_transpose(arr_2d)"),
+    op("TrimZeros", "np.trim_zeros", "np.trim_zeros(arr_2d, 'fb')"),
+], tag="float64", suffix=False)
+
+# --- Slicing (float64; the sum rows are timed at n = len(slice)) ---
+define("slicing", "Slicing", {"arr_1d": U(0, 100, 42),
+                              "contiguous_slice": SLICE(U(0, 100, 42), 100, 1000, None),
+                              "strided_slice": SLICE(U(0, 100, 42), None, None, 2)}, [
+    op("Create", "a[100:1000] (contiguous)", "arr_1d[100:1000]"),
+    op("Create", "a[::2] (strided)", "arr_1d[::2]"),
+    op("Create", "a[::-1] (reversed)", "arr_1d[::-1]"),
+    op("SumSlice", "np.sum(contiguous_slice)", "np.sum(contiguous_slice)", REDUCE,
+       size=lambda n: len(range(n)[100:1000])),
+    op("SumSlice", "np.sum(strided_slice)", "np.sum(strided_slice)", REDUCE,
+       size=lambda n: len(range(n)[::2])),
+], tag="float64", suffix=False)
+
+# --- Extended coverage suites (mirror the C# benchmark classes 1:1 by op name) ---
+define("comparison", "Comparison", {"a": RANDOM(42), "b": RANDOM(43)}, [
+    op("", "a == b", traffic=BINARY_TO_BOOL),
+    op("", "a != b", traffic=BINARY_TO_BOOL),
+    op("", "a < b", traffic=BINARY_TO_BOOL),
+    op("", "a > b", traffic=BINARY_TO_BOOL),
+    op("", "a <= b", traffic=BINARY_TO_BOOL),
+    op("", "a >= b", traffic=BINARY_TO_BOOL),
+])
+
+define("bitwise", "Bitwise", {"a": RANDOM(42), "b": RANDOM(43)}, [
+    op("", "a & b", traffic=BINARY),
+    op("", "a | b", traffic=BINARY),
+    op("", "a ^ b", traffic=BINARY),
+    op("", "np.invert(a)", traffic=UNARY),
+    op("", "np.left_shift(a, 2)", traffic=UNARY),
+    op("", "np.right_shift(a, 2)", traffic=UNARY),
+])
+
+define("logic", "Logic", {"a": RANDOM(42), "b": RANDOM(43)}, [
+    op("", "np.isnan(a)", traffic=TO_BOOL),
+    op("", "np.isinf(a)", traffic=TO_BOOL),
+    op("", "np.isfinite(a)", traffic=TO_BOOL),
+    op("", "np.maximum(a, b)", traffic=BINARY),
+    op("", "np.minimum(a, b)", traffic=BINARY),
+    op("", "np.isclose(a, b)", traffic=BINARY_TO_BOOL),
+    op("", "np.allclose(a, b)", traffic=REDUCE2),
+    op("", "np.array_equal(a, b)", traffic=REDUCE2),
+])
+
+define("bool_logic", "Logic", {"mask": GT(U(0, 1, 42), 0.5)}, [
+    op("", "np.all(a)", "bool(np.all(mask))", REDUCE),
+    op("", "np.any(a)", "bool(np.any(mask))", REDUCE),
+], tag="bool")
+
+define("statistics", "Statistics", {"a": RANDOM(42)}, [
+    op("", "np.median(a)"),
+    op("", "np.percentile(a, 50)"),
+    op("", "np.quantile(a, 0.5)"),
+    op("", "np.average(a)", traffic=REDUCE),
+    op("", "np.ptp(a)", traffic=REDUCE),
+    op("", "np.count_nonzero(a)", traffic=REDUCE),
+])
+
+define("sorting", "Sorting", {"a": RANDOM(42), "srt": ARANGE()}, [
+    op("", "np.argsort(a)"),
+    op("", "np.nonzero(a)"),
+    # Query N points (a) into the sorted target → N binary searches (real work that
+    # scales with N), matching the C# benchmark. A single scalar lookup is pure call
+    # overhead, not a throughput comparison.
+    op("", "np.searchsorted(a, v)", "np.searchsorted(srt, a)"),
+])
+
+LA_V, LA_VM, LA_A, LA_B = SEQ(42, R(), R(shape="side"), R(shape="mat"), R(shape="mat"))
+define("linalg", "LinearAlgebra", {"v": LA_V, "vM": LA_VM, "matA": LA_A, "matB": LA_B}, [
+    op("", "np.dot(a, b)", "np.dot(v, v)", REDUCE, blas=True),    # one compulsory stream
+    op("", "np.outer(a, b)", "np.outer(vM, vM)", ((), ("d",))),     # (sqrt N)^2 float64 output
+    op("", "np.matmul(A, B)", "np.matmul(matA, matB)", blas=True),
+], tag="float64")
+
+WHERE_A, WHERE_B = SEQ(42, R(-50, 50), R(-50, 50))
+define("where", "Selection", {"a": WHERE_A, "b": WHERE_B, "cond": GT(WHERE_A, 0)}, [
+    op("", "np.where(cond, a, b)", "np.where(cond, a, b)", (("?", "x", "x"), ("x",))),
+    op("", "np.where(cond)", "np.where(cond)"),
+], tag="float64")
+
+
+def _kind_size(kind: str, dtype_name: str) -> int:
+    dt = np.dtype(DTYPES[dtype_name])
+    if kind == "x":
+        return dt.itemsize
+    if kind == "?":
+        return 1
+    if kind == "d":
+        return 8
+    if kind in ("f", "a"):
+        return 8 if dt.kind in "biu" else dt.itemsize
+    raise ValueError(f"unknown traffic kind: {kind}")
+
+
+def traffic_bytes(o: Op, n: int, dtype_name: str) -> Optional[int]:
+    """Compulsory bytes read + written by one call of `o`, or None if unmodelled."""
+    if o.traffic is None:
+        return None
+    reads, writes = o.traffic
+    return n * sum(_kind_size(k, dtype_name) for k in reads + writes)
+
+
+def compile_op(o: Op, group: Group, n: int, dtype_name: str) -> Callable:
+    """Bind an op's expression to its operands as a zero-arg callable.
+
+    The expression is compiled as a lambda whose globals are the operand namespace, so the
+    timed call is the expression itself — no wrapper frame around it."""
+    code = compile(o.expr, f"<{o.name}>", "eval")
+    ns = {"np": np, "n": n, "dt": DTYPES[dtype_name],
+          "side": math.isqrt(n), "rows": SHAPES["grid"](n)[0], "cols": SHAPES["grid"](n)[1]}
+    for name in code.co_names:
+        if name in group.operands:
+            ns[name] = operand(group.operands[name], n, dtype_name)
+    return eval(f"lambda: {o.expr}", ns)
+
+
+# BLAS-backed ops (Op.blas) otherwise run under whatever thread count OPENBLAS_NUM_THREADS /
+# MKL_NUM_THREADS / the core count gave the BLAS library, which makes the linalg ratio a
+# property of the machine. With a sweep configured, each BLAS op is timed once per thread count
+# under threadpoolctl and its name is tagged " [threads=k]" (the merge keeps k in the key and
+# joins every k against the single-threaded NumSharp row).
+BLAS_THREADS: Optional[List[int]] = None
+
+
+def configure_blas_threads(counts: Optional[List[int]]):
+    global BLAS_THREADS
+    BLAS_THREADS = counts
+
+
+def parse_thread_counts(spec: str, cores: int) -> Optional[List[int]]:
+    """'1,2,4,all' -> [1, 2, 4, cores], de-duplicated. Counts above `cores` are dropped with a
+    note: the exclusive cell is pinned to that many cores, so more threads would only timeshare.
+    'none' disables the sweep (BLAS ops run once under the inherited thread count)."""
+    if spec.strip().lower() == "none":
+        return None
+    counts = []
+    for part in spec.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        k = cores if part == "all" else int(part)
+        if k < 1:
+            raise ValueError(f"invalid thread count: {part}")
+        if k > cores:
+            print(f"BLAS threads: skipping {k} (only {cores} physical core(s) to pin to)")
+            continue
+        if k not in counts:
+            counts.append(k)
+    return counts or None
+
+
+def blas_libraries() -> List[str]:
+    """'openblas 0.3.27 (pthreads, 16 threads)'-style descriptions of the loaded BLAS pools."""
+    if threadpool_info is None:
+        return []
+    return [f"{p.get('internal_api')} {p.get('version')} ({p.get('threading_layer', '?')}, "
+            f"{p.get('num_threads')} threads)"
+            for p in threadpool_info() if p.get("user_api") == "blas"]
+
+
+# Cache states each op is timed in: ["warm"] (default), ["cold"] or both. Cold rows are
+# tagged " [cold]" and carry cache="cold"; warm rows keep the historical names.
+CACHE_MODES: List[str] = ["warm"]
+
+
+def configure_cache_modes(modes: List[str]):
+    global CACHE_MODES
+    CACHE_MODES = modes
+
+
+def _variants(o: Op) -> List[tuple]:
+    """(cache mode, BLAS thread count or None) pairs an op is timed under."""
+    sweep = BLAS_THREADS if (o.blas and BLAS_THREADS and threadpool_limits is not None) else [None]
+    return [(mode, k) for mode in CACHE_MODES for k in sweep]
 
-# =============================================================================
-# Manipulation Benchmarks
-# =============================================================================
 
-def run_manipulation_benchmarks(n: int, iterations: int) -> List[BenchmarkResult]:
-    """Benchmark shape manipulation operations."""
-    results = []
-    dtype_name = 'float64'
-
-    np.random.seed(42)
-    rows = int(np.sqrt(n))
-    cols = n // rows
-    actual_n = rows * cols  # May be slightly less than n due to integer division
-    arr_1d = np.random.random(actual_n) * 100  # Use actual_n to ensure reshape works
-    arr_2d = np.random.random((rows, cols)) * 100
-    d = int(n ** (1/3))
-    arr_3d = np.random.random((d, d, d)) * 100
-
-    # Reshape
-    def reshape_1d_2d(): return arr_1d.reshape(rows, cols)
-    r = benchmark(reshape_1d_2d, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "reshape 1D->2D", "Reshape", "Manipulation", dtype_name
-    results.append(r)
-
-    def reshape_2d_1d(): return arr_2d.reshape(-1)
-    r = benchmark(reshape_2d_1d, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "reshape 2D->1D", "Reshape", "Manipulation", dtype_name
-    results.append(r)
-
-    # Transpose
-    def transpose_2d(): return arr_2d.T
-    r = benchmark(transpose_2d, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "a.T (2D)", "Transpose", "Manipulation", dtype_name
-    results.append(r)
-
-    def np_transpose(): return np.transpose(arr_2d)
-    r = benchmark(np_transpose, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.transpose (2D)", "Transpose", "Manipulation", dtype_name
-    results.append(r)
-
-    # Ravel/Flatten
-    def np_ravel(): return np.ravel(arr_2d)
-    r = benchmark(np_ravel, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.ravel", "Flatten", "Manipulation", dtype_name
-    results.append(r)
-
-    def np_flatten(): return arr_2d.flatten()
-    r = benchmark(np_flatten, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "a.flatten", "Flatten", "Manipulation", dtype_name
-    results.append(r)
-
-    # Stack
-    arr_1d_b = np.random.random(actual_n) * 100  # Same size as arr_1d
-
-    def np_concatenate(): return np.concatenate([arr_1d, arr_1d_b])
-    r = benchmark(np_concatenate, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.concatenate", "Stack", "Manipulation", dtype_name
-    results.append(r)
-
-    def np_stack(): return np.stack([arr_1d, arr_1d_b])
-    r = benchmark(np_stack, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.stack", "Stack", "Manipulation", dtype_name
-    results.append(r)
-
-    # Reversal / rotation / transpose-alias views + the trim_zeros crop (journey2 additions —
-    # twins of Benchmarks/Manipulation/FlipRotBenchmarks.cs). The first six are O(1)/O(ndim) pure
-    # views; trim_zeros does an O(N) nonzero bounding-box scan. Names normalize 1:1 onto the C#
-    # [Benchmark(Description)] labels ("np.flip(a)" -> "np.flip", ...) for the (op, dtype, N) join.
-    def np_flip(): return np.flip(arr_2d)
-    r = benchmark(np_flip, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.flip", "Flip", "Manipulation", dtype_name
-    results.append(r)
-
-    def np_fliplr(): return np.fliplr(arr_2d)
-    r = benchmark(np_fliplr, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.fliplr", "Flip", "Manipulation", dtype_name
-    results.append(r)
-
-    def np_flipud(): return np.flipud(arr_2d)
-    r = benchmark(np_flipud, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.flipud", "Flip", "Manipulation", dtype_name
-    results.append(r)
-
-    def np_rot90(): return np.rot90(arr_2d)
-    r = benchmark(np_rot90, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.rot90", "Rot90", "Manipulation", dtype_name
-    results.append(r)
-
-    def np_permute_dims(): return np.permute_dims(arr_2d)
-    r = benchmark(np_permute_dims, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.permute_dims", "Transpose", "Manipulation", dtype_name
-    results.append(r)
-
-    def np_matrix_transpose(): return np.matrix_transpose(arr_2d)
-    r = benchmark(np_matrix_transpose, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.matrix_transpose", "Transpose", "Manipulation", dtype_name
-    results.append(r)
-
-    def np_trim_zeros(): return np.trim_zeros(arr_2d, 'fb')
-    r = benchmark(np_trim_zeros, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.trim_zeros", "TrimZeros", "Manipulation", dtype_name
-    results.append(r)
+def row_name(o: Op, group: Group, dtype_name: str, mode: str, threads: Optional[int]) -> str:
+    # The tags sit before the dtype suffix: merge strips "(dtype)" at the end of the name
+    # first, then "[...]" annotations.
+    name = o.name if threads is None else f"{o.name} [threads={threads}]"
+    if mode == "cold":
+        name += " [cold]"
+    return f"{name} ({dtype_name})" if group.suffix else name
 
-    return results
 
-# =============================================================================
-# Slicing Benchmarks
-# =============================================================================
+# (suite, name, dtype, n) of rows already in the --output JSONL; --resume skips them.
+DONE_KEYS: frozenset = frozenset()
 
-def run_slicing_benchmarks(n: int, iterations: int) -> List[BenchmarkResult]:
-    """Benchmark slicing operations."""
-    results = []
-    dtype_name = 'float64'
-
-    np.random.seed(42)
-    arr_1d = np.random.random(n) * 100
-    rows = int(np.sqrt(n))
-    cols = n // rows
-    arr_2d = np.random.random((rows, cols)) * 100
-
-    # Contiguous slice
-    contiguous_slice = arr_1d[100:1000]
-    strided_slice = arr_1d[::2]
-
-    # Slice creation
-    def slice_contiguous(): return arr_1d[100:1000]
-    r = benchmark(slice_contiguous, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "a[100:1000] (contiguous)", "Create", "Slicing", dtype_name
-    results.append(r)
-
-    def slice_strided(): return arr_1d[::2]
-    r = benchmark(slice_strided, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "a[::2] (strided)", "Create", "Slicing", dtype_name
-    results.append(r)
-
-    def slice_reversed(): return arr_1d[::-1]
-    r = benchmark(slice_reversed, n, iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "a[::-1] (reversed)", "Create", "Slicing", dtype_name
-    results.append(r)
-
-    # Operations on slices
-    def sum_contiguous(): return np.sum(contiguous_slice)
-    r = benchmark(sum_contiguous, len(contiguous_slice), iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.sum(contiguous_slice)", "SumSlice", "Slicing", dtype_name
-    results.append(r)
-
-    def sum_strided(): return np.sum(strided_slice)
-    r = benchmark(sum_strided, len(strided_slice), iterations=iterations)
-    r.name, r.category, r.suite, r.dtype = "np.sum(strided_slice)", "SumSlice", "Slicing", dtype_name
-    results.append(r)
 
-    return results
+def configure_done_keys(keys):
+    global DONE_KEYS
+    DONE_KEYS = frozenset(keys)
 
-# =============================================================================
-# Dispatch Benchmarks (matching DispatchBenchmarks.cs)
-# =============================================================================
 
-def run_dispatch_benchmarks(n: int, iterations: int) -> List[BenchmarkResult]:
-    """Compare different ways to perform c = a + b."""
-    print(f"\n{'='*60}")
-    print(f"  Dispatch Benchmarks (int32, N={n:,})")
-    print(f"{'='*60}\n")
+def result_key(r: dict) -> tuple:
+    return (r["suite"], r["name"], r["dtype"], r["n"])
 
-    # Setup
-    np.random.seed(42)
-    a = np.random.randint(0, 100, n, dtype=np.int32)
-    b = np.random.randint(0, 100, n, dtype=np.int32)
-    c = np.empty(n, dtype=np.int32)
 
+def run_group(group_name: str, n: int, dtype_name: Optional[str], iterations: int) -> List[BenchmarkResult]:
+    """Time every op of one group at one (dtype, N) and return the tagged results."""
+    group = REGISTRY[group_name]
+    dtype_name = dtype_name or group.tag
     results = []
+    for o in group.ops:
+        if o.dtypes is not None and dtype_name not in o.dtypes:
+            continue
+        timed_n = o.size(n) if o.size else n
+        todo = [(mode, k) for mode, k in _variants(o)
+                if (o.suite, row_name(o, group, dtype_name, mode, k), dtype_name, timed_n) not in DONE_KEYS]
+        if not todo:
+            continue
+        func = compile_op(o, group, n, dtype_name)
+        for mode, k in todo:
+            if k is None:
+                r = benchmark(func, timed_n, iterations=iterations, cold=mode == "cold")
+            else:
+                with threadpool_limits(limits=k, user_api="blas"):
+                    r = benchmark(func, timed_n, iterations=iterations, cold=mode == "cold")
+            r.name = row_name(o, group, dtype_name, mode, k)
+            r.category = o.category
+            r.suite = o.suite
+            r.dtype = dtype_name
+            r.threads, r.cache = k, mode
+            r.bytes_moved = traffic_bytes(o, timed_n, dtype_name)
+            results.append(r)
+    return results
 
-    # np.add with pre-allocated output
-    def numpy_add_out():
-        np.add(a, b, out=c)
-    r = benchmark(numpy_add_out, n, iterations=iterations)
-    r.name = "np.add(a, b, out=c)"
-    r.category = "Dispatch"
-    r.suite = "Dispatch"
-    r.dtype = "int32"
-    results.append(r)
-    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms (±{r.stddev_ms:.3f})")
-
-    # Operator syntax (allocates new array)
-    def numpy_operator():
-        return a + b
-    r = benchmark(numpy_operator, n, iterations=iterations)
-    r.name = "c = a + b (allocates)"
-    r.category = "Dispatch"
-    r.suite = "Dispatch"
-    r.dtype = "int32"
-    results.append(r)
-    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms (±{r.stddev_ms:.3f})")
-
-    # Scalar broadcast
-    scalar = b[0]
-    def numpy_broadcast():
-        np.add(a, scalar, out=c)
-    r = benchmark(numpy_broadcast, n, iterations=iterations)
-    r.name = "np.add(a, scalar, out=c)"
-    r.category = "Dispatch"
-    r.suite = "Dispatch"
-    r.dtype = "int32"
-    results.append(r)
-    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms (±{r.stddev_ms:.3f})")
 
+def group_uses_blas(group_name: str) -> bool:
+    return any(o.blas for o in REGISTRY[group_name].ops)
+
+
+# Suite name -> ordered list of (group, dtype set) cells. A dtype of None means the group is
+# dtype-less (it has a fixed tag dtype); otherwise one cell per dtype of the --type/--quick
+# selection, optionally intersected with a fixed set. One (suite, group, dtype, N) cell is the
+# unit the isolated scheduler ships to a worker process.
+SUITES = ["dispatch", "fusion", "arithmetic", "unary", "reduction", "broadcast", "creation",
+          "manipulation", "slicing", "comparison", "bitwise", "logic", "statistics", "sorting",
+          "linalg", "selection"]
+
+
+def suite_cells(suite: str, dtypes_to_run: List[str]) -> List[tuple]:
+    """Expand one suite into its (suite, group, dtype-or-None) cells, in run order."""
+    def each(group, dtypes):
+        return [(suite, group, d) for d in dtypes]
+
+    selected = list(dtypes_to_run)
+    if suite in ("dispatch", "fusion", "broadcast", "manipulation", "slicing", "linalg"):
+        return [(suite, suite, None)]
+    if suite == "arithmetic":
+        return each("arithmetic", [d for d in selected if d in ARITHMETIC_DTYPES])
+    if suite == "unary":
+        return (each("unary", [d for d in selected if d in TRANSCENDENTAL_DTYPES])
+                + each("unary_extra", FLOAT_DTYPES))
+    if suite == "reduction":
+        cells = each("reduction", selected)
+        for d in FLOAT_DTYPES:
+            cells += [(suite, "nan_reduction", d), (suite, "cumulative", d)]
+        return cells + each("prod", ['int64', 'float64'])     # Int64, Double only, to bound the product
+    if suite == "creation":
+        return each("creation", COMMON_DTYPES)
+    if suite == "comparison":
+        return each("comparison", COMMON_DTYPES)
+    if suite == "bitwise":
+        return each("bitwise", BITWISE_DTYPES)
+    if suite == "logic":
+        return each("logic", FLOAT_DTYPES) + [(suite, "bool_logic", None)]
+    if suite == "statistics":
+        return each("statistics", FLOAT_DTYPES)
+    if suite == "sorting":
+        return each("sorting", COMMON_DTYPES)
+    if suite == "selection":
+        return [(suite, "where", None)]
+    raise ValueError(f"unknown suite: {suite}")
+
+
+def run_cell(group: str, n: int, dtype: Optional[str], iterations: int) -> List[BenchmarkResult]:
+    """Run one cell: a single registry group at one size (and dtype, for typed groups).
+
+    Every row is stamped with the process peak RSS after the cell and how much the cell grew
+    it (operands + outputs it needed beyond earlier cells; exact under --isolate, where each
+    cell starts in a fresh process)."""
+    rss_before = peak_rss_mb()
+    results = run_group(group, n, dtype, iterations)
+    rss_after = peak_rss_mb()
+    for r in results:
+        r.rss_peak_mb = rss_after
+        r.rss_delta_mb = rss_after - rss_before
     return results
 
-# =============================================================================
-# Fusion Benchmarks (matching FusionBenchmarks.cs)
-# =============================================================================
 
-def run_fusion_benchmarks(n: int, iterations: int) -> List[BenchmarkResult]:
-    """Compare compound expressions - NumPy cannot fuse these."""
-    print(f"\n{'='*60}")
-    print(f"  Fusion Benchmarks (float64, N={n:,})")
-    print(f"{'='*60}\n")
+def selected_cells(suite: str, dtypes_to_run: List[str]) -> List[tuple]:
+    suites = SUITES if suite == "all" else [suite]
+    return [c for s in suites for c in suite_cells(s, dtypes_to_run)]
 
-    # Setup
-    np.random.seed(42)
-    a = np.random.random(n) * 10
-    b = np.random.random(n) * 10
-    mean_val = np.mean(a)
 
-    results = []
+def run_suites(n: int, suite: str, dtypes_to_run: List[str], iterations: int,
+               on_cell: Optional[Callable[[List[BenchmarkResult]], None]] = None) -> List[BenchmarkResult]:
+    """Run all selected suites at a single array size N and return the results.
 
-    # Pattern 1: c = a * a
-    print("  --- Pattern 1: c = a * a ---")
-    def p1_numpy():
-        return a * a
-    r = benchmark(p1_numpy, n, iterations=iterations)
-    r.name = "NumPy: a * a"
-    r.category = "Pattern1_Square"
-    r.suite = "Fusion"
-    r.dtype = "float64"
-    results.append(r)
-    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
-
-    # Pattern 2: c = a*a + 2*b
-    print("\n  --- Pattern 2: c = a*a + 2*b ---")
-    def p2_numpy():
-        return a*a + 2*b
-    r = benchmark(p2_numpy, n, iterations=iterations)
-    r.name = "NumPy: a*a + 2*b"
-    r.category = "Pattern2_AaBb"
-    r.suite = "Fusion"
-    r.dtype = "float64"
-    results.append(r)
-    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
-
-    # Pattern 3: variance
-    print("\n  --- Pattern 3: variance ---")
-    def p3_manual():
-        return np.sum((a - mean_val) ** 2) / n
-    r = benchmark(p3_manual, n, iterations=iterations)
-    r.name = "NumPy: sum((a-mean)**2)/N"
-    r.category = "Pattern3_Variance"
-    r.suite = "Fusion"
-    r.dtype = "float64"
-    results.append(r)
-    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
-
-    def p3_optimized():
-        return np.var(a)
-    r = benchmark(p3_optimized, n, iterations=iterations)
-    r.name = "NumPy: np.var(a) [optimized]"
-    r.category = "Pattern3_Variance"
-    r.suite = "Fusion"
-    r.dtype = "float64"
-    results.append(r)
-    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
-
-    # Pattern 4: polynomial a³ + a² + a
-    print("\n  --- Pattern 4: c = a³ + a² + a ---")
-    def p4_power():
-        return a**3 + a**2 + a
-    r = benchmark(p4_power, n, iterations=iterations)
-    r.name = "NumPy: a**3 + a**2 + a"
-    r.category = "Pattern4_Polynomial"
-    r.suite = "Fusion"
-    r.dtype = "float64"
-    results.append(r)
-    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
-
-    def p4_multiply():
-        return a*a*a + a*a + a
-    r = benchmark(p4_multiply, n, iterations=iterations)
-    r.name = "NumPy: a*a*a + a*a + a"
-    r.category = "Pattern4_Polynomial"
-    r.suite = "Fusion"
-    r.dtype = "float64"
-    results.append(r)
-    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
-
-    # Pattern 5: euclidean sqrt(a² + b²)
-    print("\n  --- Pattern 5: c = sqrt(a² + b²) ---")
-    def p5_manual():
-        return np.sqrt(a**2 + b**2)
-    r = benchmark(p5_manual, n, iterations=iterations)
-    r.name = "NumPy: sqrt(a**2 + b**2)"
-    r.category = "Pattern5_Euclidean"
-    r.suite = "Fusion"
-    r.dtype = "float64"
-    results.append(r)
-    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
-
-    def p5_hypot():
-        return np.hypot(a, b)
-    r = benchmark(p5_hypot, n, iterations=iterations)
-    r.name = "NumPy: np.hypot(a, b) [optimized]"
-    r.category = "Pattern5_Euclidean"
-    r.suite = "Fusion"
-    r.dtype = "float64"
-    results.append(r)
-    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
+    Extracted from main() so the official run can sweep multiple sizes in one invocation
+    (each result carries its own n, which the merge keys on). `on_cell` receives each cell's
+    rows as soon as the cell finishes (the JSONL sink)."""
+    results_all: List[BenchmarkResult] = []
+    current = None
+    for suite_name, group, dtype in selected_cells(suite, dtypes_to_run):
+        if suite_name != current:
+            current = suite_name
+            print(f"\n{'='*60}\n  {suite_name.capitalize()} Benchmarks (N={n:,})\n{'='*60}")
+        if dtype is not None:
+            print(f"\n  --- {dtype} ---")
+        results = run_cell(group, n, dtype, iterations)
+        results_all.extend(results)
+        for r in results:
+            print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
+        if on_cell and results:
+            on_cell(results)
+    return results_all
+
+
+# =============================================================================
+# Result sink
+# =============================================================================
+#
+# An --output ending in .jsonl is written one row per line as each cell finishes (flushed and
+# fsynced), so a sweep killed after two hours keeps everything it measured. --resume reads the
+# file back and skips (suite, name, dtype, N) keys that are already in it.
+
+def load_result_rows(path: str) -> List[dict]:
+    """Rows from a .json array or a .jsonl stream. A torn last line (the writer was killed
+    mid-write) is ignored; a key written twice keeps its last row."""
+    with open(path, encoding="utf-8") as f:
+        if not path.endswith(".jsonl"):
+            return json.load(f)
+        rows: Dict[tuple, dict] = {}
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                r = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            rows[result_key(r)] = r
+        return list(rows.values())
+
+
+class JsonlSink:
+    """Append-only JSONL result file, durable after every write()."""
+
+    def __init__(self, path: str):
+        self.path = path
+        # Start on a fresh line if a previous run died mid-row.
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+            if torn:
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("\n")
+
+    def write(self, rows: List[BenchmarkResult]):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for r in rows:
+                f.write(json.dumps(asdict(r)) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
 
-    return results
 
 # =============================================================================
 # Main
@@ -941,299 +1225,308 @@ def print_summary(results: List[BenchmarkResult]):
     except ImportError:
         print("\n(Install 'tabulate' for formatted table output: pip install tabulate)")
 
-# =============================================================================
-# Extended coverage suites (mirror the new C# benchmark classes 1:1 by op name)
-# =============================================================================
 
-# dtype sets that mirror the C# TypeParameterSource collections.
-BITWISE_DTYPES = ['bool', 'uint8', 'int8', 'int16', 'uint16', 'int32', 'uint32', 'int64', 'uint64']
-FLOAT_DTYPES = ['float16', 'float32', 'float64']
-
-
-def _b(func, n, iterations, name, suite, dtype, category=""):
-    """Run one benchmark and tag it. name MUST equal the C# [Benchmark(Description=...)]."""
-    r = benchmark(func, n, iterations=iterations)
-    r.name = f"{name} ({dtype})"
-    r.suite = suite
-    r.dtype = dtype
-    r.category = category or suite
-    return r
-
-
-def run_comparison_benchmarks(n, dtype_name, iterations):
-    a = create_random_array(n, dtype_name, seed=42)
-    b = create_random_array(n, dtype_name, seed=43)
-    return [
-        _b(lambda: a == b, n, iterations, "a == b", "Comparison", dtype_name),
-        _b(lambda: a != b, n, iterations, "a != b", "Comparison", dtype_name),
-        _b(lambda: a < b,  n, iterations, "a < b",  "Comparison", dtype_name),
-        _b(lambda: a > b,  n, iterations, "a > b",  "Comparison", dtype_name),
-        _b(lambda: a <= b, n, iterations, "a <= b", "Comparison", dtype_name),
-        _b(lambda: a >= b, n, iterations, "a >= b", "Comparison", dtype_name),
-    ]
-
-
-def run_bitwise_benchmarks(n, dtype_name, iterations):
-    a = create_random_array(n, dtype_name, seed=42)
-    b = create_random_array(n, dtype_name, seed=43)
-    return [
-        _b(lambda: a & b, n, iterations, "a & b", "Bitwise", dtype_name),
-        _b(lambda: a | b, n, iterations, "a | b", "Bitwise", dtype_name),
-        _b(lambda: a ^ b, n, iterations, "a ^ b", "Bitwise", dtype_name),
-        _b(lambda: np.invert(a), n, iterations, "np.invert(a)", "Bitwise", dtype_name),
-        _b(lambda: np.left_shift(a, 2), n, iterations, "np.left_shift(a, 2)", "Bitwise", dtype_name),
-        _b(lambda: np.right_shift(a, 2), n, iterations, "np.right_shift(a, 2)", "Bitwise", dtype_name),
-    ]
-
-
-def run_unary_extra_benchmarks(n, dtype_name, iterations):
-    a = create_positive_array(n, dtype_name, seed=42)
-    return [
-        _b(lambda: np.cbrt(a), n, iterations, "np.cbrt(a)", "Unary", dtype_name),
-        _b(lambda: np.reciprocal(a), n, iterations, "np.reciprocal(a)", "Unary", dtype_name),
-        _b(lambda: np.square(a), n, iterations, "np.square(a)", "Unary", dtype_name),
-        _b(lambda: np.negative(a), n, iterations, "np.negative(a)", "Unary", dtype_name),
-        _b(lambda: np.positive(a), n, iterations, "np.positive(a)", "Unary", dtype_name),
-        _b(lambda: np.trunc(a), n, iterations, "np.trunc(a)", "Unary", dtype_name),
-    ]
-
-
-def run_logic_benchmarks(n, dtype_name, iterations):
-    a = create_random_array(n, dtype_name, seed=42)
-    b = create_random_array(n, dtype_name, seed=43)
-    return [
-        _b(lambda: np.isnan(a), n, iterations, "np.isnan(a)", "Logic", dtype_name),
-        _b(lambda: np.isinf(a), n, iterations, "np.isinf(a)", "Logic", dtype_name),
-        _b(lambda: np.isfinite(a), n, iterations, "np.isfinite(a)", "Logic", dtype_name),
-        _b(lambda: np.maximum(a, b), n, iterations, "np.maximum(a, b)", "Logic", dtype_name),
-        _b(lambda: np.minimum(a, b), n, iterations, "np.minimum(a, b)", "Logic", dtype_name),
-        _b(lambda: np.isclose(a, b), n, iterations, "np.isclose(a, b)", "Logic", dtype_name),
-        _b(lambda: np.allclose(a, b), n, iterations, "np.allclose(a, b)", "Logic", dtype_name),
-        _b(lambda: np.array_equal(a, b), n, iterations, "np.array_equal(a, b)", "Logic", dtype_name),
-    ]
-
-
-def run_bool_logic_benchmarks(n, iterations):
-    np.random.seed(42)
-    mask = np.random.random(n) > 0.5
-    return [
-        _b(lambda: bool(np.all(mask)), n, iterations, "np.all(a)", "Logic", "bool"),
-        _b(lambda: bool(np.any(mask)), n, iterations, "np.any(a)", "Logic", "bool"),
-    ]
-
-
-def run_nan_reduction_benchmarks(n, dtype_name, iterations):
-    a = create_random_array(n, dtype_name, seed=42)
-    return [
-        _b(lambda: np.nansum(a), n, iterations, "np.nansum(a)", "Reduction", dtype_name),
-        _b(lambda: np.nanmean(a), n, iterations, "np.nanmean(a)", "Reduction", dtype_name),
-        _b(lambda: np.nanmax(a), n, iterations, "np.nanmax(a)", "Reduction", dtype_name),
-        _b(lambda: np.nanmin(a), n, iterations, "np.nanmin(a)", "Reduction", dtype_name),
-        _b(lambda: np.nanstd(a), n, iterations, "np.nanstd(a)", "Reduction", dtype_name),
-        _b(lambda: np.nanvar(a), n, iterations, "np.nanvar(a)", "Reduction", dtype_name),
-        _b(lambda: np.nanprod(a), n, iterations, "np.nanprod(a)", "Reduction", dtype_name),
-        _b(lambda: np.nanmedian(a), n, iterations, "np.nanmedian(a)", "Reduction", dtype_name),
-        _b(lambda: np.nanpercentile(a, 50), n, iterations, "np.nanpercentile(a, 50)", "Reduction", dtype_name),
-        _b(lambda: np.nanquantile(a, 0.5), n, iterations, "np.nanquantile(a, 0.5)", "Reduction", dtype_name),
-    ]
-
-
-def run_statistics_benchmarks(n, dtype_name, iterations):
-    a = create_random_array(n, dtype_name, seed=42)
-    return [
-        _b(lambda: np.median(a), n, iterations, "np.median(a)", "Statistics", dtype_name),
-        _b(lambda: np.percentile(a, 50), n, iterations, "np.percentile(a, 50)", "Statistics", dtype_name),
-        _b(lambda: np.quantile(a, 0.5), n, iterations, "np.quantile(a, 0.5)", "Statistics", dtype_name),
-        _b(lambda: np.average(a), n, iterations, "np.average(a)", "Statistics", dtype_name),
-        _b(lambda: np.ptp(a), n, iterations, "np.ptp(a)", "Statistics", dtype_name),
-        _b(lambda: np.count_nonzero(a), n, iterations, "np.count_nonzero(a)", "Statistics", dtype_name),
-    ]
-
-
-def run_sorting_benchmarks(n, dtype_name, iterations):
-    a = create_random_array(n, dtype_name, seed=42)
-    srt = np.arange(n, dtype=DTYPES[dtype_name])
-    return [
-        _b(lambda: np.argsort(a), n, iterations, "np.argsort(a)", "Sorting", dtype_name),
-        _b(lambda: np.nonzero(a), n, iterations, "np.nonzero(a)", "Sorting", dtype_name),
-        # Query N points (a) into the sorted target → N binary searches (real work that
-        # scales with N), matching the C# benchmark. A single scalar lookup is pure call
-        # overhead, not a throughput comparison.
-        _b(lambda: np.searchsorted(srt, a), n, iterations, "np.searchsorted(a, v)", "Sorting", dtype_name),
-    ]
-
-
-def run_linalg_benchmarks(n, iterations):
-    np.random.seed(42)
-    m = int(n ** 0.5)
-    mc = min(m, 384)
-    v = np.random.random(n)
-    vM = np.random.random(m)
-    matA = np.random.random((mc, mc))
-    matB = np.random.random((mc, mc))
-    return [
-        _b(lambda: np.dot(v, v), n, iterations, "np.dot(a, b)", "LinearAlgebra", "float64"),
-        _b(lambda: np.outer(vM, vM), n, iterations, "np.outer(a, b)", "LinearAlgebra", "float64"),
-        _b(lambda: np.matmul(matA, matB), n, iterations, "np.matmul(A, B)", "LinearAlgebra", "float64"),
-    ]
-
-
-def run_where_benchmarks(n, iterations):
-    np.random.seed(42)
-    a = np.random.random(n) * 100 - 50
-    b = np.random.random(n) * 100 - 50
-    cond = a > 0
-    return [
-        _b(lambda: np.where(cond, a, b), n, iterations, "np.where(cond, a, b)", "Selection", "float64"),
-        _b(lambda: np.where(cond), n, iterations, "np.where(cond)", "Selection", "float64"),
-    ]
-
-
-def run_cumulative_benchmarks(n, dtype_name, iterations):
-    a = create_random_array(n, dtype_name, seed=42)
-    return [
-        _b(lambda: np.cumprod(a), n, iterations, "np.cumprod(a)", "Reduction", dtype_name),
-    ]
-
-
-def run_prod_benchmarks(n, dtype_name, iterations):
-    """Product reduction (mirror C# ProdBenchmarks): full + axis. Values in [0.5, 1.0] keep the
-    product finite at every size (the C# class uses the same range), so this is overflow-safe
-    even at 10M, unlike a full-range random array."""
-    np.random.seed(42)
-    a = (np.random.rand(n) * 0.5 + 0.5).astype(DTYPES[dtype_name])
-    rows = int(np.sqrt(n)); cols = n // rows
-    np.random.seed(42)
-    a_2d = (np.random.rand(rows * cols) * 0.5 + 0.5).astype(DTYPES[dtype_name]).reshape(rows, cols)
-    return [
-        _b(lambda: np.prod(a), n, iterations, "np.prod", "Reduction", dtype_name),
-        _b(lambda: np.prod(a_2d, axis=0), n, iterations, "np.prod axis=0", "Reduction", dtype_name),
-        _b(lambda: np.prod(a_2d, axis=1), n, iterations, "np.prod axis=1", "Reduction", dtype_name),
-    ]
-
-
-def run_suites(n: int, suite: str, dtypes_to_run: List[str], iterations: int) -> List[BenchmarkResult]:
-    """Run all selected suites at a single array size N and return the results.
-
-    Extracted from main() so the official run can sweep multiple sizes in one invocation
-    (each result carries its own n, which the merge keys on)."""
-    results_all: List[BenchmarkResult] = []
-
-    if suite in ["dispatch", "all"]:
-        results_all.extend(run_dispatch_benchmarks(n, iterations))
-
-    if suite in ["fusion", "all"]:
-        results_all.extend(run_fusion_benchmarks(n, iterations))
-
-    if suite in ["arithmetic", "all"]:
-        print(f"\n{'='*60}\n  Arithmetic Benchmarks (N={n:,})\n{'='*60}")
-        for dtype in dtypes_to_run:
-            if dtype in ARITHMETIC_DTYPES:
-                print(f"\n  --- {dtype} ---")
-                results = run_arithmetic_benchmarks(n, dtype, iterations)
-                results_all.extend(results)
-                for r in results:
-                    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
-
-    if suite in ["unary", "all"]:
-        print(f"\n{'='*60}\n  Unary Benchmarks (N={n:,})\n{'='*60}")
-        for dtype in dtypes_to_run:
-            if dtype in TRANSCENDENTAL_DTYPES:
-                print(f"\n  --- {dtype} ---")
-                results = run_unary_benchmarks(n, dtype, iterations)
-                results_all.extend(results)
-                for r in results:
-                    print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
-        # Extra unary math (cbrt/reciprocal/square/negative/positive/trunc) — mirrors
-        # the C# UnaryExtraBenchmarks class (also under the Unary namespace).
-        for dtype in FLOAT_DTYPES:
-            results_all.extend(run_unary_extra_benchmarks(n, dtype, iterations))
-
-    if suite in ["reduction", "all"]:
-        print(f"\n{'='*60}\n  Reduction Benchmarks (N={n:,})\n{'='*60}")
-        for dtype in dtypes_to_run:
-            print(f"\n  --- {dtype} ---")
-            results = run_reduction_benchmarks(n, dtype, iterations)
-            results_all.extend(results)
-            for r in results:
-                print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
-        # NaN-aware reductions + cumprod — mirror C# NanReductionBenchmarks / CumulativeBenchmarks.
-        for dtype in FLOAT_DTYPES:
-            results_all.extend(run_nan_reduction_benchmarks(n, dtype, iterations))
-            results_all.extend(run_cumulative_benchmarks(n, dtype, iterations))
-        # Product reduction — mirror C# ProdBenchmarks (Int64, Double only, to bound the product).
-        for dtype in ['int64', 'float64']:
-            results_all.extend(run_prod_benchmarks(n, dtype, iterations))
-
-    if suite in ["broadcast", "all"]:
-        results_all.extend(run_broadcast_benchmarks(n, iterations))
-
-    if suite in ["creation", "all"]:
-        print(f"\n{'='*60}\n  Creation Benchmarks (N={n:,})\n{'='*60}")
-        for dtype in COMMON_DTYPES:
-            print(f"\n  --- {dtype} ---")
-            results = run_creation_benchmarks(n, dtype, iterations)
-            results_all.extend(results)
-            for r in results:
-                print(f"  {r.name:<40} {r.mean_ms:>8.3f} ms")
-
-    if suite in ["manipulation", "all"]:
-        results_all.extend(run_manipulation_benchmarks(n, iterations))
-
-    if suite in ["slicing", "all"]:
-        results_all.extend(run_slicing_benchmarks(n, iterations))
-
-    if suite in ["comparison", "all"]:
-        for dtype in COMMON_DTYPES:
-            results_all.extend(run_comparison_benchmarks(n, dtype, iterations))
-
-    if suite in ["bitwise", "all"]:
-        for dtype in BITWISE_DTYPES:
-            results_all.extend(run_bitwise_benchmarks(n, dtype, iterations))
-
-    if suite in ["logic", "all"]:
-        for dtype in FLOAT_DTYPES:
-            results_all.extend(run_logic_benchmarks(n, dtype, iterations))
-        results_all.extend(run_bool_logic_benchmarks(n, iterations))
 
-    if suite in ["statistics", "all"]:
-        for dtype in FLOAT_DTYPES:
-            results_all.extend(run_statistics_benchmarks(n, dtype, iterations))
-
-    if suite in ["sorting", "all"]:
-        for dtype in COMMON_DTYPES:
-            results_all.extend(run_sorting_benchmarks(n, dtype, iterations))
-
-    if suite in ["linalg", "all"]:
-        results_all.extend(run_linalg_benchmarks(n, iterations))
+# =============================================================================
+# Bandwidth roofline
+# =============================================================================
+#
+# bytes_moved comes from each Op's traffic model (see the registry); this section measures the
+# machine's peak and turns bytes / time into GB/s and % of peak.
+
+def measure_stream_bandwidth(n: int = 1 << 24, reps: int = 10) -> Dict[str, float]:
+    """Single-core STREAM-style sustainable bandwidth in GB/s (best of `reps` per kernel).
+
+    Copy (c = a) moves 16 B/element and Add (c = a + b) 24 B/element; each float64 array is
+    128 MB at the default n, well past any LLC. Single-core is the right roof: the op-matrix
+    timings on both sides are single-threaded streams."""
+    a = np.random.random(n)
+    b = np.random.random(n)
+    c = np.empty(n)
+    kernels = {
+        "copy": (lambda: np.copyto(c, a), 16 * n),
+        "add": (lambda: np.add(a, b, out=c), 24 * n),
+    }
+    out = {}
+    for name, (fn, nbytes) in kernels.items():
+        fn()
+        best = min(_time_loop(fn, 1) for _ in range(reps))
+        out[name] = nbytes / (best * 1e6)
+    return out
+
+
+def annotate_bandwidth(results: List[BenchmarkResult], peak_gbps: Optional[float]):
+    """Fill gbps / pct_peak from each row's modelled bytes_moved and its median time."""
+    for r in results:
+        ms = r.median_ms or r.mean_ms
+        if r.bytes_moved is None or ms <= 0:
+            continue
+        r.gbps = r.bytes_moved / (ms * 1e6)
+        if peak_gbps:
+            r.peak_gbps = peak_gbps
+            r.pct_peak = r.gbps / peak_gbps * 100
+
+
+MEMORY_BOUND_PCT = 60.0     # >= this share of STREAM peak: the op is running at the memory roof
+
+
+def print_roofline(results: List[BenchmarkResult]):
+    """Per-suite bandwidth summary at the largest N: median %peak and how many ops sit at the
+    memory roof. Ops well below the roof at 10M are compute- or overhead-bound, so a ratio
+    there is an algorithm/kernel question rather than a bandwidth one."""
+    modelled = [r for r in results if r.pct_peak is not None]
+    if not modelled:
+        return
+    n_max = max(r.n for r in modelled)
+    by_suite: Dict[str, List[BenchmarkResult]] = {}
+    for r in modelled:
+        if r.n == n_max:
+            by_suite.setdefault(r.suite, []).append(r)
+    print(f"\n{'='*72}\n  Bandwidth roofline at N={n_max:,} (peak {modelled[0].peak_gbps:.1f} GB/s)\n{'='*72}")
+    print(f"  {'Suite':<14} {'ops':>4} {'median GB/s':>12} {'median %peak':>13} {'memory-bound':>13}")
+    for suite, rows in by_suite.items():
+        at_roof = sum(1 for r in rows if r.pct_peak >= MEMORY_BOUND_PCT)
+        print(f"  {suite:<14} {len(rows):>4} {statistics.median(r.gbps for r in rows):>12.1f} "
+              f"{statistics.median(r.pct_peak for r in rows):>12.0f}% {at_roof:>6}/{len(rows)}")
 
-    if suite in ["selection", "all"]:
-        results_all.extend(run_where_benchmarks(n, iterations))
 
-    return results_all
+# =============================================================================
+# Process-isolated execution
+# =============================================================================
+#
+# Serial runs share one interpreter, so allocator state, page-cache warmth and arrays left
+# over from earlier suites bleed into later timings. --isolate ships every (suite, group,
+# dtype, N) cell to a FRESH spawned interpreter pinned to its own core, and streams the rows
+# back over a queue as each cell finishes. With --workers > 1 independent cells run in
+# parallel, one per physical core (SMT siblings share an L2, so only one of each pair is used).
+
+def parse_cpu_list(spec: str) -> List[int]:
+    """'0-3,8,10-11' -> [0, 1, 2, 3, 8, 10, 11] (the sysfs / taskset list syntax)."""
+    cpus = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            cpus.extend(range(int(lo), int(hi) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def physical_cores(cpus: List[int]) -> List[int]:
+    """Keep one logical CPU per physical core (the lowest-numbered SMT sibling)."""
+    picked, seen = [], set()
+    for cpu in sorted(cpus):
+        try:
+            with open(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list") as f:
+                siblings = tuple(parse_cpu_list(f.read()))
+        except OSError:
+            siblings = (cpu,)
+        if siblings not in seen:
+            seen.add(siblings)
+            picked.append(cpu)
+    return picked
+
+
+def available_cpus() -> List[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _cell_worker(task_id, group, n, dtype, iterations, policy, blas_threads, cache_modes,
+                 done_keys, cpus, queue):
+    """Entry point of one isolated worker: pin, run the cell, stream rows, report done."""
+    configure_timing(policy)
+    configure_done_keys(done_keys)
+    configure_blas_threads(blas_threads)
+    configure_cache_modes(cache_modes)
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, set(cpus))
+    sys.stdout = open(os.devnull, "w")   # run_* chatter would interleave across workers
+    try:
+        for r in run_cell(group, n, dtype, iterations):
+            queue.put(("row", task_id, asdict(r)))
+    except Exception as e:
+        queue.put(("error", task_id, f"{type(e).__name__}: {e}"))
+    finally:
+        queue.put(("done", task_id, None))
+
+
+def run_isolated(cells: List[tuple], sizes: List[int], iterations: int,
+                 workers: int = 1, cpus: Optional[List[int]] = None,
+                 on_cell: Optional[Callable[[List[BenchmarkResult]], None]] = None) -> List[BenchmarkResult]:
+    """Run every (cell, N) in its own spawned process, at most `workers` at a time.
+
+    Each worker is pinned to a dedicated core taken from `cpus` (default: one logical CPU per
+    physical core of the current affinity mask) and returned to the pool when it exits. Cells
+    with a BLAS thread sweep need more than one core, so they wait for every worker to finish
+    and run alone, pinned to the whole physical pool even when --workers is smaller. Rows are printed as they stream in; the returned list is in
+    deterministic (size, cell) order regardless of completion order."""
+    import multiprocessing as mp
+    from collections import deque
+
+    ctx = mp.get_context("spawn")
+    pinning = hasattr(os, "sched_setaffinity")
+    pool = physical_cores(cpus if cpus else available_cpus()) if pinning else []
+    workers = max(1, min(workers, len(pool))) if pinning else max(1, workers)
+    free = deque(pool[:workers]) if pinning else deque([None] * workers)
+    print(f"Isolated: {workers} worker(s), "
+          + (f"pinned to CPUs {list(free)}" if pinning else "unpinned (no sched_setaffinity)"))
+
+    tasks = [(n, cell) for n in sizes for cell in cells]
+    pending = deque(range(len(tasks)))
+    rows: Dict[int, List[BenchmarkResult]] = {}
+    active: Dict[int, tuple] = {}          # task_id -> (process, cpu)
+    queue = ctx.Queue()
+
+    def finish(task_id):
+        proc, cpu = active.pop(task_id)
+        proc.join()
+        if on_cell and rows[task_id]:
+            on_cell(rows[task_id])
+        if isinstance(cpu, tuple):
+            free.extend(cpu)
+        else:
+            free.append(cpu)
+
+    def cell_done_keys(group):
+        # Only the keys of this group's suite, so a resumed run doesn't pickle the whole set.
+        suites = {o.suite for o in REGISTRY[group].ops}
+        return frozenset(k for k in DONE_KEYS if k[0] in suites)
+
+    def exclusive(task_id):
+        return bool(BLAS_THREADS) and group_uses_blas(tasks[task_id][1][1])
+
+    while pending or active:
+        while pending and free:
+            task_id = pending[0]
+            if exclusive(task_id):
+                if active:
+                    break
+                cpu = tuple(free)       # every worker slot, so nothing starts alongside it
+                free.clear()
+                pin = tuple(pool)       # ...but pinned to all physical cores, not just the slots
+            else:
+                cpu = free.popleft()
+                pin = (cpu,)
+            pending.popleft()
+            n, (suite_name, group, dtype) = tasks[task_id]
+            pin = pin if pinning else None
+            proc = ctx.Process(target=_cell_worker,
+                               args=(task_id, group, n, dtype, iterations, TIMING, BLAS_THREADS,
+                                     CACHE_MODES, cell_done_keys(group), pin, queue))
+            proc.start()
+            active[task_id] = (proc, cpu)
+            rows.setdefault(task_id, [])
+        try:
+            kind, task_id, payload = queue.get(timeout=1.0)
+        except Exception:
+            # A worker that died without reporting (segfault, OOM kill) must not wedge the pool.
+            for task_id, (proc, _) in list(active.items()):
+                if not proc.is_alive() and queue.empty():
+                    n, (suite_name, group, dtype) = tasks[task_id]
+                    print(f"  [crash] {suite_name}/{group}/{dtype or '-'} N={n:,}: exit {proc.exitcode}")
+                    finish(task_id)
+            continue
+        if kind == "row":
+            r = BenchmarkResult(**payload)
+            rows[task_id].append(r)
+            print(f"  {r.suite:<14} {r.name:<40} N={r.n:<10,} {r.mean_ms:>10.4f} ms")
+        elif kind == "error":
+            n, (suite_name, group, dtype) = tasks[task_id]
+            print(f"  [error] {suite_name}/{group}/{dtype or '-'} N={n:,}: {payload}")
+        elif kind == "done" and task_id in active:
+            finish(task_id)
+
+    return [r for task_id in range(len(tasks)) for r in rows.get(task_id, [])]
 
 
 def main():
     parser = argparse.ArgumentParser(description="NumPy Performance Benchmarks")
-    parser.add_argument("--suite", choices=["dispatch", "fusion", "arithmetic", "unary", "reduction",
-                                            "broadcast", "creation", "manipulation", "slicing",
-                                            "comparison", "bitwise", "logic", "statistics", "sorting",
-                                            "linalg", "selection", "all"],
+    parser.add_argument("--suite", choices=SUITES + ["all"],
                         default="all", help="Benchmark suite to run")
     parser.add_argument("--n", type=int, default=10_000_000, help="Array size")
     parser.add_argument("--size", choices=["small", "medium", "large", "all"], default=None,
                         help="Array size preset ('all' sweeps small+medium+large in one run)")
     parser.add_argument("--cache-sizes", action="store_true",
                         help="Sweep all three cache-tier sizes (small, medium, large) in one invocation")
+    parser.add_argument("--sizes", type=str, default=None,
+                        help="Comma-separated sizes to sweep in one invocation, e.g. 1000,100000")
     parser.add_argument("--type", type=str, default=None, help="Specific dtype (e.g., int32, float64)")
-    parser.add_argument("--iterations", type=int, default=50, help="Benchmark iterations")
-    parser.add_argument("--quick", action="store_true", help="Quick run (10 iterations, common types only)")
+    parser.add_argument("--iterations", type=int, default=50,
+                        help="With --fixed: timed iterations per op")
+    parser.add_argument("--quick", action="store_true",
+                        help="Quick run (looser CI / 10 fixed iterations, common types only)")
+    parser.add_argument("--fixed", action="store_true",
+                        help="Legacy fixed warmup/iterations loop instead of the adaptive engine")
+    parser.add_argument("--ci-width", type=float, default=None,
+                        help="Adaptive: stop when the median's 95%% CI spans this fraction of it (default 0.02)")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="Adaptive: time budget per op in seconds (default 2.0)")
+    parser.add_argument("--target-sample-ms", type=float, default=None,
+                        help="Adaptive: minimum duration of one timed sample (default 2.0)")
+    parser.add_argument("--no-samples", action="store_true",
+                        help="Drop the raw per-sample times (samples_ns); percentiles/histogram are kept")
+    parser.add_argument("--operand-cache", type=str, default=None,
+                        help="Persist operands as .npy in DIR and memory-map them back "
+                             f"(also read by the C# harness via {OPERAND_CACHE_ENV})")
+    parser.add_argument("--cache-mode", choices=["warm", "cold", "both"], default="warm",
+                        help="warm: back-to-back calls (default); cold: evict the caches before "
+                             "every sample; both: time each op both ways")
+    parser.add_argument("--blas-threads", type=str, default="1,2,4,all",
+                        help="BLAS thread counts to sweep for BLAS-backed ops (dot, matmul), "
+                             "e.g. '1,all'; 'none' keeps the inherited threading (needs threadpoolctl)")
+    parser.add_argument("--peak-gbps", type=float, default=None,
+                        help="Machine bandwidth for %%peak (default: measured STREAM-style at startup)")
+    parser.add_argument("--no-stream", action="store_true",
+                        help="Skip the STREAM measurement (GB/s is still reported, %%peak is not)")
     parser.add_argument("--json", action="store_true", help="Output JSON")
-    parser.add_argument("--output", type=str, default=None, help="Output JSON to file")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Output JSON to file (*.jsonl: one row per line, appended as each cell finishes)")
+    parser.add_argument("--resume", action="store_true",
+                        help="With a .jsonl --output: keep its rows and skip the (suite, op, dtype, N) keys already in it")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run each (suite, dtype, N) cell in a fresh process pinned to its own core")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="With --isolate: number of cells timed in parallel (one core each)")
+    parser.add_argument("--cpus", type=str, default=None,
+                        help="With --isolate: CPU list to pin workers to, e.g. '2-17' (default: affinity mask)")
     args = parser.parse_args()
 
+    policy = TimingPolicy(adaptive=not args.fixed, keep_samples=not args.no_samples)
     if args.quick:
         args.iterations = 10
+        policy.ci_rel_width, policy.budget_s = 0.05, 0.5
+    if args.ci_width is not None:
+        policy.ci_rel_width = args.ci_width
+    if args.budget is not None:
+        policy.budget_s = args.budget
+    if args.target_sample_ms is not None:
+        policy.target_sample_ms = args.target_sample_ms
+    configure_timing(policy)
+
+    if args.operand_cache:
+        os.environ[OPERAND_CACHE_ENV] = os.path.abspath(args.operand_cache)
+
+    # "all" = the physical cores this process may use (of the --cpus pool, when one is given),
+    # the set an isolated BLAS cell is pinned to.
+    cores = len(physical_cores(parse_cpu_list(args.cpus) if args.cpus else available_cpus()))
+    configure_blas_threads(parse_thread_counts(args.blas_threads, cores))
+    configure_cache_modes(["warm", "cold"] if args.cache_mode == "both" else [args.cache_mode])
+
+    streaming = bool(args.output) and args.output.endswith(".jsonl")
+    if args.resume and not streaming:
+        parser.error("--resume needs a .jsonl --output")
+    prior: List[dict] = []
+    if streaming:
+        if args.resume and os.path.exists(args.output):
+            prior = load_result_rows(args.output)
+            configure_done_keys(result_key(r) for r in prior)
+        elif os.path.exists(args.output):
+            os.remove(args.output)      # a fresh run never appends to an old stream
 
     if args.size and args.size != "all":
         args.n = ARRAY_SIZES[args.size]
@@ -1246,27 +1539,69 @@ def main():
     print(f"\nNumPy {np.__version__}")
     print(f"Python {sys.version.split()[0]}")
     print(f"Array size: N = {args.n:,}")
-    print(f"Iterations: {args.iterations}")
+    if policy.adaptive:
+        print(f"Timing: adaptive (sample >= {policy.target_sample_ms} ms, median CI <= "
+              f"{policy.ci_rel_width:.0%}, budget {policy.budget_s} s/op)")
+    else:
+        print(f"Iterations: {args.iterations}")
     print(f"Types: {dtypes_to_run}")
+    if "cold" in CACHE_MODES:
+        print(f"Cache: {'/'.join(CACHE_MODES)} (cold = evict {2 * llc_bytes() // 1024 ** 2} MB "
+              "before each single-call sample)")
+    if BLAS_THREADS and threadpool_limits is None:
+        print("BLAS threads: inherited (pip install threadpoolctl to sweep "
+              f"{BLAS_THREADS})")
+        configure_blas_threads(None)
+    elif BLAS_THREADS:
+        print(f"BLAS threads: sweep {BLAS_THREADS} over {', '.join(blas_libraries()) or 'no BLAS pool'}")
 
     # Sizes to sweep: --size all (or --cache-sizes) runs the three cache-tier sizes in one
     # invocation so a single JSON carries all three; otherwise the single resolved args.n.
-    if args.cache_sizes or args.size == "all":
+    if args.sizes:
+        sizes_to_run = [int(s) for s in args.sizes.split(",") if s.strip()]
+    elif args.cache_sizes or args.size == "all":
         sizes_to_run = [ARRAY_SIZES["small"], ARRAY_SIZES["medium"], ARRAY_SIZES["large"]]
     else:
         sizes_to_run = [args.n]
 
     print(f"Sizes to run: {[f'{n:,}' for n in sizes_to_run]}")
 
+    peak_gbps = args.peak_gbps
+    if peak_gbps is None and not args.no_stream:
+        stream = measure_stream_bandwidth()
+        peak_gbps = max(stream.values())
+        print("STREAM (1 core): " + ", ".join(f"{k} {v:.1f} GB/s" for k, v in stream.items()))
+
+    sink = JsonlSink(args.output) if streaming else None
+    if prior:
+        print(f"Resume: {len(prior)} rows already in {args.output} are skipped")
+
+    def on_cell(rows: List[BenchmarkResult]):
+        annotate_bandwidth(rows, peak_gbps)
+        if sink:
+            sink.write(rows)
+
     all_results = []
-    for n in sizes_to_run:
-        print(f"\n{'#'*64}\n#  ARRAY SIZE  N = {n:,}\n{'#'*64}")
-        all_results.extend(run_suites(n, args.suite, dtypes_to_run, args.iterations))
+    if args.isolate:
+        cpus = parse_cpu_list(args.cpus) if args.cpus else None
+        all_results = run_isolated(selected_cells(args.suite, dtypes_to_run), sizes_to_run,
+                                   args.iterations, workers=args.workers, cpus=cpus, on_cell=on_cell)
+    else:
+        for n in sizes_to_run:
+            print(f"\n{'#'*64}\n#  ARRAY SIZE  N = {n:,}\n{'#'*64}")
+            all_results.extend(run_suites(n, args.suite, dtypes_to_run, args.iterations, on_cell))
+    annotate_bandwidth(all_results, peak_gbps)
+    fields = BenchmarkResult.__dataclass_fields__
+    all_results = [BenchmarkResult(**{k: v for k, v in r.items() if k in fields})
+                   for r in prior] + all_results
+    print_roofline(all_results)
 
     # Output
     if args.json or args.output:
         json_output = json.dumps([asdict(r) for r in all_results], indent=2)
-        if args.output:
+        if streaming:
+            print(f"\nJSONL results streamed to: {args.output}")
+        elif args.output:
             with open(args.output, 'w') as f:
                 f.write(json_output)
             print(f"\nJSON results written to: {args.output}")
@@ -1,18 +1,15 @@
-import numpy as np, time, sys
 # cast_matrix_bench.py — NumPy side. Phase 0 of CAST_BEAT_NUMPY_PLAN.md.
 # For every src dtype x layout x dst dtype at 1M, times v.astype(dst, copy=True).
 # Output key: 1M|{src}|{layout}|{dst}\t{ms}  (identical keys to the C# side).
 # Decimal has no NumPy dtype -> omitted (any pair touching 'dec' is NS-only).
 # char -> uint16 (NumSharp Char is a 2-byte unsigned numeric).
+import os
+import sys
 
-def best_ms(f, it, wm, rd):
-    for _ in range(wm): f()
-    best = float('inf')
-    for _ in range(rd):
-        t = time.perf_counter()
-        for _ in range(it): f()
-        best = min(best, (time.perf_counter() - t) / it)
-    return best * 1000.0
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+import bench_timing as bt  # noqa: E402
 
 R, C = 1000, 1000
 it, wm, rd = 20, 5, 3
@@ -42,8 +39,8 @@ for sn, sdt in DTYPES:
         for dn, ddt in DTYPES:
             try:
                 v.astype(ddt, copy=True)
-                ms = best_ms(lambda v=v, ddt=ddt: v.astype(ddt, copy=True), it, wm, rd)
-                out.append(f"1M|{sn}|{lay}|{dn}\t{ms:.6g}")
+                ms = bt.time_ms(lambda v=v, ddt=ddt: v.astype(ddt, copy=True), it, wm, rd)
+                out.append(bt.fmt_row(f"1M|{sn}|{lay}|{dn}", ms))
             except Exception as e:
                 sys.stderr.write(f"cast {sn}/{lay}/{dn}: {type(e).__name__}: {e}\n")
 print("\n".join(out))
@@ -137,7 +137,7 @@ def main():
     md, rows = render(ns, npy)
 
     with open(MD, "w", encoding="utf-8") as f:
-        f.write(md)
+        f.write(md + bc.failures_md())
     with open(TSV, "w", encoding="utf-8") as f:
         f.write("key\tns_ms\tnp_ms\n")
         for (src, lay, dst, nm, nv, _) in rows:
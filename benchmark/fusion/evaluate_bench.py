@@ -1,8 +1,12 @@
 # evaluate_bench.py — NumPy absolutes for the Wave 6.1 fusion gate (same box).
-import time
+import os
+import sys
 
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+import bench_timing as bt  # noqa: E402
+
 N = 4_000_000
 a = np.arange(N, dtype=np.float64) + 1.0
 b = (np.arange(N, dtype=np.float64) % 977.0) + 2.0
@@ -13,12 +17,8 @@ ai = np.arange(N, dtype=np.int32)
 
 
 def best(fn, rounds=9):
-    out = float("inf")
-    for _ in range(rounds):
-        t0 = time.perf_counter()
-        fn()
-        out = min(out, (time.perf_counter() - t0) * 1000)
-    return out
+    # Single-call rounds with a collection before each, as evaluate_bench.cs's Best().
+    return bt.time_ms(fn, 1, 0, rounds, collect=True)
 
 
 # warmup
@@ -26,7 +26,7 @@ _ = a * b + c
 _ = (a - b) / (a + b)
 _ = np.sum(a * b)
 
-print(f"numpy {np.__version__}, 4M float64, best of 9:")
+print(f"numpy {np.__version__}, 4M float64, {bt.ESTIMATOR} of 9:")
 print(f"  a*b+c       {best(lambda: a * b + c):7.2f} ms")
 print(f"  (a-b)/(a+b) {best(lambda: (a - b) / (a + b)):7.2f} ms")
 print(f"  sum(a*b)    {best(lambda: np.sum(a * b)):7.2f} ms")
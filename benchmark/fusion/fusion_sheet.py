@@ -55,7 +55,7 @@ def main():
           "operands?), not a dtype/layout matrix — so reported as-is.\n\n"
           "```\n" + body + "\n```\n")
     with open(MD, "w", encoding="utf-8") as f:
-        f.write(md)
+        f.write(md + bc.failures_md())
     bc.log(f"[fusion] -> {os.path.relpath(MD, REPO)}")
     print(md)
 
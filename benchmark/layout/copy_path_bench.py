@@ -1,13 +1,11 @@
-import numpy as np, time, sys
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+import bench_timing as bt  # noqa: E402
 
-def best_ms(f, it, wm, rd):
-    for _ in range(wm): f()
-    best=float('inf')
-    for _ in range(rd):
-        t=time.perf_counter()
-        for _ in range(it): f()
-        best=min(best,(time.perf_counter()-t)/it)
-    return best*1000.0
 def pick(n): return (200,30,3) if n<=100_000 else (40,8,3)
 
 SIZES=[("100K",316,316),("1M",1000,1000)]
@@ -36,7 +34,7 @@ for tag,R,C in SIZES:
             v=layout(base,lay)
             try:
                 np.positive(v)
-                out.append(f"{tag}|{dn}|{lay}|pos\t{best_ms(lambda v=v: np.positive(v), it,wm,rd):.6g}")
+                out.append(bt.fmt_row(f"{tag}|{dn}|{lay}|pos", bt.time_ms(lambda v=v: np.positive(v), it,wm,rd)))
             except Exception as e:
                 sys.stderr.write(f"{tag}|{dn}|{lay}: {type(e).__name__}\n")
 print("\n".join(out))
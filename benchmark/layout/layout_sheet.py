@@ -104,7 +104,7 @@ def main():
             "100K + 1M elements, best-of-rounds.\n")
     md = head + "\n" + "\n".join(blocks)
     with open(MD, "w", encoding="utf-8") as f:
-        f.write(md)
+        f.write(md + bc.failures_md())
     with open(TSV, "w", encoding="utf-8") as f:
         f.write("bench\tkey\tns_ms\tnp_ms\n")
         for stem, key, nm, nv in tsv_rows:
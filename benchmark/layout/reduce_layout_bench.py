@@ -1,13 +1,11 @@
-import numpy as np, time, sys
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+import bench_timing as bt  # noqa: E402
 
-def best_ms(f, iters, warm, rounds):
-    for _ in range(warm): f()
-    best = float('inf')
-    for _ in range(rounds):
-        t = time.perf_counter()
-        for _ in range(iters): f()
-        best = min(best, (time.perf_counter()-t)/iters)
-    return best*1000.0
 
 def pick(n):
     return (200,30,3) if n <= 100_000 else (15,4,2)
@@ -40,8 +38,8 @@ for tag,R,C in SIZES:
                 for axis in (0,1):
                     key = f"{tag}|{dname}|{lay}|{op}|ax{axis}"
                     try:
-                        ms = best_ms(lambda fn=fn,v=v,axis=axis: fn(v,axis=axis), iters,warm,rounds)
-                        out.append(f"{key}\t{ms:.6g}")
+                        ms = bt.time_ms(lambda fn=fn,v=v,axis=axis: fn(v,axis=axis), iters,warm,rounds)
+                        out.append(bt.fmt_row(key, ms))
                     except Exception as e:
                         sys.stderr.write(f"{key}: {type(e).__name__}\n")
 print("\n".join(out))
@@ -9,9 +9,12 @@
 # =============================================================================
 import os
 import sys
-import time
+
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+import bench_timing as bt  # noqa: E402
+
 SECTION = os.environ.get("NPYITER_SECTION", "all").strip().lower()
 
 
@@ -29,20 +32,8 @@ def check(ok, what):
         print(f"  CORRECTNESS FAIL: {what}", file=sys.stderr)
 
 
-def best_ms(body, iters, warm, rounds):
-    for _ in range(warm):
-        body()
-    best = float("inf")
-    for _ in range(rounds):
-        t0 = time.perf_counter()
-        for _ in range(iters):
-            body()
-        best = min(best, (time.perf_counter() - t0) * 1000.0 / iters)
-    return best
-
-
-def row(id_, ms):
-    print(f"{id_}\t{ms!r}")
+best_ms = bt.time_ms
+row = bt.row
 
 
 def pick(n):
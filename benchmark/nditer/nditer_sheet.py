@@ -2,9 +2,11 @@
 # =============================================================================
 # nditer_sheet.py — THE canonical NDIter benchmark orchestrator + renderer.
 #
-# Runs every section of nditer_bench.{cs,py} (NumSharp vs NumPy), each in its
-# own short-lived process so the intermittent AV under heavy mixed load can't
-# void the run (NumSharp sections retry up to 4x on a crash). Merges both sides
+# Runs every section of nditer_bench.{cs,py} (NumSharp vs NumPy). NumSharp
+# sections run in the shared bench host (benchmark/scripts/bench_host.cs, built
+# once, JIT-warm across sections); the intermittent AV under heavy mixed load
+# kills only the host, which is restarted and the section retried up to 4x
+# (NUMSHARP_BENCH_HOST=0: one `dotnet run` process per section). Merges both sides
 # and renders ONE results sheet: per-tier / per-category / per-family operation
 # matrix, construction-vs-nditer, chunk-width dispatch, pathology canaries, and
 # the NumSharp-only dividends. Saves the sheet to nditer_results.md and the raw
@@ -29,6 +31,8 @@ PY = os.path.join(HERE, "nditer_bench.py")
 CORE_CSPROJ = os.path.join(REPO, "src", "NumSharp.Core", "NumSharp.Core.csproj")
 TSV = os.path.join(HERE, "nditer_results.tsv")
 SHEET = os.path.join(HERE, "nditer_results.md")
+sys.path.insert(0, os.path.join(REPO, "benchmark", "scripts"))
+import bench_common as bc  # noqa: E402
 
 SECTIONS = ["elementwise", "reductions", "selection", "copycast", "indexmath",
             "dtypes", "dividends", "construction", "chunkwidth", "pathology"]
@@ -92,6 +96,13 @@ NP_TIMEOUT = 240
 
 
 def run_ns(section, retries=4):
+    if bc.host_enabled():
+        code, out = bc.shared_host(REPO).run(CS, env={"NPYITER_SECTION": section}, timeout=NS_TIMEOUT,
+                                             retries=retries, label=f"NS {section}")
+        if code == 0:
+            return parse(out)
+        log(f"    NS {section}: FAILED after {retries} attempts — marked NA (ignored)")
+        return {}
     with open(CS, encoding="utf-8") as f:
         src = f.read()
     # Portability: the .cs pins #:project to an absolute Windows path so it can be
@@ -101,30 +112,22 @@ def run_ns(section, retries=4):
                       CORE_CSPROJ.replace(os.sep, "/"))
     env = {**os.environ, "NPYITER_SECTION": section, **NS_ENV_EXTRA}
     for attempt in range(1, retries + 1):
-        try:
-            p = subprocess.run(["dotnet", "run", "-c", "Release", "-"], input=src,
-                               capture_output=True, text=True, cwd=REPO, env=env, timeout=NS_TIMEOUT)
-        except subprocess.TimeoutExpired:
-            log(f"    NS {section}: attempt {attempt}/{retries} TIMED OUT ({NS_TIMEOUT}s) — retrying")
-            continue
-        if p.returncode == 0:
-            return parse(p.stdout)
-        log(f"    NS {section}: attempt {attempt}/{retries} crashed (exit {p.returncode}) — retrying")
+        out, rec = bc.run_bounded(["dotnet", "run", "-c", "Release", "-"], f"NS {section}", input=src,
+                                  cwd=REPO, env=env, timeout=NS_TIMEOUT, dotnet=True)
+        if rec is None:
+            return parse(out)
+        log(f"    NS {section}: attempt {attempt}/{retries} failed ({rec['kind']}) — retrying")
+    bc.record_failure(rec)
     log(f"    NS {section}: FAILED after {retries} attempts — marked NA (ignored)")
     return {}
 
 
 def run_np(section):
-    env = {**os.environ, "NPYITER_SECTION": section}
-    try:
-        p = subprocess.run([sys.executable, PY], capture_output=True, text=True,
-                           cwd=REPO, env=env, timeout=NP_TIMEOUT)
-    except subprocess.TimeoutExpired:
-        log(f"    NumPy {section}: TIMED OUT ({NP_TIMEOUT}s) — omitted")
-        return {}
-    if p.returncode != 0:
-        log(f"    NumPy {section}: exit {p.returncode}\n{p.stderr[-400:]}")
-    return parse(p.stdout)
+    out, rec = bc.run_bounded([sys.executable, PY], f"NumPy {section}", cwd=REPO,
+                              env={**os.environ, "NPYITER_SECTION": section}, timeout=NP_TIMEOUT)
+    if rec is not None:
+        bc.record_failure(rec)
+    return parse(out)
 
 
 def write_tsv(pairs):
@@ -364,7 +367,7 @@ def main():
 
     sheet = render(pairs)
     with open(SHEET, "w", encoding="utf-8") as f:
-        f.write("```\n" + sheet + "\n```\n")
+        f.write("```\n" + sheet + "\n```\n" + bc.failures_md())
     log(f"[sheet] -> {os.path.relpath(SHEET, REPO)}")
     print(sheet)
 
@@ -1,20 +1,14 @@
-import numpy as np, time, sys
 # operand_bench.py — NumPy twin of operand_bench.cs (identical keys).
 # Layout classes the op×layout×dtype matrix omits: 1-D contig/strided/reversed,
 # scalar operand, mixed operand layouts (C+F, C+T), binary broadcast (row+col),
 # column-broadcast unary.
+import os
+import sys
 
+import numpy as np
 
-def best(f, it, wm, rd):
-    for _ in range(wm):
-        f()
-    b = float("inf")
-    for _ in range(rd):
-        t = time.perf_counter()
-        for _ in range(it):
-            f()
-        b = min(b, (time.perf_counter() - t) / it)
-    return b * 1000.0
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+import bench_timing as bt  # noqa: E402
 
 
 N1, R, C = 1_000_000, 1000, 1000
@@ -49,7 +43,7 @@ for dn, dt in DTYPES:
     for k, fn in cases.items():
         try:
             fn()
-            out.append(f"{k}|{dn}\t{best(fn, it, wm, rd):.6g}")
+            out.append(bt.fmt_row(f"{k}|{dn}", bt.time_ms(fn, it, wm, rd)))
         except Exception as e:
             sys.stderr.write(f"{k}|{dn}: {type(e).__name__}: {e}\n")
 
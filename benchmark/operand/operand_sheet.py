@@ -90,7 +90,7 @@ def main():
 
     md = render(rows)
     with open(MD, "w", encoding="utf-8") as f:
-        f.write(md)
+        f.write(md + bc.failures_md())
     with open(TSV, "w", encoding="utf-8") as f:
         f.write("key\tns_ms\tnp_ms\n")
         for k, nm, nv, _ in rows:
@@ -25,8 +25,17 @@ Design notes
   nanosecond-microbenchmark invocation ramp, which would make the full run take days).
   Because the config is baked into the assembly, this orchestrator passes only ``--filter``
   to ``dotnet run`` — never ``--job``.
-* Per-suite C# runs are independent: each benchmark class exports its own JSON, so a crash
-  mid-run keeps every completed class. Re-running a single suite is cheap.
+* Per-suite C# runs are independent: each benchmark class exports its own JSON into the
+  suite's own ``--artifacts`` dir, so a crash mid-run keeps every completed class.
+  Re-running a single suite is cheap.
+* The run is a task graph (build -> suites/subsystems -> merge -> assemble -> snapshot).
+  ``--jobs N`` overlaps independent tasks, each pinned to disjoint physical cores;
+  ``results/<ts>/tasks.json`` records every task's wall time.
+* A noise gate probes the machine and times a calibration kernel around every timed suite;
+  suites timed while it drifted are re-run, then flagged (``results/<ts>/environment.json``).
+* Subsystem bench processes run under memory/CPU/wall limits (``NUMSHARP_BENCH_MEM_MB``,
+  ``NUMSHARP_BENCH_CPU_S``); a section that hits one is recorded — kind, limit, last key —
+  in ``results/<ts>/failures.jsonl`` and listed under its sheet.
 * NumPy side sweeps all three sizes in one invocation per suite (``--cache-sizes``); each
   result carries its own ``n``, which the merge keys on.
 
@@ -39,16 +48,27 @@ Usage
   python run_benchmark.py --skip-python           # C# only (reuse existing numpy JSON)
   python run_benchmark.py --skip-nditer          # no NDIter section
   python run_benchmark.py --skip-layout --skip-cast --skip-fusion   # op matrix (+NDIter) only
-  python run_benchmark.py --quick                 # dev: 10 NumPy iterations (C# config fixed)
+  python run_benchmark.py --quick                 # dev: looser NumPy CI / budget (C# config fixed)
+  python run_benchmark.py --operand-cache .operands   # both sides time the same .npy inputs
+  python run_benchmark.py --cold                  # also time NumPy cold-cache (reported separately)
+  python run_benchmark.py --resume results/20260101-120000   # continue a killed run's NumPy sweep
+  python run_benchmark.py --jobs 6 --cpus 2-15     # overlap suites/subsystems on disjoint cores
+  python run_benchmark.py --incremental           # re-time only what changed since history/latest
+  python run_benchmark.py --noise-threshold 3     # stricter noise gate (calibration drift, %)
 """
 import argparse
 import json
+import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 
 HERE = Path(__file__).resolve().parent
 HISTORY_DIR = HERE / "history"
@@ -56,7 +76,6 @@ CSHARP_DIR = HERE / "NumSharp.Benchmark.CSharp"
 CSHARP_PROJ = CSHARP_DIR / "NumSharp.Benchmark.CSharp.csproj"
 PY_BENCH = HERE / "NumSharp.Benchmark.Python" / "numpy_benchmark.py"
 MERGE = HERE / "scripts" / "merge-results.py"
-ARTIFACTS = CSHARP_DIR / "BenchmarkDotNet.Artifacts" / "results"
 TFM = "net10.0"
 
 # NDIter iterator benchmark (benchmark/nditer) — a complementary harness with a
@@ -105,9 +124,143 @@ SUITES = {
 }
 
 
+# =============================================================================
+# Incremental runs
+# =============================================================================
+#
+# --incremental re-times only what the changed sources can affect. Changed files (git diff of
+# the working tree against the commit of benchmark/history/latest, plus untracked files) are
+# matched against IMPACT; every matching rule contributes its targets: comparison SUITES keys
+# and subsystem names. A changed NumSharp.Core file that matches no rule is assumed to affect
+# everything, while a file outside src/NumSharp.Core and benchmark/ (tests, docs) affects nothing.
+# Unaffected suites are carried from the snapshot's benchmark-report.json by the merge, and
+# unaffected subsystems keep the snapshot's rendered section.
+ALL = "*"
+SUBSYSTEMS = ("nditer", "layout", "operand", "cast", "fusion")
+CORE = r"src/NumSharp\.Core/"
+IMPACT = [
+    # Shared machinery: every kernel, iterator and allocation goes through these.
+    (CORE + r"(Backends/(Kernels|Unmanaged|Iterators)/|Backends/[^/]+\.cs$|Utilities/|Generics/"
+            r"|Primitives/|Operations/|GlobalUsings\.cs|NumSharp\.Core\.csproj)", [ALL]),
+    (CORE + r"Backends/Iterators/", ["nditer"]),
+    (CORE + r"(Casting/|Backends/Default/ArrayManipulation/Default\.Cast\.cs)", ["cast"]),
+    (CORE + r"(Creation/|Backends/Default/Allocation/)", ["creation"]),
+    (CORE + r"Creation/np\.(broadcast|are_broadcastable)", ["broadcast", "operand"]),
+    (CORE + r"Backends/Default/ArrayManipulation/Default\.Broadcasting\.cs", ["broadcast", "operand"]),
+    (CORE + r"(Manipulation/|Backends/Default/ArrayManipulation/)", ["manipulation", "layout"]),
+    (CORE + r"(Indexing/|View/|Selection/|Backends/Default/Indexing/)", ["slicing", "selection"]),
+    (CORE + r"APIs/np\.where\.cs", ["selection"]),
+    (CORE + r"(Sorting_Searching_Counting/|Backends/Default/Sorting/)", ["sorting"]),
+    (CORE + r"(Statistics/|Backends/Default/Statistics/)", ["statistics", "reduction"]),
+    (CORE + r"(LinearAlgebra/|Backends/Default/Math/BLAS/)", ["linalg"]),
+    (CORE + r"(Logic/|Backends/Default/Logic/)", ["logic", "comparison"]),
+    (CORE + r"(Math/|Backends/Default/Math/)", ["arithmetic", "unary", "reduction", "bitwise", "layout"]),
+    (CORE + r"(APIs/np\.(cumsum|cumprod|count_nonzero)\.cs)", ["reduction"]),
+    (CORE + r"(APIs/np\.evaluate\.cs|Backends/Default/Math/DefaultEngine\.Evaluate\.cs)", ["fusion"]),
+    (CORE + r"(RandomSampling|IO|Printing|Backends/Printing|Exceptions|Extensions|Assembly|DateTime64)", []),
+    # Untimed APIs. Any other APIs/ file (np.cs, np.multithreading.cs, ...) falls through to ALL.
+    (CORE + r"APIs/np\.(save|load|fromfile|tofile|finfo|iinfo|array2string)\.cs", []),
+    # Harness changes re-time what they harness.
+    (r"benchmark/NumSharp\.Benchmark\.(CSharp/(Infrastructure|Program)|Python/)", [ALL]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Arithmetic/", ["arithmetic"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Unary/", ["unary"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Reduction/", ["reduction"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Broadcasting/", ["broadcast"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Creation/", ["creation"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Manipulation/", ["manipulation"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Slicing/", ["slicing"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Comparison/", ["comparison"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Bitwise/", ["bitwise"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Logic/", ["logic"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Statistics/", ["statistics"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Sorting/", ["sorting"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/LinearAlgebra/", ["linalg"]),
+    (r"benchmark/NumSharp\.Benchmark\.CSharp/Benchmarks/Selection/", ["selection"]),
+    (r"benchmark/nditer/nditer_bench\.", ["nditer"]),
+    (r"benchmark/(layout|operand|cast|fusion)/\w+_bench\.", ["{0}"]),   # its own subsystem
+    (r"benchmark/scripts/bench_common\.py", ["layout", "operand", "cast", "fusion"]),
+]
+IMPACT_RE = [(re.compile(pattern), targets) for pattern, targets in IMPACT]
+
+
+def affected_targets(changed):
+    """Map changed repo-relative paths to the set of suites/subsystems to re-time."""
+    hit = set()
+    for path in changed:
+        matched = False
+        for rx, targets in IMPACT_RE:
+            m = rx.match(path)
+            if not m:
+                continue
+            matched = True
+            hit.update(t.format(*m.groups()) for t in targets)
+        if not matched and path.startswith("src/NumSharp.Core/"):
+            hit.add(ALL)
+    if ALL in hit:
+        return set(SUITES) | set(SUBSYSTEMS)
+    return hit
+
+
+def latest_snapshot():
+    """(snapshot dir, its git sha) of benchmark/history/latest, or (None, None)."""
+    latest = HISTORY_DIR / "latest"
+    if not latest.exists():
+        return None, None
+    snap = latest.resolve()
+    manifest = snap / "MANIFEST.md"
+    if manifest.exists():
+        m = re.search(r"\| Git HEAD \| `([0-9a-f]+)`", manifest.read_text(encoding="utf-8"))
+        if m:
+            return snap, m.group(1)
+    return snap, snap.name.rsplit("_", 1)[-1]
+
+
+def changed_files(since):
+    """Paths changed between `since` and the working tree, tracked or untracked."""
+    repo = HERE.parent
+    diff = subprocess.run(["git", "diff", "--name-only", since], cwd=repo,
+                          capture_output=True, text=True, check=True).stdout
+    untracked = subprocess.run(["git", "ls-files", "--others", "--exclude-standard"], cwd=repo,
+                               capture_output=True, text=True, check=True).stdout
+    return sorted(set(filter(None, (diff + untracked).splitlines())))
+
+
+# Set by the task scheduler for the thread running each task: where that task's subprocesses
+# log and which CPUs they are pinned to (parallel mode only).
+_task_ctx = threading.local()
+
+
+def pinned(cmd, cpus):
+    """`cmd` prefixed with ``taskset -c <cpus>`` (unchanged without cpus or taskset). The child
+    is pinned by exec rather than a preexec_fn, which is not safe from the scheduler's threads."""
+    if not cpus or not shutil.which("taskset"):
+        return list(cmd)
+    return ["taskset", "-c", ",".join(str(c) for c in sorted(cpus)), *cmd]
+
+
 def run(cmd, cwd=None, check=False):
-    print(f"\n$ {' '.join(str(c) for c in cmd)}", flush=True)
-    return subprocess.run([str(c) for c in cmd], cwd=str(cwd) if cwd else None, check=check)
+    cpus = getattr(_task_ctx, "cpus", None)
+    log = getattr(_task_ctx, "log", None)
+    line = f"\n$ {' '.join(str(c) for c in cmd)}"
+    if log is None:
+        print(line, flush=True)
+        return subprocess.run([str(c) for c in cmd], cwd=str(cwd) if cwd else None, check=check)
+    log.write(line + "\n")
+    log.flush()
+    return subprocess.run(pinned([str(c) for c in cmd], cpus), cwd=str(cwd) if cwd else None,
+                          check=check, stdout=log, stderr=subprocess.STDOUT)
+
+
+def read_jsonl(path):
+    """Rows of a numpy_benchmark.py JSONL stream, skipping a torn last line."""
+    rows = []
+    if path.exists():
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return rows
 
 
 def append_section(report_md, src_md, title):
@@ -128,10 +281,10 @@ def append_section(report_md, src_md, title):
     report_md.write_text(f"{existing}\n\n---\n\n## {title}\n\n{body}\n", encoding="utf-8")
 
 
-def run_matrix_subsystem(name, sheet, results_md, title, report_md, results_dir, skip_build):
-    """Run one matrix subsystem's *_sheet.py and append its rendered section to
-    the unified report. Crash-resilient: a failing subsystem just omits its
-    section (the sheet itself never raises into the orchestrator)."""
+def run_matrix_subsystem(name, sheet, results_md, results_dir, skip_build):
+    """Run one matrix subsystem's *_sheet.py and archive its rendered sheet.
+    Crash-resilient: a failing subsystem just leaves no section (the sheet itself
+    never raises into the orchestrator)."""
     print(f"\n=== {name} subsystem (benchmark/{name}) ===", flush=True)
     cmd = [sys.executable, str(sheet)]
     if skip_build:
@@ -142,7 +295,247 @@ def run_matrix_subsystem(name, sheet, results_md, title, report_md, results_dir,
         tsv = results_md.with_suffix(".tsv")
         if tsv.exists():
             shutil.copy(tsv, results_dir / tsv.name)
-    append_section(report_md, results_md, title)
+
+
+# =============================================================================
+# Task graph
+# =============================================================================
+#
+# The official run is a DAG: build -> {NumPy suites, C# suites, subsystem sheets} -> merge ->
+# assemble report -> snapshot. With --jobs 1 (default) tasks run one at a time in declaration
+# order, exactly like the old sequential script. With --jobs N independent tasks overlap:
+# each is pinned to its own disjoint set of physical cores, so a NumPy suite and a C# suite
+# never time on the same core, and tasks that share mutable state (MSBuild outputs of
+# NumSharp.Core) hold a named lock. Per-task wall times go to results/<ts>/tasks.json.
+
+@dataclass
+class Task:
+    name: str
+    fn: Callable[[], None]
+    deps: List[str] = field(default_factory=list)
+    cores: int = 1                  # physical cores reserved while it runs (parallel mode)
+    locks: Tuple[str, ...] = ()     # named resources held exclusively
+    critical: bool = False          # on failure, skip everything that depends on it
+    status: str = "pending"         # pending / running / ok / failed / skipped
+    cpus: Optional[List[int]] = None
+    start: float = 0.0
+    wall_s: float = 0.0
+    error: Optional[str] = None
+
+
+def physical_cores(cpus):
+    """One logical CPU per physical core (lowest-numbered SMT sibling), from sysfs."""
+    picked, seen = [], set()
+    for cpu in sorted(cpus):
+        try:
+            siblings = Path(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list").read_text().strip()
+        except OSError:
+            siblings = str(cpu)
+        if siblings not in seen:
+            seen.add(siblings)
+            picked.append(cpu)
+    return picked
+
+
+def parse_cpu_list(spec):
+    """'0-3,8' -> [0, 1, 2, 3, 8]."""
+    cpus = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        lo, _, hi = part.partition("-")
+        cpus.extend(range(int(lo), int(hi or lo) + 1))
+    return cpus
+
+
+def run_dag(tasks, jobs, pool, logs_dir):
+    """Run `tasks` respecting deps, locks and core reservations; at most `jobs` at once.
+
+    Ready tasks are started in declaration order (the first that fits wins), so --jobs 1
+    reproduces the sequential run. A task needing more cores than the pool has gets the
+    whole pool."""
+    by_name = {t.name: t for t in tasks}
+    free = list(pool)
+    held = set()
+    done = threading.Condition()
+    parallel = jobs > 1
+
+    def body(t):
+        _task_ctx.cpus = set(t.cpus) if (parallel and t.cpus) else None
+        _task_ctx.log = open(logs_dir / f"{t.name.replace(':', '-')}.log", "w") if parallel else None
+        try:
+            t.fn()
+            status, error = "ok", None
+        except BaseException as e:       # SystemExit/CalledProcessError from a task must not kill the run
+            status, error = "failed", f"{type(e).__name__}: {e}"
+        finally:
+            if _task_ctx.log:
+                _task_ctx.log.close()
+        with done:
+            t.status, t.error = status, error
+            t.wall_s = time.time() - t.start
+            free.extend(t.cpus or [])
+            held.difference_update(t.locks)
+            print(f"[{t.status:>6}] {t.name:<22} {t.wall_s:8.1f}s"
+                  + (f"  {t.error}" if t.error else ""), flush=True)
+            done.notify_all()
+
+    with done:
+        while any(t.status in ("pending", "running") for t in tasks):
+            for t in tasks:
+                if t.status != "pending":
+                    continue
+                deps = [by_name[d] for d in t.deps if d in by_name]
+                if any(d.critical and d.status in ("failed", "skipped") for d in deps):
+                    t.status, t.error = "skipped", "dependency failed"
+                    print(f"[skipped] {t.name}", flush=True)
+                    continue
+                if any(d.status in ("pending", "running") for d in deps):
+                    continue
+                if held & set(t.locks) or sum(x.status == "running" for x in tasks) >= jobs:
+                    continue
+                need = min(t.cores, len(pool)) if parallel else 0
+                if len(free) < need:
+                    continue
+                t.cpus = [free.pop(0) for _ in range(need)]
+                held.update(t.locks)
+                t.status, t.start = "running", time.time()
+                if parallel:
+                    print(f"[ start] {t.name:<22} cpus {t.cpus}", flush=True)
+                threading.Thread(target=body, args=(t,), daemon=True).start()
+                if not parallel:
+                    break
+            done.wait(timeout=1.0)
+
+
+def write_task_report(tasks, path, t0):
+    path.write_text(json.dumps({
+        "wall_s": round(time.time() - t0, 1),
+        "tasks": [{"name": t.name, "deps": t.deps, "status": t.status, "cores": t.cpus,
+                   "locks": list(t.locks), "start_s": round(t.start - t0, 1) if t.start else None,
+                   "wall_s": round(t.wall_s, 1), "error": t.error} for t in tasks],
+    }, indent=2))
+    ran = [t for t in tasks if t.start]
+    busy = sum(t.wall_s for t in ran)
+    print(f"\nTasks: {len(ran)} ran, {busy:.0f}s of task time in {time.time() - t0:.0f}s wall "
+          f"({busy / max(time.time() - t0, 1e-9):.1f}x overlap) -> {path}")
+
+
+# =============================================================================
+# Noise gate
+# =============================================================================
+#
+# scripts/noise_gate.py probes the machine (cpufreq governor, turbo, load average, thermal
+# throttle counters, competing processes) and times a fixed calibration kernel. One probe
+# runs before the first task (the baseline), and one runs before and after every timed suite
+# task, pinned to that task's cores like the suite itself. A suite is re-run, up to
+# --noise-reruns times, then flagged, when its calibration moved past --noise-threshold (its
+# before vs after, or either one vs the baseline) or the CPU throttled while it ran.
+# results/<ts>/environment.json keeps every probe; the report gets a "Noise gate" section.
+NOISE = HERE / "scripts" / "noise_gate.py"
+
+
+class NoiseGate:
+    def __init__(self, out_dir, threshold, reruns):
+        self.out_dir = out_dir
+        self.threshold = threshold
+        self.reruns = reruns
+        self.preflight = None
+        self.post = None
+        self.suites = {}
+        self._lock = threading.Lock()
+        # drift() lives with the probe it compares; imported here, not at module load, because
+        # noise_gate needs numpy and the gate is optional.
+        if str(NOISE.parent) not in sys.path:
+            sys.path.insert(0, str(NOISE.parent))
+
+    def probe(self, tag):
+        path = self.out_dir / f"{tag.replace(':', '-')}.json"
+        run([sys.executable, str(NOISE), "--probe", "--out", str(path),
+             "--exclude-tree", str(os.getpid())], check=False)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def start(self):
+        self.preflight = self.probe("preflight")
+        if not self.preflight:
+            print("[noise] pre-flight probe failed; suites are not gated")
+            return
+        for w in self.preflight["warnings"]:
+            print(f"[noise] {w}")
+        cal = self.preflight["calibration"]
+        print(f"[noise] baseline: compute {cal['compute_ms']:.4f} ms, memory {cal['memory_ms']:.3f} ms, "
+              f"threshold {self.threshold:.0%}")
+
+    def assess(self, before, after):
+        from noise_gate import drift as calibration_drift
+        cal = lambda p: p.get("calibration") if p else None  # noqa: E731
+        base, b, a = cal(self.preflight), cal(before), cal(after)
+        drifts = [d for d in (calibration_drift(b, a), calibration_drift(base, b),
+                              calibration_drift(base, a)) if d is not None]
+        drift = max(drifts) if drifts else None
+        throttled = bool(before and after and before["throttle"] is not None
+                         and after["throttle"] is not None and after["throttle"] > before["throttle"])
+        why = []
+        if drift is not None and drift > self.threshold:
+            why.append(f"calibration drift {drift:.1%}")
+        if throttled:
+            why.append("thermal throttling")
+        return {"before": before, "after": after, "drift": drift, "throttled": throttled,
+                "noisy": bool(why), "why": ", ".join(why)}
+
+    def gated(self, name, fn, reset=None):
+        """fn wrapped in before/after probes; re-run (after reset()) while noisy, then flag."""
+        if not self.preflight:
+            return fn
+
+        def go():
+            attempts = []
+            for attempt in range(self.reruns + 1):
+                before = self.probe(f"{name}-{attempt}-before")
+                fn()
+                rec = self.assess(before, self.probe(f"{name}-{attempt}-after"))
+                attempts.append(rec)
+                if not rec["noisy"]:
+                    break
+                if attempt < self.reruns:
+                    print(f"[noise] {name}: {rec['why']} — re-running", flush=True)
+                    if reset:
+                        reset()
+            last = attempts[-1]
+            if last["noisy"]:
+                print(f"[noise] {name}: FLAGGED ({last['why']})", flush=True)
+            with self._lock:
+                self.suites[name] = {"attempts": attempts, "flagged": last["noisy"],
+                                     "drift": last["drift"], "why": last["why"]}
+        return go
+
+    def write(self, path):
+        path.write_text(json.dumps({
+            "threshold": self.threshold, "reruns": self.reruns, "preflight": self.preflight,
+            "post": self.post, "suites": dict(sorted(self.suites.items())),
+        }, indent=2), encoding="utf-8")
+
+    def section(self):
+        """Markdown for the report: pre-flight findings and each suite's final drift."""
+        if not self.preflight:
+            return ""
+        fp = self.preflight
+        L = ["\n\n---\n\n## Noise gate\n",
+             f"_Calibration kernel before/after every timed suite; drift above "
+             f"{self.threshold:.0%} (or thermal throttling) re-runs the suite up to "
+             f"{self.reruns}× and then flags it ⚠. Probes: `environment.json`._\n",
+             f"- Governor: {'/'.join(fp['governor']) if fp['governor'] else 'n/a'} · "
+             f"turbo: {'n/a' if fp['turbo'] is None else 'on' if fp['turbo'] else 'off'} · "
+             f"load: {', '.join(f'{x:.2f}' for x in fp['load']) if fp['load'] else 'n/a'}"]
+        L += [f"- ⚠ {w}" for w in fp["warnings"]]
+        flagged = [n for n, r in self.suites.items() if r["flagged"]]
+        L.append(f"- Flagged: {len(flagged)} of {len(self.suites)} suite runs\n")
+        L += ["| Suite | Runs | Drift | |", "|---|--:|--:|---|"]
+        for n, r in sorted(self.suites.items()):
+            d = "n/a" if r["drift"] is None else f"{r['drift']:.1%}"
+            L.append(f"| {n} | {len(r['attempts'])} | {d} | {'⚠ ' + r['why'] if r['flagged'] else 'ok'} |")
+        return "\n".join(L) + "\n"
 
 
 def main():
@@ -152,7 +545,7 @@ def main():
     ap.add_argument("--skip-csharp", action="store_true", help="Skip the C# benchmarks")
     ap.add_argument("--skip-python", action="store_true", help="Skip the NumPy benchmarks")
     ap.add_argument("--skip-build", action="store_true", help="Reuse the existing Release build")
-    ap.add_argument("--quick", action="store_true", help="Dev: fewer NumPy iterations")
+    ap.add_argument("--quick", action="store_true", help="Dev: looser NumPy CI and smaller time budget")
     ap.add_argument("--skip-nditer", action="store_true",
                     help="Skip the NDIter iterator benchmark (benchmark/nditer)")
     ap.add_argument("--skip-layout", action="store_true",
@@ -163,70 +556,139 @@ def main():
                     help="Skip the Fusion gate (benchmark/fusion)")
     ap.add_argument("--skip-operand", action="store_true",
                     help="Skip the Operand-layout subsystem (benchmark/operand)")
+    ap.add_argument("--operand-cache", type=Path, default=None,
+                    help="Shared .npy operand dir: NumPy writes/maps it, the C# harness loads the same "
+                         "random/positive arrays (NUMSHARP_OPERAND_CACHE)")
+    ap.add_argument("--sizes", type=str, default=None,
+                    help="Comma-separated subset of the sizes to time on both sides, e.g. 1000,100000 "
+                         "(default: all three cache tiers)")
+    ap.add_argument("--cold", action="store_true",
+                    help="Also time every NumPy op with caches evicted per sample (--cache-mode both)")
+    ap.add_argument("--resume", type=Path, default=None, metavar="RESULTS_DIR",
+                    help="Reuse a previous results/<ts> dir: NumPy rows already in its "
+                         "numpy-<suite>.jsonl streams are kept and skipped (the C# suites rerun)")
+    ap.add_argument("--incremental", action="store_true",
+                    help="Re-time only the suites/subsystems affected by files changed since the "
+                         "history/latest snapshot; carry the rest from it")
+    ap.add_argument("--since", type=str, default=None, metavar="REV",
+                    help="With --incremental: diff against REV instead of the snapshot's commit")
+    ap.add_argument("--jobs", type=int, default=1,
+                    help="Tasks run in parallel, each pinned to its own physical cores (default 1 = sequential)")
+    ap.add_argument("--cpus", type=str, default=None,
+                    help="With --jobs: CPU list the tasks are pinned within, e.g. '2-17' (default: affinity mask)")
+    ap.add_argument("--noise-threshold", type=float, default=5.0, metavar="PCT",
+                    help="Re-run/flag a suite whose calibration kernel drifted more than PCT%% (default 5)")
+    ap.add_argument("--noise-reruns", type=int, default=1,
+                    help="Re-runs of a noisy suite before it is flagged (default 1)")
+    ap.add_argument("--no-noise-gate", action="store_true",
+                    help="Skip the environment probes and calibration runs")
     ap.add_argument("--no-history", action="store_true",
                     help="Skip writing the committable benchmark/history/<date>_<sha>/ snapshot + latest symlink")
     args = ap.parse_args()
 
+    # Incremental: narrow the suites/subsystems to what the changed sources affect; the rest is
+    # carried from the snapshot (suite rows by the merge, subsystem sections by assemble).
+    carry_snap, carry_sha, carried = None, None, set()
+    if args.incremental:
+        carry_snap, carry_sha = latest_snapshot()
+        since = args.since or carry_sha
+        if not since:
+            ap.error("--incremental needs benchmark/history/latest or --since REV")
+        changed = changed_files(since)
+        targets = affected_targets(changed)
+        print(f"Incremental: {len(changed)} file(s) changed since {since}; "
+              f"re-timing {sorted(targets) or 'nothing'}")
+        carried = {x for x in list(args.suites) + list(SUBSYSTEMS) if x not in targets}
+        args.suites = [s for s in args.suites if s in targets]
+
     ts = datetime.now().strftime("%Y%m%d-%H%M%S")
-    results_dir = HERE / "results" / ts
+    results_dir = args.resume.resolve() if args.resume else HERE / "results" / ts
     results_dir.mkdir(parents=True, exist_ok=True)
     csharp_out = results_dir / "csharp"
     csharp_out.mkdir(exist_ok=True)
     numpy_json = results_dir / "numpy-results.json"
+    numpy_stream = results_dir / "numpy-results.jsonl"
     print(f"Results -> {results_dir}")
+    if args.sizes:
+        # Read by OfficialBenchmarkConfig (a BDN filter on the N parameter).
+        os.environ["NUMSHARP_BENCH_SIZES"] = args.sizes
+    # bench_common.record_failure appends here from every sheet process.
+    os.environ["NUMSHARP_BENCH_FAILURES"] = str(results_dir / "failures.jsonl")
+    if args.operand_cache:
+        # Inherited by numpy_benchmark.py (and its workers) and by the BDN process.
+        os.environ["NUMSHARP_OPERAND_CACHE"] = str(args.operand_cache.resolve())
 
     t0 = time.time()
+    report_md = results_dir / "benchmark-report.md"
+    tasks: List[Task] = []
+    gate = None
+    if not args.no_noise_gate:
+        gate = NoiseGate(results_dir / "noise", args.noise_threshold / 100.0, args.noise_reruns)
+        gate.start()
 
     # 1. Build the C# benchmark project (Release).
-    if not args.skip_csharp and not args.skip_build:
+    def build():
         run(["dotnet", "build", "-c", "Release", "-f", TFM, str(CSHARP_PROJ),
              "-v", "q", "--nologo", "-clp:NoSummary;ErrorsOnly", "-p:WarningLevel=0"], check=True)
 
-    # 2. NumPy: sweep all three sizes per suite, concatenate into one JSON.
-    if not args.skip_python:
-        merged = []
-        for s in args.suites:
-            tmp = results_dir / f"numpy-{s}.json"
-            cmd = [sys.executable, str(PY_BENCH), "--suite", s, "--cache-sizes", "--output", str(tmp)]
+    if not args.skip_csharp and not args.skip_build and args.suites:
+        tasks.append(Task("build", build, locks=("msbuild",), critical=True, cores=4))
+
+    # 2. NumPy: sweep all three sizes per suite. Each suite streams into its own JSONL as its
+    #    cells finish (--resume: rows already there from a killed run are skipped), so a crash
+    #    loses at most the cell in flight; merge reads their concatenation.
+    def numpy_suite(s):
+        def go():
+            stream = results_dir / f"numpy-{s}.jsonl"
+            cmd = [sys.executable, str(PY_BENCH), "--suite", s,
+                   *(["--sizes", args.sizes] if args.sizes else ["--cache-sizes"]),
+                   "--output", str(stream)]
+            if args.resume:
+                cmd.append("--resume")
             if args.quick:
                 cmd.append("--quick")
+            if args.cold:
+                cmd += ["--cache-mode", "both"]
             run(cmd, check=True)
-            if tmp.exists():
-                merged.extend(json.loads(tmp.read_text()))
-        numpy_json.write_text(json.dumps(merged, indent=2))
-        print(f"NumPy: {len(merged)} results across {len(args.suites)} suites")
-
-    # 3. C# BenchmarkDotNet per suite (config provides the job + JSON exporter). BDN cleans
-    #    its artifacts dir on each run, so copy out each suite's class reports immediately
-    #    after that suite finishes — otherwise only the last suite would survive.
-    if not args.skip_csharp:
+        return go
+
+    if not args.skip_python:
         for s in args.suites:
-            if ARTIFACTS.exists():
-                shutil.rmtree(ARTIFACTS, ignore_errors=True)
+            # linalg sweeps BLAS threads (1/2/4/all), so give it room when running in parallel.
+            fn = numpy_suite(s)
+            if gate:
+                # A re-run re-times the whole suite, so drop the noisy stream first.
+                fn = gate.gated(f"numpy:{s}", fn, reset=lambda s=s: (
+                    results_dir / f"numpy-{s}.jsonl").unlink(missing_ok=True))
+            tasks.append(Task(f"numpy:{s}", fn, cores=4 if s == "linalg" else 1))
+
+    # 3. C# BenchmarkDotNet per suite (config provides the job + JSON exporter). Each suite
+    #    gets its own --artifacts dir, so suites can run side by side and a crash keeps every
+    #    completed class report.
+    def csharp_suite(s):
+        def go():
+            artifacts = results_dir / "bdn" / s
+            if artifacts.exists():
+                shutil.rmtree(artifacts, ignore_errors=True)
             print(f"\n=== C# suite: {s} ({SUITES[s]}) ===", flush=True)
             run(["dotnet", "run", "-c", "Release", "--no-build", "-f", TFM,
-                 "--project", str(CSHARP_PROJ), "--", "--filter", SUITES[s]],
-                cwd=CSHARP_DIR, check=False)
-            if ARTIFACTS.exists():
-                for f in ARTIFACTS.glob("*-report-full-compressed.json"):
-                    shutil.copy(f, csharp_out / f.name)
-        print(f"C#: collected {len(list(csharp_out.glob('*.json')))} class reports")
-
-    # 4. Merge into the unified per-(op, dtype, N) ratio report.
-    out_base = results_dir / "benchmark-report"
-    run([sys.executable, str(MERGE), "--numpy", str(numpy_json),
-         "--csharp", str(csharp_out), "--output", str(out_base)], check=False)
-
-    # The unified report the op-matrix merge just wrote; the iterator + matrix
-    # subsystems below each append one section to it.
-    report_md = results_dir / "benchmark-report.md"
+                 "--project", str(CSHARP_PROJ), "--", "--filter", SUITES[s],
+                 "--artifacts", str(artifacts)], cwd=CSHARP_DIR, check=False)
+            for f in (artifacts / "results").glob("*-report-full-compressed.json"):
+                shutil.copy(f, csharp_out / f.name)
+        return go
 
-    # 4b. NDIter iterator benchmark — complementary harness (file-based, section-
-    #     isolated, crash-resilient: a NumSharp AccessViolation is IGNORED and the
-    #     section reported NA). Its result model is aspect x tier, not op/dtype/N,
-    #     so it is APPENDED to the report as its own section rather than merged —
-    #     preserving the iterator-isolation value the op matrix cannot express.
-    if not args.skip_nditer:
+    if not args.skip_csharp:
+        for s in args.suites:
+            fn = csharp_suite(s)
+            if gate:
+                fn = gate.gated(f"csharp:{s}", fn)   # csharp_suite clears its artifacts itself
+            tasks.append(Task(f"csharp:{s}", fn, deps=["build"]))
+
+    # 4. Complementary harnesses: NDIter (aspect x tier) and the matrix subsystems (layout /
+    #    operand / cast / fusion). Their sheets build NumSharp.Core themselves, so they share
+    #    the msbuild lock; their rendered sections are appended in a fixed order after merge.
+    def nditer():
         print("\n=== NDIter iterator benchmark (benchmark/nditer) ===", flush=True)
         sheet_cmd = [sys.executable, str(NPYITER_SHEET)]
         if args.skip_build:
@@ -239,34 +701,88 @@ def main():
         cards_src = NPYITER_DIR / "cards"
         if cards_src.exists():
             shutil.copytree(cards_src, results_dir / "nditer_cards", dirs_exist_ok=True)
-        if NPYITER_REPORT.exists():
-            section = ("\n\n---\n\n## NDIter iterator benchmark\n\n"
+
+    if not args.skip_nditer and "nditer" not in carried:
+        tasks.append(Task("nditer", nditer, deps=["build"], cores=2, locks=("msbuild",)))
+
+    skip_matrix = {"layout": args.skip_layout, "operand": args.skip_operand,
+                   "cast": args.skip_cast, "fusion": args.skip_fusion}
+    for name, sheet, results, title in MATRIX_SUBSYSTEMS:
+        if not skip_matrix[name] and name not in carried:
+            tasks.append(Task(name, lambda name=name, sheet=sheet, results=results:
+                              run_matrix_subsystem(name, sheet, results, results_dir, args.skip_build),
+                              deps=["build"], cores=2, locks=("msbuild",)))
+
+    # 5. Merge into the unified per-(op, dtype, N) ratio report.
+    def merge():
+        streams = [results_dir / f"numpy-{s}.jsonl" for s in args.suites]
+        if not args.skip_python:
+            with open(numpy_stream, "w", encoding="utf-8") as out:
+                for stream in streams:
+                    if stream.exists():
+                        out.write(stream.read_text(encoding="utf-8"))
+            # The JSON array is the snapshot artifact (history/, benchmark/ root); merge reads
+            # the stream. Raw samples stay in the scratch stream only.
+            rows = read_jsonl(numpy_stream)
+            for r in rows:
+                r.pop("samples_ns", None)
+            numpy_json.write_text(json.dumps(rows, indent=2))
+            print(f"NumPy: {len(rows)} results across {len(args.suites)} suites")
+        if not args.skip_csharp:
+            print(f"C#: collected {len(list(csharp_out.glob('*.json')))} class reports")
+        out_base = results_dir / "benchmark-report"
+        cmd = [sys.executable, str(MERGE), "--numpy", str(numpy_stream if numpy_stream.exists() else numpy_json),
+               "--csharp", str(csharp_out), "--output", str(out_base)]
+        if carry_snap and (carry_snap / "benchmark-report.json").exists():
+            cmd += ["--carry", str(carry_snap / "benchmark-report.json"), "--carry-label", carry_sha]
+        run(cmd, check=False)
+
+    tasks.append(Task("merge", merge, deps=[t.name for t in tasks
+                                              if t.name.startswith(("numpy:", "csharp:"))], cores=1))
+
+    # 6. Assemble: append the subsystem sections to the merged report (fixed order, whatever
+    #    order they finished in) and copy the headline artifacts to the benchmark/ root.
+    def carried_sheet(name, sheet_md):
+        """A carried subsystem's section: the snapshot's copy, else the sheet dir's last render."""
+        snap_md = carry_snap / sheet_md.name if carry_snap else None
+        return snap_md if snap_md and snap_md.exists() else sheet_md
+
+    def carried_title(name, title):
+        return f"{title} _(carried from {carry_sha})_" if name in carried else title
+
+    def assemble():
+        # NDIter: complementary harness (file-based, section-isolated, crash-resilient: a
+        # NumSharp AccessViolation is IGNORED and the section reported NA). Its result model
+        # is aspect x tier, not op/dtype/N, so it is APPENDED to the report as its own section.
+        nditer_md = carried_sheet("nditer", NPYITER_REPORT) if "nditer" in carried else NPYITER_REPORT
+        if not args.skip_nditer and nditer_md.exists():
+            section = (f"\n\n---\n\n## {carried_title('nditer', 'NDIter iterator benchmark')}\n\n"
                        "_Complementary harness: measures the iterator machinery itself "
                        "(construction, traversal, reductions, selection, dtypes, pathologies, "
                        "dividends) across cache tiers — not part of the op/dtype/N matrix above. "
                        "speedup = NumPy / NumSharp; NA = section ignored due to a known "
                        "intermittent NumSharp AccessViolation._\n\n")
             existing = report_md.read_text(encoding="utf-8") if report_md.exists() else ""
-            report_md.write_text(existing + section + NPYITER_REPORT.read_text(encoding="utf-8"),
+            report_md.write_text(existing + section + nditer_md.read_text(encoding="utf-8"),
                                  encoding="utf-8")
+        for name, sheet, results, title in MATRIX_SUBSYSTEMS:
+            if not skip_matrix[name]:
+                src = carried_sheet(name, results) if name in carried else results
+                append_section(report_md, src, carried_title(name, title))
+        if gate and gate.preflight:
+            gate.post = gate.probe("post")
+            gate.write(results_dir / "environment.json")
+            report_md.write_text((report_md.read_text(encoding="utf-8") if report_md.exists() else "")
+                                 + gate.section(), encoding="utf-8")
+        for name in ["benchmark-report.md", "benchmark-report.json", "benchmark-report.csv",
+                     "numpy-results.json"]:
+            src = results_dir / name
+            if src.exists():
+                shutil.copy(src, HERE / name)
 
-    # 4c. Matrix subsystems — layout / cast / fusion. Each fills an axis the
-    #     op/dtype/N matrix cannot express and appends its own rendered section.
-    skip_matrix = {"layout": args.skip_layout, "operand": args.skip_operand,
-                   "cast": args.skip_cast, "fusion": args.skip_fusion}
-    for name, sheet, results, title in MATRIX_SUBSYSTEMS:
-        if skip_matrix[name]:
-            continue
-        run_matrix_subsystem(name, sheet, results, title, report_md, results_dir, args.skip_build)
-
-    # 5. Copy the headline artifacts to the benchmark/ root for convenience.
-    for name in ["benchmark-report.md", "benchmark-report.json", "benchmark-report.csv",
-                 "numpy-results.json"]:
-        src = results_dir / name
-        if src.exists():
-            shutil.copy(src, HERE / name)
-
-    # 6. History snapshot + latest symlink — the committable provenance/publish step
+    tasks.append(Task("assemble", assemble, deps=[t.name for t in tasks], cores=0))
+
+    # 7. History snapshot + latest symlink — the committable provenance/publish step
     #    (benchmark/scripts/snapshot_history.py): copies the report + all five subsystem
     #    sheets + cards into benchmark/history/<date>_<sha>/, writes a MANIFEST, and
     #    repoints benchmark/history/latest at it (a git-tracked symlink). results/<ts>/
@@ -274,11 +790,24 @@ def main():
     #    --no-stage: writing the snapshot must NOT mutate the git index. Staging is the
     #    human's "review" step (run -> review -> commit), and CI stages benchmark/history/
     #    explicitly. A local perf check shouldn't silently `git add` ~16 files.
-    if not args.no_history:
+    def snapshot():
         print("\n=== history snapshot + latest (benchmark/history) ===", flush=True)
         run([sys.executable, str(HERE / "scripts" / "snapshot_history.py"),
              "--results-dir", str(results_dir), "--no-stage"], check=False)
 
+    if not args.no_history:
+        tasks.append(Task("snapshot", snapshot, deps=["assemble"], cores=0))
+
+    pool = parse_cpu_list(args.cpus) if args.cpus else (
+        sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1)))
+    pool = physical_cores(pool)
+    logs_dir = results_dir / "logs"
+    if args.jobs > 1:
+        logs_dir.mkdir(exist_ok=True)
+        print(f"Scheduler: {args.jobs} parallel tasks over physical cores {pool}; logs -> {logs_dir}")
+    run_dag(tasks, args.jobs, pool, logs_dir)
+    write_task_report(tasks, results_dir / "tasks.json", t0)
+
     print(f"\nDone in {time.time() - t0:.0f}s. Report: {HERE / 'benchmark-report.md'}")
     print(f"Archive: {results_dir}")
     print(f"Snapshot: {HISTORY_DIR / 'latest'} -> newest benchmark/history/<date>_<sha>/")
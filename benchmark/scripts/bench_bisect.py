@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Bisect one benchmark key's regression down to the NumSharp.Core commit that caused it.
+
+Give a subsystem key and a good/bad commit pair:
+
+    nditer    an nditer id                         add@1M           (runs only its section)
+    layout    [bench|]key of layout_results.tsv    1M|f64|F|sum|ax0 (bench looked up if omitted)
+    operand   a key of operand_results.tsv
+    cast      a key of cast_results.tsv            1M|f64|strided|i32
+
+The driver checks both commits out in a private git worktree (``<tmp>/numsharp-bisect``),
+builds ONLY NumSharp.Core there, and runs the ONE ``*_bench.cs`` that produces the key — the
+bench source of the current checkout, so every commit runs identical bench code —
+through bench_common's BenchHost, ``--repeats`` times. Only the NumSharp side is timed: the
+NumPy twin does not change across NumSharp commits.
+
+Noise-aware threshold: the endpoints give the good and bad levels and the run-to-run noise σ
+(robust spread of log(ms) over their repeats). The regression must exceed both
+``--min-shift`` and 4σ/√repeats, else the driver stops (nothing reproducible to bisect).
+A commit is measured against the geometric midpoint of the two levels; while it lies within
+2 standard errors of the midpoint, more repeats are taken (up to ``--max-repeats``), then it
+is skipped. ``git bisect run`` does the search, limited to commits touching
+src/NumSharp.Core — other commits build the identical library.
+
+Usage
+-----
+  python benchmark/scripts/bench_bisect.py --subsystem layout --key "1M|f64|F|sum|ax0" \\
+      --good e3b7c268 --bad 2d16f477
+  python benchmark/scripts/bench_bisect.py --subsystem nditer --key add@1M --good v0.41 --bad HEAD --repeats 5
+"""
+import argparse
+import importlib.util
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent      # benchmark/scripts
+BENCH = HERE.parent
+REPO = BENCH.parent
+sys.path.insert(0, str(HERE))
+import bench_common as bc  # noqa: E402
+
+WORKTREE = Path(tempfile.gettempdir()) / "numsharp-bisect"
+CORE = "src/NumSharp.Core"
+# subsystem -> the bench(es) producing its keys
+SINGLE = {"operand": BENCH / "operand" / "operand_bench.cs",
+          "cast": BENCH / "cast" / "cast_matrix_bench.cs"}
+NDITER_CS = BENCH / "nditer" / "nditer_bench.cs"
+LAYOUT_TSV = BENCH / "layout" / "layout_results.tsv"
+SKIP, GOOD, BAD = 125, 0, 1   # git bisect run exit codes
+
+
+def git(*args, cwd=REPO, check=True):
+    p = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+    if check and p.returncode != 0:
+        raise SystemExit(f"git {' '.join(args)} failed:\n{p.stderr.strip()}")
+    return p.stdout.strip()
+
+
+def resolve(subsystem, key):
+    """(bench .cs path, host env, key as the bench prints it)."""
+    if subsystem == "nditer":
+        spec = importlib.util.spec_from_file_location("nditer_sheet", BENCH / "nditer" / "nditer_sheet.py")
+        sheet = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(sheet)
+        section = sheet.section_of(key)
+        if section == "?":
+            raise SystemExit(f"unknown nditer id {key!r}")
+        return NDITER_CS, {"NPYITER_SECTION": section}, key
+    if subsystem == "layout":
+        stem, sep, bare = key.partition("|")
+        if sep and (BENCH / "layout" / f"{stem}.cs").exists():
+            return BENCH / "layout" / f"{stem}.cs", {}, bare
+        with open(LAYOUT_TSV, encoding="utf-8") as f:
+            for ln in f:
+                p = ln.rstrip("\n").split("\t")
+                if len(p) >= 2 and p[1] == key:
+                    return BENCH / "layout" / f"{p[0]}.cs", {}, key
+        raise SystemExit(f"{key!r} is not in {LAYOUT_TSV.name}; pass it as <bench>|<key>")
+    if subsystem in SINGLE:
+        return SINGLE[subsystem], {}, key
+    raise SystemExit(f"unsupported subsystem {subsystem!r} (nditer, layout, operand, cast)")
+
+
+# ---- measuring one checkout --------------------------------------------------
+def build_core(tree):
+    """dotnet build of NumSharp.Core only; False on a compile error (the commit is skipped)."""
+    b = subprocess.run(["dotnet", "build", bc.core_csproj(str(tree)), "-c", "Release", "-v", "q",
+                        "--nologo", "-clp:NoSummary;ErrorsOnly", "-p:WarningLevel=0"],
+                       capture_output=True, text=True, cwd=tree)
+    if b.returncode != 0:
+        bc.log(f"  [bisect] NumSharp.Core build failed:\n{b.stdout[-800:]}")
+    return b.returncode == 0
+
+
+class Probe:
+    """Times one key in a checkout: a BenchHost on the tree, the bench run `n` times."""
+
+    def __init__(self, tree, cs, env, key):
+        self.tree, self.cs, self.env, self.key = str(tree), str(cs), env, key
+        self.host = bc.BenchHost(self.tree) if bc.host_enabled() else None
+
+    def once(self):
+        if self.host is not None:
+            _, out = self.host.run(self.cs, env=self.env, retries=2, label=f"[bisect] {self.key}")
+        else:
+            p = subprocess.run(["dotnet", "run", "-c", "Release", "-"], input=bc.read_cs(self.tree, self.cs),
+                               capture_output=True, text=True, encoding="utf-8", errors="replace",
+                               cwd=self.tree, env={**os.environ, **bc.NS_ENV_EXTRA, **self.env})
+            out = p.stdout
+        return bc.parse_tsv(out).get(self.key)
+
+    def samples(self, n):
+        return [v for v in (self.once() for _ in range(n)) if v and v > 0]
+
+    def close(self):
+        if self.host is not None:
+            self.host.stop()
+
+
+def median(xs):
+    s = sorted(xs)
+    return (s[(len(s) - 1) // 2] + s[len(s) // 2]) / 2.0
+
+
+def log_spread(xs):
+    """Robust σ of log(xs): 1.4826 · MAD."""
+    lx = [math.log(x) for x in xs]
+    m = median(lx)
+    return 1.4826 * median([abs(v - m) for v in lx])
+
+
+def measure_at(rev, cs, env, key, repeats):
+    git("checkout", "-q", "--detach", rev, cwd=WORKTREE)
+    if not build_core(WORKTREE):
+        raise SystemExit(f"NumSharp.Core does not build at {rev}")
+    probe = Probe(WORKTREE, cs, env, key)
+    try:
+        xs = probe.samples(repeats)
+    finally:
+        probe.close()
+    if len(xs) < 2:
+        raise SystemExit(f"{key!r} produced no timings at {rev} (bench crashed, or the key is wrong)")
+    bc.log(f"  [bisect] {rev[:10]}: {key} = {median(xs):.4g} ms  ({', '.join(f'{x:.4g}' for x in xs)})")
+    return xs
+
+
+# ---- the `git bisect run` step (re-invokes this script) ----------------------
+def step(state_path):
+    st = json.loads(Path(state_path).read_text(encoding="utf-8"))
+    tree = Path.cwd()
+    sha = git("rev-parse", "--short", "HEAD", cwd=tree)
+    verdict, xs = SKIP, []
+    if build_core(tree):
+        probe = Probe(tree, st["cs"], st["env"], st["key"])
+        try:
+            xs = probe.samples(st["repeats"])
+            while True:
+                if len(xs) >= 2:
+                    d = math.log(median(xs)) - st["mid"]
+                    if abs(d) >= 2.0 * st["sigma"] / math.sqrt(len(xs)):
+                        # ms above the midpoint = slower = the regressed level
+                        verdict = BAD if (d > 0) == st["bad_is_slower"] else GOOD
+                        break
+                if len(xs) >= st["max_repeats"]:
+                    break
+                xs += probe.samples(1)
+        finally:
+            probe.close()
+    label = {GOOD: "good", BAD: "bad", SKIP: "skip"}[verdict]
+    bc.log(f"  [bisect] {sha}: {label}" + (f" — {median(xs):.4g} ms over {len(xs)} runs" if xs else ""))
+    with open(st["log"], "a", encoding="utf-8") as f:
+        f.write(json.dumps({"commit": sha, "verdict": label, "samples_ms": xs}) + "\n")
+    return verdict
+
+
+# ---- driver ------------------------------------------------------------------
+def bisect(args):
+    cs, env, key = resolve(args.subsystem, args.key)
+    good, bad = git("rev-parse", args.good), git("rev-parse", args.bad)
+    candidates = git("rev-list", "--ancestry-path", f"{good}..{bad}", "--", CORE).split()
+    if not candidates:
+        print(f"No commit between {args.good} and {args.bad} touches {CORE}: the shift is not "
+              f"in the library (environment, or the bench itself).")
+        return 0
+    bc.log(f"[bisect] {args.subsystem} {key} via {cs.name}{' ' + json.dumps(env) if env else ''}; "
+           f"{len(candidates)} NumSharp.Core commits in {args.good}..{args.bad}")
+
+    if WORKTREE.exists():
+        git("worktree", "remove", "--force", str(WORKTREE), check=False)
+        shutil.rmtree(WORKTREE, ignore_errors=True)
+    git("worktree", "add", "--detach", "-q", str(WORKTREE), bad)
+    try:
+        g = measure_at(good, cs, env, key, args.repeats)
+        b = measure_at(bad, cs, env, key, args.repeats)
+        lg, lb = math.log(median(g)), math.log(median(b))
+        sigma = max(math.sqrt((log_spread(g) ** 2 + log_spread(b) ** 2) / 2.0), args.noise_floor)
+        shift = math.exp(lb - lg) - 1.0
+        if abs(shift) < args.min_shift or abs(lb - lg) < 4.0 * sigma / math.sqrt(args.repeats):
+            print(f"Not reproducible: {key} is {median(g):.4g} ms at {args.good} and {median(b):.4g} ms "
+                  f"at {args.bad} ({shift:+.1%}, noise σ {sigma:.1%}) — nothing to bisect.")
+            return 1
+        bc.log(f"[bisect] {shift:+.1%} ({median(g):.4g} -> {median(b):.4g} ms), noise σ {sigma:.1%}; "
+               f"threshold {math.exp((lg + lb) / 2):.4g} ms")
+
+        fd, state = tempfile.mkstemp(suffix=".json", prefix="bisect-")
+        os.close(fd)
+        steps = state[:-5] + ".jsonl"
+        Path(state).write_text(json.dumps({
+            "cs": str(cs), "env": env, "key": key, "mid": (lg + lb) / 2.0, "sigma": sigma,
+            "bad_is_slower": lb > lg, "repeats": args.repeats, "max_repeats": args.max_repeats,
+            "log": steps}), encoding="utf-8")
+        git("bisect", "start", bad, good, "--", CORE, cwd=WORKTREE)
+        run = subprocess.run(["git", "bisect", "run", sys.executable, str(Path(__file__).resolve()),
+                              "--step", state], cwd=WORKTREE, capture_output=True, text=True)
+        found = [ln for ln in run.stdout.splitlines() if "is the first bad commit" in ln]
+        culprit = found[0].split()[0] if found else None
+        verdicts = [json.loads(ln) for ln in Path(steps).read_text(encoding="utf-8").splitlines()] \
+            if Path(steps).exists() else []
+        for p in (state, steps):
+            Path(p).unlink(missing_ok=True)
+    finally:
+        git("bisect", "reset", "-q", cwd=WORKTREE, check=False)
+        git("worktree", "remove", "--force", str(WORKTREE), check=False)
+
+    print(f"\n{args.subsystem} {key}: {median(g):.4g} ms at {args.good} -> {median(b):.4g} ms at {args.bad} "
+          f"({shift:+.1%})")
+    for v in verdicts:
+        ms = f"{median(v['samples_ms']):.4g} ms" if v["samples_ms"] else "-"
+        print(f"  {v['commit']}  {v['verdict']:<4}  {ms}")
+    if culprit:
+        print(f"\nFirst bad commit: {git('log', '-1', '--format=%h %s (%an, %ad)', '--date=short', culprit)}")
+        return 0
+    tail = [ln for ln in run.stdout.splitlines() if ln.strip()][-4:]
+    print("\nBisect ended without a single culprit (skipped commits?):\n  " + "\n  ".join(tail))
+    return 1
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Bisect a benchmark key's regression to a NumSharp.Core commit")
+    ap.add_argument("--subsystem", choices=["nditer", "layout", "operand", "cast"])
+    ap.add_argument("--key", help="The key as in the subsystem's *_results.tsv")
+    ap.add_argument("--good", help="A commit with the old timing")
+    ap.add_argument("--bad", help="A commit with the regressed timing")
+    ap.add_argument("--repeats", type=int, default=3, help="Bench runs per commit (default 3)")
+    ap.add_argument("--max-repeats", type=int, default=9,
+                    help="Runs per commit before an ambiguous one is skipped (default 9)")
+    ap.add_argument("--min-shift", type=float, default=0.05,
+                    help="Smallest good->bad change worth bisecting, as a fraction (default 0.05)")
+    ap.add_argument("--noise-floor", type=float, default=0.01,
+                    help="Lower bound on the run-to-run σ of log(ms) (default 0.01)")
+    ap.add_argument("--step", metavar="STATE", help=argparse.SUPPRESS)   # git bisect run callback
+    args = ap.parse_args()
+    if args.step:
+        try:
+            sys.exit(step(args.step))
+        except Exception as e:   # an uncaught error exits 1, which git bisect reads as "bad"
+            bc.log(f"  [bisect] step failed ({type(e).__name__}: {e}) — skipping the commit")
+            sys.exit(SKIP)
+    if not (args.subsystem and args.key and args.good and args.bad):
+        ap.error("--subsystem, --key, --good and --bad are required")
+    sys.exit(bisect(args))
+
+
+if __name__ == "__main__":
+    main()
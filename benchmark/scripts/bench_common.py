@@ -6,19 +6,38 @@
 # Each subsystem's *_sheet.py imports this to, identically on the author's box
 # and on a Linux CI runner:
 #   * build NumSharp.Core (Release),
-#   * run a `*_bench.cs` via `dotnet run -c Release -` (fed on stdin, with the
-#     author's absolute #:project path rewritten to THIS checkout's csproj),
+#   * run a `*_bench.cs` in the long-lived bench_host.cs process (BenchHost:
+#     each bench is built to a Release dll once, then invoked in-process), or
+#     via `dotnet run -c Release -` per call with NUMSHARP_BENCH_HOST=0 (fed on
+#     stdin; either way the author's absolute #:project path is rewritten to
+#     THIS checkout's csproj),
 #   * run its `*_bench.py` NumPy twin,
-#   * parse the keyed TSV (`key\tms`) both sides emit.
+#   * parse the keyed TSV (`key\tms`) both sides emit,
+#   * bound every bench process (memory / CPU / wall) and record why one failed.
 #
 # Mirrors the proven nditer_sheet.py mechanics, centralised so every matrix
 # subsystem runs through one code path. run_benchmark.py drives the sheets; the
 # sheets render; this module is the plumbing between.
 # =============================================================================
+import atexit
+import hashlib
+import json
 import math
 import os
+import queue
+import re
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+
+try:
+    import resource
+except ImportError:   # Windows: only the wall-clock limit applies
+    resource = None
 
 # The absolute #:project path the author's .cs benches pin (so they can also be
 # run directly as `dotnet run -c Release - < file`). Rewritten per checkout.
@@ -50,42 +69,352 @@ def build_core(repo):
     log("[build] ok")
 
 
-def run_cs(repo, cs_path, timeout=1200):
-    """Run a file-based NumSharp bench (.cs) and return its stdout (the keyed TSV).
-
-    The .cs is fed on stdin (`dotnet run -c Release -`) so sibling git worktrees
-    under .claude/worktrees/ can't confuse the project search; the author's
-    absolute #:project path is rewritten to this checkout's csproj first.
-    """
+def read_cs(repo, cs_path):
+    """A bench's source with the author's #:project path rewritten to this checkout's csproj."""
     with open(cs_path, encoding="utf-8") as f:
         src = f.read()
-    src = src.replace(AUTHOR_CSPROJ, core_csproj(repo).replace(os.sep, "/"))
-    env = {**os.environ, **NS_ENV_EXTRA}
-    name = os.path.basename(cs_path)
+    return src.replace(AUTHOR_CSPROJ, core_csproj(repo).replace(os.sep, "/"))
+
+
+# ---- resource limits + failure records ---------------------------------------
+# Every bench process runs bounded, so one runaway section can't take a shared box down:
+#   memory  NUMSHARP_BENCH_MEM_MB (default 16384; 0 = off). NumPy twins get RLIMIT_AS.
+#           .NET reserves far more address space than it uses, so dotnet gets RLIMIT_DATA
+#           (committed private memory) plus DOTNET_GCHeapHardLimit for the managed heap.
+#   CPU     NUMSHARP_BENCH_CPU_S (default 1800; 0 = off): RLIMIT_CPU, SIGXCPU at the limit.
+#           The long-lived host gets it per request (prlimit: used + limit).
+#   wall    the per-call timeout.
+# NUMSHARP_BENCH_CGROUP=1 also puts one-shot processes in a systemd-run scope with
+# MemoryMax (counts page cache and children), where systemd-run is available.
+# A failed run leaves a record {bench, kind, limit, last_key, exit, detail} in FAILURES
+# and, when NUMSHARP_BENCH_FAILURES names a file (run_benchmark.py: results/<ts>/
+# failures.jsonl), one JSON line there; the sheets render FAILURES under their tables.
+MEM_MB = int(os.environ.get("NUMSHARP_BENCH_MEM_MB", "16384"))
+CPU_S = int(os.environ.get("NUMSHARP_BENCH_CPU_S", "1800"))
+FAILURES = []
+XCPU = getattr(signal, "SIGXCPU", None)
+OOM_MARKERS = ("MemoryError", "OutOfMemoryException", "std::bad_alloc", "Cannot allocate memory",
+               "Unable to allocate", "out of memory")
+
+
+def limit_env(dotnet):
+    """Extra env for a bounded process (the managed-heap cap for dotnet)."""
+    if dotnet and MEM_MB:
+        return {"DOTNET_GCHeapHardLimit": hex(MEM_MB * 1024 * 1024)}
+    return {}
+
+
+def limit_prefix(dotnet, cpu=True):
+    """``prlimit --data|--as=… --cpu=… --`` applying the memory / CPU rlimits to the command it
+    execs ([] where unsupported). An exec prefix rather than a preexec_fn: the callers already
+    run threads (the host's reader), where forking into Python code is unsafe."""
+    cpu = cpu and CPU_S
+    if resource is None or not (MEM_MB or cpu) or not shutil.which("prlimit"):
+        return []
+    mem_kind, mem_opt = (resource.RLIMIT_DATA, "--data") if dotnet else (resource.RLIMIT_AS, "--as")
+
+    def clamp(kind, want):     # an unprivileged child can't raise its hard limit
+        _, hard = resource.getrlimit(kind)
+        return want if hard == resource.RLIM_INFINITY else min(want, hard)
+
+    prefix = ["prlimit"]
+    if MEM_MB:
+        b = clamp(mem_kind, MEM_MB * 1024 * 1024)
+        prefix.append(f"{mem_opt}={b}:{b}")
+    if cpu:
+        prefix.append(f"--cpu={clamp(resource.RLIMIT_CPU, CPU_S)}:{clamp(resource.RLIMIT_CPU, CPU_S + 30)}")
+    return prefix + ["--"]
+
+
+def _cgroup_prefix():
+    if os.environ.get("NUMSHARP_BENCH_CGROUP") != "1" or not MEM_MB or not shutil.which("systemd-run"):
+        return []
+    return ["systemd-run", "--user", "--scope", "--quiet", "-p", f"MemoryMax={MEM_MB}M",
+            "-p", "MemorySwapMax=0"]
+
+
+def failure(bench, code, stdout="", stderr="", timeout=None, last_key=None, error=None):
+    """Classify a failed run: timeout / cpu / oom / crash / exit, with the limit it hit."""
+    text = f"{stderr or ''}\n{error or ''}"
+    if timeout is not None:
+        kind, limit = "timeout", f"wall {timeout}s"
+    elif code is not None and XCPU and code in (-XCPU, 128 + XCPU):
+        kind, limit = "cpu", f"cpu {CPU_S}s"
+    elif any(m in text for m in OOM_MARKERS) or code in (-9, 137):
+        # SIGKILL with no other cause: the kernel / cgroup OOM killer
+        kind, limit = "oom", f"memory {MEM_MB} MB"
+    elif code is not None and (code < 0 or code > 128):
+        kind, limit = "crash", f"signal {-code if code < 0 else code - 128}"
+    else:
+        kind, limit = "exit", None
+    if last_key is None:
+        keys = list(parse_tsv(stdout or ""))
+        last_key = keys[-1] if keys else None
+    tail = (stderr or "").strip().splitlines()
+    return {"bench": bench, "kind": kind, "limit": limit, "last_key": last_key, "exit": code,
+            "detail": (error or (tail[-1] if tail else ""))[:300],
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def _limit(rec):
+    return rec["limit"] or f"exit {rec['exit']}"
+
+
+def record_failure(rec):
+    FAILURES.append(rec)
+    path = os.environ.get("NUMSHARP_BENCH_FAILURES")
+    if path:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(rec) + "\n")
+    log(f"    [{rec['kind']}] {rec['bench']}: {_limit(rec)}"
+        + (f" after {rec['last_key']}" if rec["last_key"] else ""))
+    return rec
+
+
+def run_bounded(cmd, bench, input=None, env=None, cwd=None, timeout=1200, dotnet=False):
+    """subprocess.run under the limits -> (stdout, failure record or None). Does not record."""
+    env = {**(env or os.environ), **limit_env(dotnet)}
     try:
-        p = subprocess.run(["dotnet", "run", "-c", "Release", "-"], input=src,
+        p = subprocess.run(_cgroup_prefix() + limit_prefix(dotnet) + cmd, input=input,
                            capture_output=True, text=True, encoding="utf-8", errors="replace",
-                           cwd=repo, env=env, timeout=timeout)
-    except subprocess.TimeoutExpired:
-        log(f"    [cs] {name}: TIMED OUT ({timeout}s) — section dropped")
-        return ""
+                           cwd=cwd, env=env, timeout=timeout)
+    except subprocess.TimeoutExpired as e:
+        out = e.stdout.decode("utf-8", "replace") if isinstance(e.stdout, bytes) else (e.stdout or "")
+        return out, failure(bench, None, out, timeout=timeout)
     if p.returncode != 0:
-        log(f"    [cs] {name}: exit {p.returncode}\n{p.stderr[-600:]}")
-    return p.stdout
+        return p.stdout, failure(bench, p.returncode, p.stdout, p.stderr)
+    return p.stdout, None
+
+
+def failures_md(title="Failures"):
+    """Markdown block listing this process's failure records ('' when none) — append to a sheet."""
+    if not FAILURES:
+        return ""
+    L = ["", f"### {title}", "",
+         f"_Bench runs that crashed or hit a resource limit (memory {MEM_MB} MB, CPU {CPU_S}s, "
+         "wall per call); their remaining keys are missing above. Last key = the last one "
+         "emitted before the failure._", "",
+         "| bench | kind | limit | last key | detail |", "|---|---|---|---|---|"]
+    for r in FAILURES:
+        detail = (r["detail"] or "").replace("|", "\\|")
+        L.append(f"| {r['bench']} | {r['kind']} | {_limit(r)} | {r['last_key'] or '-'} | {detail} |")
+    return "\n".join(L) + "\n"
+
+
+# ---- persistent host ---------------------------------------------------------
+HOST_CS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_host.cs")
+HOST_BUILD_ROOT = os.path.join(tempfile.gettempdir(), "numsharp-bench-host")
+
+
+def host_enabled():
+    """The host is the default; NUMSHARP_BENCH_HOST=0 falls back to `dotnet run` per call."""
+    return os.environ.get("NUMSHARP_BENCH_HOST", "1") != "0"
+
+
+def build_cs(repo, cs_path):
+    """Build a file-based program to a Release dll and return its path (None on failure).
+
+    The rewritten source is written OUTSIDE the checkout (keyed by checkout + source
+    hash) so, like the stdin form, sibling worktrees can't confuse the project search.
+    """
+    src = read_cs(repo, cs_path)
+    stem = os.path.splitext(os.path.basename(cs_path))[0]
+    digest = hashlib.sha1((os.path.abspath(repo) + "\0" + src).encode("utf-8")).hexdigest()[:12]
+    work = os.path.join(HOST_BUILD_ROOT, f"{stem}-{digest}")
+    out = os.path.join(work, "bin")
+    os.makedirs(work, exist_ok=True)
+    path = os.path.join(work, stem + ".cs")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(src)
+    b = subprocess.run(["dotnet", "build", path, "-c", "Release", "-o", out, "-v", "q", "--nologo",
+                        "-clp:NoSummary;ErrorsOnly", "-p:WarningLevel=0"],
+                       capture_output=True, text=True, cwd=work)
+    if b.returncode != 0:
+        log(f"    [host] build {stem}.cs FAILED:\n{b.stdout[-1500:]}")
+        return None
+    m = re.search(r"^#:property\s+AssemblyName=(\S+)", src, re.M)
+    return os.path.join(out, (m.group(1) if m else stem) + ".dll")
+
+
+class BenchHost:
+    """One long-lived bench_host.cs process running compiled benches in-process.
+
+    Each bench .cs is built once per BenchHost; later calls (e.g. the next nditer
+    section) reuse the loaded, JIT-warm assembly. A crash (the known AccessViolation)
+    or a timeout kills the host; the next attempt restarts it.
+    """
+
+    def __init__(self, repo):
+        self.repo = repo
+        self.proc = None
+        self.lines = None
+        self.dlls = {}
+        self.host_dll = None
+        self.next_id = 0
+
+    def _start(self):
+        if self.host_dll is None:
+            self.host_dll = build_cs(self.repo, HOST_CS)
+            if self.host_dll is None:
+                raise RuntimeError("bench_host.cs failed to build")
+        # Memory limits hold for the host's life; CPU is budgeted per request (_budget_cpu).
+        # prlimit execs dotnet in place, so proc.pid is still the host (_budget_cpu relies on it).
+        self.proc = subprocess.Popen(limit_prefix(True, cpu=False) + ["dotnet", self.host_dll],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+                                     encoding="utf-8", errors="replace", cwd=self.repo,
+                                     env={**os.environ, **NS_ENV_EXTRA, **limit_env(True)})
+        # A reader thread turns stdout into a queue so every wait can time out.
+        self.lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self.proc.stdout, self.lines), daemon=True).start()
+        ready = self._read(120)
+        if not ready or not ready.get("ready"):
+            self.stop()
+            raise RuntimeError("bench_host did not start")
+        log(f"    [host] started (pid {ready.get('pid')})")
+
+    @staticmethod
+    def _pump(stream, lines):
+        for ln in stream:
+            lines.put(ln)
+        lines.put(None)   # EOF: the host exited (crash)
+
+    def _read(self, timeout):
+        """Next protocol message; None on EOF; raises queue.Empty on timeout."""
+        while True:
+            ln = self.lines.get(timeout=timeout)
+            if ln is None:
+                return None
+            try:
+                return json.loads(ln)
+            except ValueError:
+                continue   # stray non-protocol output
+
+    def stop(self):
+        if self.proc is not None:
+            try:
+                self.proc.stdin.close()
+                self.proc.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+                self.proc.wait()
+            self.proc = None
+
+    def _budget_cpu(self):
+        """RLIMIT_CPU of the host = CPU it has used so far + CPU_S (Linux prlimit)."""
+        if not CPU_S or resource is None or not hasattr(resource, "prlimit"):
+            return
+        try:
+            with open(f"/proc/{self.proc.pid}/stat", encoding="utf-8") as f:
+                fields = f.read().rpartition(")")[2].split()
+            used = (int(fields[11]) + int(fields[12])) // os.sysconf("SC_CLK_TCK")
+            resource.prlimit(self.proc.pid, resource.RLIMIT_CPU, (used + CPU_S, used + CPU_S + 30))
+        except (OSError, ValueError, IndexError):
+            pass
+
+    def _kill(self):
+        if self.proc is not None:
+            self.proc.kill()
+            self.proc.wait()
+            self.proc = None
+
+    def run(self, cs_path, env=None, timeout=1200, retries=1, label=None):
+        """Run a bench in the host. Returns (exit, stdout); exit None = crashed / timed out.
+
+        A run that still fails after `retries` attempts is recorded (record_failure).
+        """
+        label = label or os.path.basename(cs_path)
+        if cs_path not in self.dlls:
+            self.dlls[cs_path] = build_cs(self.repo, cs_path)
+        dll = self.dlls[cs_path]
+        if dll is None:
+            record_failure(failure(label, None, error="build failed"))
+            return None, ""
+        code, out, rec = None, "", None
+        for attempt in range(1, retries + 1):
+            if self.proc is None or self.proc.poll() is not None:
+                try:
+                    self._start()
+                except RuntimeError as e:
+                    log(f"    {label}: {e}")
+                    record_failure(failure(label, None, error=str(e)))
+                    return None, ""
+            self.next_id += 1
+            self._budget_cpu()
+            last = None   # the bench's stdout lines arrive as they are written
+            deadline = time.monotonic() + timeout
+            try:
+                self.proc.stdin.write(json.dumps({"id": self.next_id, "dll": dll, "env": env or {}}) + "\n")
+                self.proc.stdin.flush()
+                while True:
+                    msg = self._read(max(deadline - time.monotonic(), 0.001))
+                    if msg is None or "line" not in msg:
+                        break
+                    if "\t" in msg["line"]:
+                        last = msg["line"].partition("\t")[0].strip()
+            except OSError:
+                msg = None   # the host died between requests
+            except queue.Empty:
+                log(f"    {label}: attempt {attempt}/{retries} TIMED OUT ({timeout}s) — restarting host")
+                self._kill()
+                code, out, rec = None, "", failure(label, None, timeout=timeout, last_key=last)
+                continue
+            if msg is None:
+                died = self.proc.wait()
+                log(f"    {label}: attempt {attempt}/{retries} crashed the host "
+                    f"(exit {died}) — restarting")
+                self.proc = None
+                code, out, rec = None, "", failure(label, died, last_key=last)
+                continue
+            code, out = msg["exit"], msg["stdout"]
+            if code == 0:
+                return code, out
+            rec = failure(label, code, out, error=msg.get("error"))
+            log(f"    {label}: attempt {attempt}/{retries} exit {code} ({msg.get('error')})")
+        if rec is not None:
+            record_failure(rec)
+        return code, out
+
+
+_HOST = None
+
+
+def shared_host(repo):
+    """The process-wide BenchHost (started lazily, stopped at exit)."""
+    global _HOST
+    if _HOST is None:
+        _HOST = BenchHost(repo)
+        atexit.register(_HOST.stop)
+    return _HOST
+
+
+def run_cs(repo, cs_path, timeout=1200):
+    """Run a file-based NumSharp bench (.cs) and return its stdout (the keyed TSV).
+
+    By default it runs in the shared BenchHost. With NUMSHARP_BENCH_HOST=0 the .cs is
+    fed on stdin (`dotnet run -c Release -`) so sibling git worktrees under
+    .claude/worktrees/ can't confuse the project search.
+    """
+    name = os.path.basename(cs_path)
+    if host_enabled():
+        code, out = shared_host(repo).run(cs_path, timeout=timeout, label=f"[cs] {name}")
+        if code is None:
+            log(f"    [cs] {name}: no result — section dropped")
+        return out
+    out, rec = run_bounded(["dotnet", "run", "-c", "Release", "-"], f"[cs] {name}",
+                           input=read_cs(repo, cs_path), cwd=repo, timeout=timeout,
+                           env={**os.environ, **NS_ENV_EXTRA}, dotnet=True)
+    if rec is not None:
+        record_failure(rec)
+    return out
 
 
 def run_py(repo, py_path, timeout=900):
     """Run a NumPy twin bench (.py) and return its stdout (the keyed TSV)."""
-    name = os.path.basename(py_path)
-    try:
-        p = subprocess.run([sys.executable, py_path], capture_output=True, text=True,
-                           encoding="utf-8", errors="replace", cwd=repo, timeout=timeout)
-    except subprocess.TimeoutExpired:
-        log(f"    [py] {name}: TIMED OUT ({timeout}s) — section dropped")
-        return ""
-    if p.returncode != 0:
-        log(f"    [py] {name}: exit {p.returncode}\n{p.stderr[-600:]}")
-    return p.stdout
+    out, rec = run_bounded([sys.executable, py_path], f"[py] {os.path.basename(py_path)}",
+                           cwd=repo, timeout=timeout)
+    if rec is not None:
+        record_failure(rec)
+    return out
 
 
 def parse_tsv(text):
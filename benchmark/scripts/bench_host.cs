@@ -0,0 +1,186 @@
+#:project K:/source/NumSharp/src/NumSharp.Core/NumSharp.Core.csproj
+#:property AssemblyName=NumSharp.BenchHost
+#:property PublishAot=false
+// =============================================================================
+// bench_host.cs — long-lived host that runs the file-based NumSharp benches
+// (benchmark/{nditer,layout,operand,cast,fusion}/*_bench.cs) in-process.
+//
+// `dotnet run -c Release -` per bench/section pays SDK startup, a build of the
+// file-based program and a cold JIT every time — more than the short sections
+// measure. bench_common.BenchHost builds each bench to a Release dll ONCE and
+// starts this host; every request then loads (first time) or reuses the bench
+// assembly and invokes its top-level entry point.
+//
+// Protocol (one JSON object per line; stdout carries protocol lines only):
+//   host -> {"ready": true, "pid": 1234}                         once, at startup
+//   in   <- {"id": 1, "dll": "/abs/bench.dll", "env": {"NPYITER_SECTION": "pathology"}}
+//   out  -> {"id": 1, "line": "key\tms"}                             per completed stdout line
+//   out  -> {"id": 1, "exit": 0, "stdout": "key\tms\n...", "error": null, "ms": 812.4}
+// EOF on stdin ends the host. Bench stderr passes straight through.
+//
+// Each bench gets its own AssemblyLoadContext (they all share the assembly name
+// NumSharp.DotNetRunScript) but resolves NumSharp.Core from the host, so kernel
+// caches and JIT'd code stay warm across sections. Benches must `return`, never
+// Environment.Exit. An AccessViolation kills the host; the Python side sees EOF,
+// restarts it and retries — the same crash policy as the per-process runs. The
+// streamed "line" messages tell it the last key a crashed or timed-out bench emitted.
+//
+// Build/run ONLY via bench_common.py (it rewrites the #:project path per checkout).
+// =============================================================================
+using System.Diagnostics;
+using System.Reflection;
+using System.Runtime.Loader;
+using System.Text;
+using System.Text.Json;
+using NumSharp;
+
+var protocol = Console.Out;
+void Reply(Dictionary<string, object?> msg)
+{
+    protocol.WriteLine(JsonSerializer.Serialize(msg));
+    protocol.Flush();
+}
+
+var dbgHost = Attribute.GetCustomAttribute(typeof(BenchContext).Assembly, typeof(DebuggableAttribute)) as DebuggableAttribute;
+var dbgCore = Attribute.GetCustomAttribute(typeof(np).Assembly, typeof(DebuggableAttribute)) as DebuggableAttribute;
+if ((dbgHost?.IsJITOptimizerDisabled ?? false) || (dbgCore?.IsJITOptimizerDisabled ?? false))
+{
+    Console.Error.WriteLine("FATAL: Debug-JITted assemblies — numbers would be INVALID.");
+    return 1;
+}
+
+var loaded = new Dictionary<string, MethodInfo>();
+Reply(new() { ["ready"] = true, ["pid"] = Environment.ProcessId });
+
+string? line;
+while ((line = Console.In.ReadLine()) != null)
+{
+    if (line.Length == 0)
+        continue;
+
+    using var req = JsonDocument.Parse(line);
+    var root = req.RootElement;
+    var id = root.GetProperty("id").GetInt64();
+    var dll = root.GetProperty("dll").GetString()!;
+
+    // Request env is applied for the call only; benches read it at the top of Main.
+    var saved = new Dictionary<string, string?>();
+    if (root.TryGetProperty("env", out var env))
+        foreach (var kv in env.EnumerateObject())
+        {
+            saved[kv.Name] = Environment.GetEnvironmentVariable(kv.Name);
+            Environment.SetEnvironmentVariable(kv.Name, kv.Value.GetString());
+        }
+
+    var captured = new LineStreamWriter(line => Reply(new() { ["id"] = id, ["line"] = line }));
+    var sw = Stopwatch.StartNew();
+    int exit = 0;
+    string? error = null;
+    try
+    {
+        if (!loaded.TryGetValue(dll, out var entry))
+        {
+            var asm = new BenchContext(dll).LoadFromAssemblyPath(dll);
+            entry = asm.EntryPoint ?? throw new InvalidOperationException($"{dll} has no entry point");
+            loaded[dll] = entry;
+        }
+
+        Console.SetOut(captured);
+        var ret = entry.Invoke(null, entry.GetParameters().Length == 0 ? null : new object[] { Array.Empty<string>() });
+        if (ret is Task task)
+        {
+            task.GetAwaiter().GetResult();
+            ret = task.GetType().GetProperty("Result")?.GetValue(task);
+        }
+        exit = ret is int code ? code : 0;
+    }
+    catch (Exception e)
+    {
+        var inner = e is TargetInvocationException { InnerException: { } ie } ? ie : e;
+        exit = 1;
+        error = $"{inner.GetType().Name}: {inner.Message}";
+        Console.Error.WriteLine($"[bench_host] {Path.GetFileName(dll)}: {inner}");
+    }
+    finally
+    {
+        Console.SetOut(protocol);
+        foreach (var kv in saved)
+            Environment.SetEnvironmentVariable(kv.Key, kv.Value);
+    }
+
+    Reply(new()
+    {
+        ["id"] = id,
+        ["exit"] = exit,
+        ["stdout"] = captured.ToString(),
+        ["error"] = error,
+        ["ms"] = sw.Elapsed.TotalMilliseconds,
+    });
+    GC.Collect();
+    GC.WaitForPendingFinalizers();
+}
+return 0;
+
+/// <summary>
+/// Load context for one bench dll. NumSharp.Core always comes from the host (shared, warm);
+/// anything else the bench ships is resolved next to its own dll.
+/// </summary>
+sealed class BenchContext : AssemblyLoadContext
+{
+    private readonly AssemblyDependencyResolver _resolver;
+
+    public BenchContext(string dll) : base(Path.GetFileNameWithoutExtension(dll))
+    {
+        _resolver = new AssemblyDependencyResolver(dll);
+    }
+
+    protected override Assembly? Load(AssemblyName name)
+    {
+        if (name.Name == typeof(np).Assembly.GetName().Name)
+            return null;
+        var path = _resolver.ResolveAssemblyToPath(name);
+        return path != null ? LoadFromAssemblyPath(path) : null;
+    }
+}
+
+/// <summary>
+/// Captures a bench's stdout for the final reply and forwards each completed line as it is
+/// written, so the driver knows how far a bench got if it never replies.
+/// </summary>
+sealed class LineStreamWriter : TextWriter
+{
+    private readonly StringBuilder _all = new();
+    private readonly StringBuilder _line = new();
+    private readonly Action<string> _onLine;
+
+    public LineStreamWriter(Action<string> onLine) => _onLine = onLine;
+
+    public override Encoding Encoding => Encoding.UTF8;
+
+    public override void Write(char value)
+    {
+        _all.Append(value);
+        if (value == '\n')
+        {
+            _onLine(_line.ToString().TrimEnd('\r'));
+            _line.Clear();
+        }
+        else
+            _line.Append(value);
+    }
+
+    public override void Write(string? value)
+    {
+        if (value != null)
+            foreach (var c in value)
+                Write(c);
+    }
+
+    public override void Write(char[] buffer, int index, int count)
+    {
+        for (int i = 0; i < count; i++)
+            Write(buffer[index + i]);
+    }
+
+    public override string ToString() => _all.ToString();
+}
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Benchmark-as-a-service: a resident, loopback-only runner for ``run_benchmark.py`` jobs.
+
+Developers sharing a perf box submit comparison jobs over HTTP instead of launching runs by
+hand. The service queues them and runs ONE job at a time, pinned to its own core set, so
+timings never overlap. Jobs, their progress and their merged rows live in a SQLite store.
+
+Each job benchmarks a git ref. The ref is checked out in a detached worktree outside the
+repository (so BenchmarkDotNet's project search never sees it), and that checkout's own
+``benchmark/run_benchmark.py`` runs with ``--no-history`` (the ref must be new enough to have
+the flags the job uses). The run's results directory is copied under ``<state>/jobs/<id>/``
+and the worktree removed.
+
+API (JSON, 127.0.0.1 only)
+--------------------------
+  POST   /jobs                 {"ref": "HEAD", "suites": [...], "sizes": [1000, 100000],
+                                "subsystems": [], "quick": false, "submitter": "name"}
+                               -> 202 {"id": 7, "status": "queued", "position": 2}
+  GET    /jobs                 all jobs, newest first
+  GET    /jobs/<id>            one job (status, ref/sha, timings, summary)
+  GET    /jobs/<id>/log?offset=N   {"offset": M, "text": "...", "done": bool}: progress polling
+  GET    /jobs/<id>/stream     the log as plain text, streamed until the job finishes
+  GET    /jobs/<id>/results    the job's merged per-(op, dtype, N) rows
+  DELETE /jobs/<id>            cancel a queued job, or stop a running one
+  GET    /health
+
+Usage
+-----
+  python benchmark/scripts/bench_service.py --port 8765 --cpus 4-11
+  curl -s -XPOST localhost:8765/jobs -d '{"ref": "my-branch", "suites": ["unary"], "sizes": [100000]}'
+  curl -s localhost:8765/jobs/1/stream
+"""
+import argparse
+import json
+import math
+import os
+import shutil
+import signal
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+HERE = Path(__file__).resolve().parent      # benchmark/scripts
+BENCH = HERE.parent                          # benchmark
+REPO = BENCH.parent                          # repo root
+DEFAULT_STATE = BENCH / ".service"
+
+sys.path.insert(0, str(BENCH))
+import run_benchmark  # noqa: E402
+
+SUBSYSTEMS = ("nditer", "layout", "operand", "cast", "fusion")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    status      TEXT NOT NULL,              -- queued | running | done | failed | cancelled
+    ref         TEXT NOT NULL,
+    sha         TEXT,
+    request     TEXT NOT NULL,              -- the submitted JSON
+    submitter   TEXT,
+    submitted   REAL NOT NULL,
+    started     REAL,
+    finished    REAL,
+    exit_code   INTEGER,
+    error       TEXT,
+    results_dir TEXT,
+    summary     TEXT                        -- JSON: rows / geomean / status counts
+);
+CREATE TABLE IF NOT EXISTS results (
+    job_id      INTEGER NOT NULL REFERENCES jobs(id),
+    suite       TEXT, operation TEXT, dtype TEXT, n INTEGER,
+    numpy_ms    REAL, numsharp_ms REAL, ratio REAL, status TEXT
+);
+CREATE INDEX IF NOT EXISTS results_job ON results(job_id);
+"""
+
+
+class Store:
+    """SQLite job/result store. One connection per call: the HTTP threads and the worker share it."""
+
+    def __init__(self, path):
+        self.path = path
+        with self._conn() as c:
+            c.executescript(SCHEMA)
+            # A job that was running when the service died has no usable result.
+            c.execute("UPDATE jobs SET status='failed', error='service restarted', finished=? "
+                      "WHERE status='running'", (time.time(),))
+
+    def _conn(self):
+        c = sqlite3.connect(self.path, timeout=30)
+        c.row_factory = sqlite3.Row
+        return c
+
+    def submit(self, req):
+        with self._conn() as c:
+            cur = c.execute("INSERT INTO jobs(status, ref, request, submitter, submitted) "
+                            "VALUES('queued', ?, ?, ?, ?)",
+                            (req["ref"], json.dumps(req), req.get("submitter"), time.time()))
+            return cur.lastrowid
+
+    def job(self, job_id):
+        with self._conn() as c:
+            row = c.execute("SELECT * FROM jobs WHERE id=?", (job_id,)).fetchone()
+        return self._job_dict(row) if row else None
+
+    def jobs(self):
+        with self._conn() as c:
+            return [self._job_dict(r) for r in c.execute("SELECT * FROM jobs ORDER BY id DESC")]
+
+    def position(self, job_id):
+        with self._conn() as c:
+            return c.execute("SELECT COUNT(*) FROM jobs WHERE status='queued' AND id<=?",
+                             (job_id,)).fetchone()[0]
+
+    def next_queued(self):
+        with self._conn() as c:
+            row = c.execute("SELECT * FROM jobs WHERE status='queued' ORDER BY id LIMIT 1").fetchone()
+        return self._job_dict(row) if row else None
+
+    def transition(self, job_id, old, new, **fields):
+        """Atomically move a job from one of the `old` statuses to `new`; False if it had left them
+        (the runner claiming a job and a cancel racing for it both go through here)."""
+        sets = ", ".join(["status=?", *(f"{k}=?" for k in fields)])
+        marks = ", ".join("?" * len(old))
+        with self._conn() as c:
+            cur = c.execute(f"UPDATE jobs SET {sets} WHERE id=? AND status IN ({marks})",
+                            (new, *fields.values(), job_id, *old))
+            return cur.rowcount == 1
+
+    def update(self, job_id, **fields):
+        cols = ", ".join(f"{k}=?" for k in fields)
+        with self._conn() as c:
+            c.execute(f"UPDATE jobs SET {cols} WHERE id=?", (*fields.values(), job_id))
+
+    def add_results(self, job_id, rows):
+        with self._conn() as c:
+            c.executemany("INSERT INTO results VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                          [(job_id, r.get("suite"), r.get("operation"), r.get("dtype"), r.get("n"),
+                            r.get("numpy_ms"), r.get("numsharp_ms"), r.get("ratio"), r.get("status"))
+                           for r in rows])
+
+    def results(self, job_id):
+        with self._conn() as c:
+            return [dict(r) for r in c.execute(
+                "SELECT suite, operation, dtype, n, numpy_ms, numsharp_ms, ratio, status "
+                "FROM results WHERE job_id=? ORDER BY suite, operation, dtype, n", (job_id,))]
+
+    @staticmethod
+    def _job_dict(row):
+        d = dict(row)
+        d["request"] = json.loads(d["request"])
+        d["summary"] = json.loads(d["summary"]) if d["summary"] else None
+        return d
+
+
+def validate(req):
+    """Normalise a submitted job; raises ValueError with a client-facing message."""
+    if not isinstance(req, dict):
+        raise ValueError("body must be a JSON object")
+    for field in ("suites", "sizes", "subsystems"):
+        if not isinstance(req.get(field) or [], list):
+            raise ValueError(f"{field} must be a list")
+    out = {"ref": str(req.get("ref") or "HEAD"),
+           "suites": req.get("suites") or [],
+           "sizes": [int(n) for n in req.get("sizes") or []],
+           "subsystems": req.get("subsystems") or [],
+           "quick": bool(req.get("quick", False)),
+           "submitter": req.get("submitter")}
+    bad = [s for s in out["suites"] if s not in run_benchmark.SUITES]
+    if bad:
+        raise ValueError(f"unknown suites {bad}; have {list(run_benchmark.SUITES)}")
+    bad = [s for s in out["subsystems"] if s not in SUBSYSTEMS]
+    if bad:
+        raise ValueError(f"unknown subsystems {bad}; have {list(SUBSYSTEMS)}")
+    if subprocess.run(["git", "rev-parse", "--verify", "--quiet", out["ref"] + "^{commit}"],
+                      cwd=REPO, capture_output=True).returncode != 0:
+        raise ValueError(f"unknown git ref {out['ref']!r}")
+    return out
+
+
+def run_command(req, checkout, cpus):
+    """The run_benchmark.py command line for a job, run inside `checkout`."""
+    cmd = [sys.executable, str(checkout / "benchmark" / "run_benchmark.py"), "--no-history"]
+    if req["suites"]:
+        cmd += ["--suites", *req["suites"]]
+    if req["sizes"]:
+        cmd += ["--sizes", ",".join(str(n) for n in req["sizes"])]
+    if req["quick"]:
+        cmd.append("--quick")
+    cmd += [f"--skip-{s}" for s in SUBSYSTEMS if s not in req["subsystems"]]
+    if cpus:
+        cmd += ["--cpus", ",".join(str(c) for c in cpus)]
+    return cmd
+
+
+def summarize(rows):
+    ratios = [r["ratio"] for r in rows if r.get("ratio") and r["ratio"] > 0]
+    counts = {}
+    for r in rows:
+        counts[r.get("status")] = counts.get(r.get("status"), 0) + 1
+    return {"rows": len(rows), "status": counts,
+            "geomean": math.exp(sum(math.log(x) for x in ratios) / len(ratios)) if ratios else None}
+
+
+class Runner:
+    """The single worker: takes queued jobs oldest-first and runs them one at a time."""
+
+    def __init__(self, store, state, cpus):
+        self.store = store
+        self.state = state
+        self.cpus = cpus
+        self.wake = threading.Event()
+        self.current = None          # (job id, Popen) of the running job
+        self.lock = threading.Lock()
+
+    def log_path(self, job_id):
+        return self.state / "jobs" / str(job_id) / "run.log"
+
+    def loop(self):
+        while True:
+            job = self.store.next_queued()
+            if job is None:
+                self.wake.wait(5)
+                self.wake.clear()
+                continue
+            try:
+                self.run(job)
+            except Exception as e:      # never let one job take the worker thread down
+                self.store.update(job["id"], status="failed", finished=time.time(),
+                                  error=f"{type(e).__name__}: {e}")
+
+    def cancel(self, job_id):
+        with self.lock:
+            if self.current and self.current[0] == job_id:
+                os.killpg(self.current[1].pid, signal.SIGTERM)
+                self.store.update(job_id, status="cancelled")
+                return True
+            # queued, or claimed but not launched yet (run() checks again before starting it)
+            return self.store.transition(job_id, ("queued", "running"), "cancelled",
+                                         finished=time.time())
+
+    def run(self, job):
+        job_id, req = job["id"], job["request"]
+        if not self.store.transition(job_id, ("queued",), "running", started=time.time()):
+            return                      # cancelled between next_queued() and here
+        job_dir = self.state / "jobs" / str(job_id)
+        checkout = None
+        code, error = None, None
+        try:
+            job_dir.mkdir(parents=True, exist_ok=True)
+            sha = subprocess.run(["git", "rev-parse", req["ref"] + "^{commit}"], cwd=REPO,
+                                 capture_output=True, text=True).stdout.strip()
+            self.store.update(job_id, sha=sha)
+            checkout = Path(tempfile.mkdtemp(prefix=f"numsharp-bench-job{job_id}-"))
+            with open(self.log_path(job_id), "w", encoding="utf-8") as log:
+                log.write(f"job {job_id}: {req['ref']} ({sha[:8]}) submitted by {req.get('submitter') or '?'}\n")
+                log.flush()
+                subprocess.run(["git", "worktree", "add", "--detach", str(checkout), sha], cwd=REPO,
+                               stdout=log, stderr=subprocess.STDOUT, check=True)
+                cmd = run_command(req, checkout, self.cpus)
+                log.write("$ " + " ".join(cmd) + "\n")
+                log.flush()
+                # Pin the whole run (and every child it spawns) to the service's core set, in
+                # its own session so a cancel stops all of it.
+                with self.lock:
+                    if self.store.job(job_id)["status"] == "cancelled":
+                        return
+                    proc = subprocess.Popen(run_benchmark.pinned(cmd, self.cpus),
+                                            cwd=checkout / "benchmark", stdout=log,
+                                            stderr=subprocess.STDOUT, start_new_session=True)
+                    self.current = (job_id, proc)
+                code = proc.wait()
+            results = sorted((checkout / "benchmark" / "results").glob("*/"))
+            if results:
+                shutil.copytree(results[-1], job_dir / "results", dirs_exist_ok=True)
+                report = job_dir / "results" / "benchmark-report.json"
+                if report.exists():
+                    rows = json.loads(report.read_text(encoding="utf-8"))
+                    self.store.add_results(job_id, rows)
+                    self.store.update(job_id, summary=json.dumps(summarize(rows)))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            with self.lock:
+                self.current = None
+            if checkout is not None:
+                subprocess.run(["git", "worktree", "remove", "--force", str(checkout)], cwd=REPO,
+                               capture_output=True)
+                shutil.rmtree(checkout, ignore_errors=True)
+        status = self.store.job(job_id)["status"]
+        if status != "cancelled":
+            status = "done" if code == 0 and error is None else "failed"
+        self.store.update(job_id, status=status, finished=time.time(), exit_code=code, error=error,
+                          results_dir=str(job_dir / "results"))
+
+
+def make_handler(store, runner):
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "NumSharpBench/1"
+
+        def log_message(self, fmt, *args):
+            sys.stderr.write(f"[service] {self.address_string()} {fmt % args}\n")
+
+        def reply(self, code, obj):
+            body = json.dumps(obj, indent=2).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def route(self):
+            url = urlparse(self.path)
+            parts = [p for p in url.path.split("/") if p]
+            job_id = int(parts[1]) if len(parts) >= 2 and parts[0] == "jobs" and parts[1].isdigit() else None
+            return parts, job_id, parse_qs(url.query)
+
+        def do_GET(self):
+            parts, job_id, query = self.route()
+            if parts == ["health"]:
+                return self.reply(200, {"ok": True, "queued": sum(j["status"] == "queued" for j in store.jobs())})
+            if parts == ["jobs"]:
+                return self.reply(200, store.jobs())
+            job = store.job(job_id) if job_id else None
+            if job is None:
+                return self.reply(404, {"error": "no such job"})
+            if len(parts) == 2:
+                if job["status"] == "queued":
+                    job["position"] = store.position(job_id)
+                return self.reply(200, job)
+            if parts[2] == "results":
+                return self.reply(200, store.results(job_id))
+            if parts[2] == "log":
+                offset = int(query.get("offset", ["0"])[0])
+                text = ""
+                path = runner.log_path(job_id)
+                if path.exists():
+                    with open(path, encoding="utf-8", errors="replace") as f:
+                        f.seek(offset)
+                        text = f.read()
+                        offset = f.tell()
+                return self.reply(200, {"offset": offset, "text": text,
+                                        "done": job["status"] not in ("queued", "running")})
+            if parts[2] == "stream":
+                return self.stream(job_id)
+            return self.reply(404, {"error": "unknown endpoint"})
+
+        def stream(self, job_id):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.end_headers()
+            path, offset = runner.log_path(job_id), 0
+            try:
+                while True:
+                    done = store.job(job_id)["status"] not in ("queued", "running")
+                    if path.exists():
+                        with open(path, "rb") as f:
+                            f.seek(offset)
+                            chunk = f.read()
+                        if chunk:
+                            self.wfile.write(chunk)
+                            self.wfile.flush()
+                            offset += len(chunk)
+                    if done:
+                        return
+                    time.sleep(1)
+            except (BrokenPipeError, ConnectionResetError):
+                return
+
+        def do_POST(self):
+            parts, _, _ = self.route()
+            if parts != ["jobs"]:
+                return self.reply(404, {"error": "unknown endpoint"})
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                req = validate(json.loads(self.rfile.read(length) or b"{}"))
+            except (ValueError, TypeError) as e:
+                return self.reply(400, {"error": str(e)})
+            job_id = store.submit(req)
+            runner.wake.set()
+            self.reply(202, {"id": job_id, "status": "queued", "position": store.position(job_id)})
+
+        def do_DELETE(self):
+            _, job_id, _ = self.route()
+            if job_id is None or store.job(job_id) is None:
+                return self.reply(404, {"error": "no such job"})
+            if runner.cancel(job_id):
+                return self.reply(200, store.job(job_id))
+            self.reply(409, {"error": f"job is {store.job(job_id)['status']}"})
+
+    return Handler
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Resident NumSharp benchmark runner (local HTTP API)")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--state", type=Path, default=DEFAULT_STATE,
+                    help=f"SQLite store + per-job logs/results (default {DEFAULT_STATE})")
+    ap.add_argument("--cpus", type=str, default=None,
+                    help="Core set every job is pinned to, e.g. 4-11 (default: all allowed cores)")
+    args = ap.parse_args()
+
+    cpus = None
+    if args.cpus:
+        cpus = run_benchmark.parse_cpu_list(args.cpus)
+    args.state.mkdir(parents=True, exist_ok=True)
+    store = Store(args.state / "service.db")
+    runner = Runner(store, args.state, cpus)
+    threading.Thread(target=runner.loop, daemon=True).start()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(store, runner))
+    print(f"[service] http://127.0.0.1:{args.port}  state={args.state}  cpus={cpus or 'all'}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# =============================================================================
+# bench_timing.py — the ONE timing protocol for the NumPy twin benches
+# (benchmark/*/*_bench.py, test/NumSharp.Benchmark/np.concatenate.bench.py).
+#
+# Policy, identical to the C# twins' BestMs / Best:
+#   * `warm` untimed calls,
+#   * `rounds` timed rounds of `iters` back-to-back calls each,
+#   * one sample per round = round time / iters (ms per call),
+#   * the samples are reduced by an ESTIMATOR.
+# Per-bench (iters, warm, rounds) tables stay with each bench — they mirror its
+# C# twin's table. Only the statistic is centralised.
+#
+# Estimators: min (best-of-rounds, the C# twins' statistic and the default),
+# median, mean. BENCH_ESTIMATOR=<name> switches every bench of a run at once;
+# register_estimator() adds more. The C# twins always report min, so keep the
+# default when the numbers are paired into NumSharp/NumPy ratios.
+#
+# Emission: fmt_row()/row() produce the `key\tms` TSV line the sheets parse
+# (bench_common.parse_tsv). With BENCH_JSONL=<path> each row is also appended
+# to that file as one JSON object with its raw per-round samples.
+# =============================================================================
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+
+ESTIMATORS = {
+    "min": min,
+    "median": statistics.median_high,   # ts[n // 2] of the sorted samples, as the C# harnesses
+    "mean": statistics.fmean,
+}
+ESTIMATOR = os.environ.get("BENCH_ESTIMATOR", "min")
+JSONL = os.environ.get("BENCH_JSONL")
+
+# Samples of the most recent measurement, attached to the next JSONL row.
+_last = {}
+
+
+def register_estimator(name, fn):
+    """Add an estimator: fn(list of per-call ms samples) -> ms."""
+    ESTIMATORS[name] = fn
+
+
+def env_estimator(default):
+    """BENCH_ESTIMATOR when set, else `default` (for benches whose twin uses another statistic)."""
+    return os.environ.get("BENCH_ESTIMATOR", default)
+
+
+def measure(f, iters, warm, rounds, collect=False):
+    """Per-round ms-per-call samples of f: `warm` untimed calls, then `rounds` x `iters` timed.
+
+    collect=True runs gc.collect() before each round (the C# twins that GC.Collect per round).
+    """
+    for _ in range(warm):
+        f()
+    samples = []
+    for _ in range(rounds):
+        if collect:
+            gc.collect()
+        t = time.perf_counter()
+        for _ in range(iters):
+            f()
+        samples.append((time.perf_counter() - t) * 1000.0 / iters)
+    return samples
+
+
+def estimate(samples, estimator=None):
+    name = estimator or ESTIMATOR
+    try:
+        return ESTIMATORS[name](samples)
+    except KeyError:
+        raise ValueError(f"unknown estimator {name!r} (have: {', '.join(ESTIMATORS)})") from None
+
+
+def time_ms(f, iters, warm, rounds, estimator=None, collect=False):
+    """ms per call of f under the shared policy, reduced by `estimator` (default ESTIMATOR)."""
+    samples = measure(f, iters, warm, rounds, collect)
+    _last.update(samples=samples, iters=iters, estimator=estimator or ESTIMATOR)
+    return estimate(samples, estimator)
+
+
+def fmt_row(key, ms):
+    """The `key\\tms` TSV line for one result (also appended to BENCH_JSONL when set)."""
+    if JSONL:
+        rec = {"bench": os.path.basename(sys.argv[0]), "key": key, "ms": ms,
+               "estimator": _last.get("estimator", ESTIMATOR), "iters": _last.get("iters"),
+               "samples_ms": _last.get("samples")}
+        with open(JSONL, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(rec) + "\n")
+    _last.clear()
+    return f"{key}\t{ms:.6g}"
+
+
+def row(key, ms):
+    print(fmt_row(key, ms), flush=True)
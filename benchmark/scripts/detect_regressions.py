@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Per-key regression / improvement detection of one run against the benchmark history.
+
+For every op-matrix cell (suite, op, dtype, N) and every subsystem key (nditer / layout /
+operand / cast) the NPY/NS ratio series is pulled from the results store (``results_db.py``,
+history snapshots ingested on demand) and tested for a shift that includes the run:
+
+  change-point   the best single split of the log-ratio series (the run is always in the
+                 "after" segment); z = Δmean / (σ·√(1/a + 1/b)), σ = the subsystem's
+                 pooled run-to-run noise (robust: MAD of consecutive differences over all
+                 its keys), p Bonferroni-corrected for the number of splits tried.
+  Mann-Whitney   when both the run and the last run before the split kept their raw samples
+                 (``results/<run_ts>/``: NumPy ``samples_ns`` in numpy-results.jsonl, BDN
+                 Measurements in csharp/*.json), each side is tested sample-vs-sample and the
+                 smaller p (×2) replaces the series z — the side that moved is named.
+
+p-values are controlled for the number of keys tested (Benjamini-Hochberg, ``--fdr``), and a
+shift must also be at least ``--min-shift`` in size. Only shifts whose new level starts at the
+tested run are reported (``--persisting`` adds older ones still in effect). Findings are
+ranked by shift size; each names the suspect commit range (``old..new``). Only credible
+cells (see merge-results.py classify) take part.
+
+Output is ``regressions.md`` in the snapshot plus a MANIFEST.md line (``--write``); without
+it the report goes to stdout. ``snapshot_history.py`` runs this for each new snapshot.
+
+Usage
+-----
+  python benchmark/scripts/detect_regressions.py                          # latest snapshot
+  python benchmark/scripts/detect_regressions.py --run 2026-06-29_2d16f477 --write
+  python benchmark/scripts/detect_regressions.py --fdr 0.01 --min-shift 0.10 --window 10
+"""
+import argparse
+import glob
+import json
+import math
+import subprocess
+import sys
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent      # benchmark/scripts
+sys.path.insert(0, str(HERE))
+import results_db  # noqa: E402
+
+BENCH = HERE.parent
+REPO = BENCH.parent
+RESULTS = BENCH / "results"
+CREDIBLE = results_db.CREDIBLE
+DEFAULT_NOISE = 0.05     # log-ratio σ when a subsystem has no run-to-run pairs yet
+MAX_SAMPLES = 4000       # per side per run: Mann-Whitney on an even stride beyond this
+
+
+# ---- statistics --------------------------------------------------------------
+def norm_sf2(z):
+    """Two-sided normal p-value of |z|."""
+    return math.erfc(abs(z) / math.sqrt(2.0))
+
+
+def mann_whitney(a, b):
+    """Two-sided Mann-Whitney U p-value (normal approximation, tie-corrected)."""
+    n1, n2 = len(a), len(b)
+    if n1 < 3 or n2 < 3:
+        return None
+    pooled = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    r1, ties, i = 0.0, 0.0, 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        rank = (i + j) / 2.0 + 1.0
+        t = j - i + 1
+        ties += t ** 3 - t
+        r1 += rank * sum(1 for k in range(i, j + 1) if pooled[k][1] == 0)
+        i = j + 1
+    u = r1 - n1 * (n1 + 1) / 2.0
+    n = n1 + n2
+    var = n1 * n2 / 12.0 * ((n + 1) - ties / (n * (n - 1)))
+    if var <= 0:
+        return 1.0
+    return norm_sf2((u - n1 * n2 / 2.0) / math.sqrt(var))
+
+
+def benjamini_hochberg(ps):
+    """q-values for a list of p-values (same order)."""
+    order = sorted(range(len(ps)), key=lambda i: ps[i])
+    q, running = [1.0] * len(ps), 1.0
+    for rank in range(len(ps), 0, -1):
+        i = order[rank - 1]
+        running = min(running, ps[i] * len(ps) / rank)
+        q[i] = running
+    return q
+
+
+def pooled_noise(series):
+    """Robust σ of one run-to-run log-ratio step, over all keys: 1.4826·MAD(Δ)/√2."""
+    diffs = sorted(abs(b - a) for xs in series for a, b in zip(xs, xs[1:]))
+    if not diffs:
+        return DEFAULT_NOISE
+    return max(1.4826 * diffs[len(diffs) // 2] / math.sqrt(2.0), 1e-3)
+
+
+def change_point(xs, sigma):
+    """(split, z, p) of the best single mean shift of xs whose 'after' segment holds xs[-1]."""
+    n = len(xs)
+    best = None
+    for k in range(1, n):
+        a, b = xs[:k], xs[k:]
+        z = (sum(b) / len(b) - sum(a) / len(a)) / (sigma * math.sqrt(1.0 / len(a) + 1.0 / len(b)))
+        if best is None or abs(z) > abs(best[1]):
+            best = (k, z)
+    k, z = best
+    return k, z, min(1.0, norm_sf2(z) * (n - 1))
+
+
+# ---- raw samples (scratch results/<run_ts>/ only) ---------------------------
+def _thin(xs):
+    return xs[::math.ceil(len(xs) / MAX_SAMPLES)] if len(xs) > MAX_SAMPLES else xs
+
+
+def raw_samples(directory, mr):
+    """{(normalized op, dtype, n): {"numpy": [ns], "numsharp": [ns]}} of a results dir."""
+    out = {}
+    for path in sorted(glob.glob(str(directory / "numpy-*.jsonl"))):
+        for r in mr.load_numpy_results(path):
+            if r.get("samples_ns") and r.get("cache", "warm") == "warm":
+                out.setdefault(mr.join_key(r), {})["numpy"] = _thin(mr.decode_samples(r["samples_ns"]).tolist())
+    for r in mr.load_csharp_results(str(directory / "csharp"), keep_samples=True):
+        if r.get("samples_ns"):
+            out.setdefault(mr.join_key(r), {})["numsharp"] = _thin(mr.decode_samples(r["samples_ns"]).tolist())
+    return out
+
+
+class RawSamples:
+    """Lazily loaded raw samples per run name (None when the scratch dir is gone)."""
+
+    def __init__(self, conn):
+        self.conn, self.cache, self.mr = conn, {}, None
+
+    def __call__(self, run):
+        if run not in self.cache:
+            row = self.conn.execute("SELECT run_ts, source_dir FROM runs WHERE name=?", (run,)).fetchone()
+            dirs = [RESULTS / (row["run_ts"] or ""), Path(row["source_dir"] or "")] if row else []
+            found = next((d for d in dirs if d.name and (d / "csharp").is_dir()
+                          and glob.glob(str(d / "numpy-*.jsonl"))), None)
+            if found is not None and self.mr is None:
+                self.mr = results_db._merge_module()
+            self.cache[run] = raw_samples(found, self.mr) if found is not None else None
+        return self.cache[run]
+
+
+# ---- detection ---------------------------------------------------------------
+def load_series(conn, run, window):
+    """[(subsystem, key, [(run, commit, log ratio)], op-matrix row of `run` or None)]."""
+    runs = conn.execute("SELECT id, name, commit_sha FROM runs WHERE run_ts <= "
+                        "(SELECT run_ts FROM runs WHERE name=?) ORDER BY run_ts DESC LIMIT ?",
+                        (run, window)).fetchall()[::-1]
+    if not runs or runs[-1]["name"] != run:
+        raise SystemExit(f"run {run!r} not in the results store")
+    order = {r["id"]: i for i, r in enumerate(runs)}
+    marks = ",".join("?" * len(runs))
+    points = {}
+    for m in conn.execute(f"SELECT run_id, subsystem, key, value, status, extra FROM measurements "
+                          f"WHERE side='ratio' AND run_id IN ({marks})", [r["id"] for r in runs]):
+        if not m["value"] or m["value"] <= 0:
+            continue
+        if m["subsystem"] == "matrix" and m["status"] not in CREDIBLE:
+            continue
+        points.setdefault((m["subsystem"], m["key"]), []).append((order[m["run_id"]], m["value"], m["extra"]))
+    last = len(runs) - 1
+    out = []
+    for (subsystem, key), pts in points.items():
+        pts.sort()
+        if pts[-1][0] != last or len(pts) < 2:
+            continue
+        row = json.loads(pts[-1][2]) if pts[-1][2] else None
+        if row and (row.get("threads") or 1) != 1:
+            continue
+        out.append((subsystem, key, [(runs[i]["name"], runs[i]["commit_sha"], math.log(v))
+                                     for i, v, _ in pts], row))
+    return out
+
+
+WINDOW, FDR, MIN_SHIFT = 20, 0.05, 0.05
+
+
+def detect(conn, run, window=WINDOW, fdr=FDR, min_shift=MIN_SHIFT, persisting=False):
+    """(all tests, significant shifts ranked by size, σ per subsystem).
+
+    Unless `persisting`, only shifts whose new level starts at `run` count: an older shift
+    still in effect was reported with the run where it appeared.
+    """
+    series = load_series(conn, run, window)
+    sigma = {}
+    for sub in {s for s, _, _, _ in series}:
+        sigma[sub] = pooled_noise([[x for _, _, x in pts] for s, _, pts, _ in series if s == sub])
+    raw = RawSamples(conn)
+    tests = []
+    for subsystem, key, pts, row in series:
+        xs = [x for _, _, x in pts]
+        k, z, p = change_point(xs, sigma[subsystem])
+        before = math.exp(sum(xs[:k]) / k)
+        after = math.exp(sum(xs[k:]) / (len(xs) - k))
+        method, moved = "change-point", None
+        if subsystem == "matrix" and row:
+            old, new = raw(pts[k - 1][0]), raw(run)
+            if old and new:
+                jk = (raw.mr.normalize_op_name(row["operation"]), row["dtype"].lower(), row["n"])
+            if old and new and jk in old and jk in new:
+                side_p = {side: mann_whitney(old[jk][side], new[jk][side])
+                          for side in ("numpy", "numsharp") if side in old[jk] and side in new[jk]}
+                side_p = {s: v for s, v in side_p.items() if v is not None}
+                if side_p:
+                    moved = min(side_p, key=side_p.get)
+                    p, method = min(1.0, side_p[moved] * len(side_p)), "mann-whitney"
+        tests.append({"subsystem": subsystem, "key": key, "before": before, "now": math.exp(xs[-1]),
+                      "level": after, "shift": after / before - 1.0, "z": z, "p": p,
+                      "method": method, "moved": moved, "runs": len(xs),
+                      "since": pts[k][0], "range": (pts[k - 1][1], pts[k][1])})
+    for t, q in zip(tests, benjamini_hochberg([t["p"] for t in tests])):
+        t["q"] = q
+    hits = [t for t in tests if t["q"] < fdr and abs(t["shift"]) >= min_shift
+            and (persisting or t["since"] == run)]
+    hits.sort(key=lambda t: -abs(math.log1p(t["shift"])))
+    return tests, hits, sigma
+
+
+def commit_count(a, b):
+    if not a or not b:
+        return None
+    r = subprocess.run(["git", "rev-list", "--count", f"{a}..{b}"], cwd=REPO,
+                       capture_output=True, text=True)
+    return int(r.stdout) if r.returncode == 0 and r.stdout.strip().isdigit() else None
+
+
+# ---- report ------------------------------------------------------------------
+def render(run, tests, hits, sigma, window=WINDOW, fdr=FDR, min_shift=MIN_SHIFT, top=25):
+    counts = {}
+    L = [f"## Regressions vs history — {run}", "",
+         f"_{len(tests)} keys with ≥2 runs tested over the last {window} runs of the results store. "
+         f"Ratio = NumPy ÷ NumSharp (>1.0× = NumSharp faster); a **regression** is a ratio drop. "
+         f"Change-point z on the log-ratio series (run-to-run noise σ: "
+         + ", ".join(f"{s} {v:.1%}" for s, v in sorted(sigma.items()))
+         + "); Mann-Whitney U on raw samples where both runs kept them. "
+         f"Benjamini-Hochberg q < {fdr}, |shift| ≥ {min_shift:.0%}._", ""]
+    for title, icon, sel in (("Regressions", "🔴", lambda t: t["shift"] < 0),
+                             ("Improvements", "✅", lambda t: t["shift"] > 0)):
+        rows = [t for t in hits if sel(t)]
+        L.append(f"### {icon} {title} ({len(rows)})")
+        L.append("")
+        if not rows:
+            L += ["_none_", ""]
+            continue
+        L += ["| # | Subsystem | Key | before | level | now | shift | q | test | since | suspect commits |",
+              "|--:|---|---|--:|--:|--:|--:|--:|---|---|---|"]
+        for i, t in enumerate(rows[:top], 1):
+            a, b = t["range"]
+            span = f"`{a}..{b}`" if a and b else "-"
+            if a and b:
+                n = counts.setdefault((a, b), commit_count(a, b))
+                span += f" ({n} commits)" if n is not None else ""
+            test = t["method"] + (f" ({t['moved']})" if t["moved"] else "")
+            key = t["key"].replace("|", " \\| ")
+            L.append(f"| {i} | {t['subsystem']} | {key} | {t['before']:.3g}× | {t['level']:.3g}× "
+                     f"| {t['now']:.3g}× | {t['shift']:+.0%} | {t['q']:.2g} | {test} | {t['since']} | {span} |")
+        if len(rows) > top:
+            L.append(f"\n_+{len(rows) - top} more below the top {top}._")
+        L.append("")
+    return "\n".join(L) + "\n"
+
+
+def write_snapshot(run, report):
+    """regressions.md in the snapshot + a MANIFEST.md pointer (replaced on re-run)."""
+    snap = results_db.HISTORY / run
+    if not snap.is_dir():
+        raise SystemExit(f"no snapshot dir {snap}")
+    (snap / "regressions.md").write_text(report, encoding="utf-8")
+    manifest = snap / "MANIFEST.md"
+    if manifest.exists():
+        text = manifest.read_text(encoding="utf-8").split("\n## Regressions vs history", 1)[0]
+        counts = " · ".join(part.split("\n", 1)[0] for part in report.split("\n### ")[1:])
+        manifest.write_text(text.rstrip("\n") + "\n\n## Regressions vs history\n"
+                            + f"{counts} — see [`regressions.md`](regressions.md).\n", encoding="utf-8")
+    return snap / "regressions.md"
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Per-key regression detection against benchmark history")
+    ap.add_argument("--db", type=Path, default=results_db.DEFAULT_DB)
+    ap.add_argument("--run", default=None, help="Run to test (default: newest in the store)")
+    ap.add_argument("--window", type=int, default=WINDOW, help="Runs of history per key (default 20)")
+    ap.add_argument("--fdr", type=float, default=FDR, help="Benjamini-Hochberg q threshold (default 0.05)")
+    ap.add_argument("--min-shift", type=float, default=MIN_SHIFT,
+                    help="Smallest ratio shift reported, as a fraction (default 0.05)")
+    ap.add_argument("--persisting", action="store_true",
+                    help="Also report older shifts still in effect (default: only those starting at the run)")
+    ap.add_argument("--top", type=int, default=25, help="Rows per table (default 25)")
+    ap.add_argument("--write", action="store_true",
+                    help="Write regressions.md into the run's snapshot and point MANIFEST.md at it")
+    args = ap.parse_args()
+
+    conn = results_db.connect(args.db)
+    results_db.ingest_history(conn, missing_only=True)
+    run = args.run or results_db.latest_run(conn)
+    tests, hits, sigma = detect(conn, run, args.window, args.fdr, args.min_shift, args.persisting)
+    report = render(run, tests, hits, sigma, args.window, args.fdr, args.min_shift, args.top)
+    if args.write:
+        print(f"[regressions] {sum(t['shift'] < 0 for t in hits)} regressions, "
+              f"{sum(t['shift'] > 0 for t in hits)} improvements -> {write_snapshot(run, report)}")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
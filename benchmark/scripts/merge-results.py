@@ -15,14 +15,19 @@ Usage:
 Note: This script is typically invoked from run-benchmarks.ps1 with explicit paths.
 """
 
+import base64
 import json
+import math
 import os
+import re
 import sys
 import argparse
 import glob
+from array import array
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
 @dataclass
 class UnifiedResult:
@@ -37,45 +42,172 @@ class UnifiedResult:
     ratio: Optional[float]  # NumPy / NumSharp  (>1.0× = NumSharp faster)
     pct_numpy: Optional[float]  # NumSharp/NumPy × 100 = share of NumPy's time NumSharp uses
     status: str  # "faster", "close", "slower", "much_slower", "negligible", "no_data"
+    ratio_low: Optional[float] = None   # 95% interval on ratio (see ratio_ci_method)
+    ratio_high: Optional[float] = None
+    ratio_ci_method: Optional[str] = None      # "bootstrap" (both sides' raw samples) / "bounds" (per-side mean CIs)
+    numpy_alloc_mb: Optional[float] = None     # tracemalloc peak per call (buffers included)
+    numsharp_alloc_mb: Optional[float] = None  # BDN MemoryDiagnoser: MANAGED bytes per op only
+    bytes_moved: Optional[int] = None          # compulsory traffic per call (NumPy-side model)
+    numpy_gbps: Optional[float] = None
+    numsharp_gbps: Optional[float] = None      # same bytes over NumSharp's time = numpy_gbps × ratio
+    numpy_pct_peak: Optional[float] = None     # % of the STREAM peak measured by the NumPy run
+    numsharp_pct_peak: Optional[float] = None
+    threads: Optional[int] = None              # NumPy BLAS thread count (BLAS ops only)
+    numpy_p90_ms: Optional[float] = None       # per-sample latency percentiles (both sides
+    numpy_p99_ms: Optional[float] = None       # average each sample over its inner calls)
+    numsharp_p90_ms: Optional[float] = None
+    numsharp_p99_ms: Optional[float] = None
+    p99_ratio: Optional[float] = None          # NumPy p99 / NumSharp p99 (>1.0× = NumSharp's tail shorter)
+    carried_from: Optional[str] = None         # set when copied from an older report (--carry)
 
     def to_dict(self) -> dict:
         return asdict(self)
 
 
 def load_numpy_results(path: str) -> List[dict]:
-    """Load NumPy benchmark results from JSON."""
+    """Load NumPy benchmark results from a JSON array or a JSONL stream.
+
+    numpy_benchmark.py --output *.jsonl appends one row per line as each cell finishes, so a
+    stream may end in a torn line (killed mid-write; skipped) or repeat a key after a resumed
+    run (the last row wins)."""
     if not os.path.exists(path):
         print(f"Warning: NumPy results not found at {path}")
         return []
     with open(path, 'r') as f:
-        return json.load(f)
-
-
-def load_csharp_results(artifacts_dir: str) -> List[dict]:
-    """Load BenchmarkDotNet results from artifacts directory."""
+        if not path.endswith('.jsonl'):
+            return json.load(f)
+        rows: Dict[tuple, dict] = {}
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                r = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            rows[(r.get('suite'), r.get('name'), r.get('dtype'), r.get('n'))] = r
+        return list(rows.values())
+
+
+def split_cache_modes(numpy_results: List[dict]) -> tuple:
+    """(warm rows, cold rows). BDN always times warm, so only warm NumPy rows are joined;
+    cold rows (numpy_benchmark.py --cache-mode cold/both) feed the cold-penalty table."""
+    warm = [r for r in numpy_results if r.get('cache', 'warm') != 'cold']
+    cold = [r for r in numpy_results if r.get('cache', 'warm') == 'cold']
+    return warm, cold
+
+
+def cold_penalty(warm: List[dict], cold: List[dict]) -> Dict[tuple, float]:
+    """Median cold ÷ warm NumPy time per (suite, N), over ops timed both ways."""
+    warm_ms = {(r['name'], r['dtype'], r['n']): r.get('median_ms') or r['mean_ms'] for r in warm}
+    by_cell: Dict[tuple, List[float]] = {}
+    for r in cold:
+        key = (r['name'].replace(' [cold]', ''), r['dtype'], r['n'])
+        base = warm_ms.get(key)
+        if base:
+            by_cell.setdefault((r.get('suite', 'General'), r['n']), []).append(
+                (r.get('median_ms') or r['mean_ms']) / base)
+    return {k: sorted(v)[len(v) // 2] for k, v in by_cell.items()}
+
+
+# Parsed BDN rows are cached next to the artifacts, keyed by each report's size + mtime, so
+# re-merging a run (results_db ingest, detect_regressions, --carry) skips the JSON parse of
+# the full-compressed reports. Bump when parse_bdn_benchmark's output changes.
+PARSE_CACHE = ".parsed-rows.json"
+PARSE_CACHE_VERSION = 3
+STREAM_CHUNK = 1 << 20      # characters read per step by iter_bdn_benchmarks
+
+
+def load_csharp_results(artifacts_dir: str, keep_samples: bool = False) -> List[dict]:
+    """Load BenchmarkDotNet results from artifacts directory.
+
+    ``keep_samples`` keeps each row's per-op workload samples as ``samples_ns`` (base64
+    float32, the NumPy side's encoding — see decode_samples)."""
     results = []
     if not os.path.exists(artifacts_dir):
         print(f"Warning: C# artifacts not found at {artifacts_dir}")
         return []
 
+    cache_path = os.path.join(artifacts_dir, PARSE_CACHE)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') != PARSE_CACHE_VERSION:
+            cache = None
+    except (OSError, ValueError):
+        cache = None
+    files = (cache or {}).get('files', {})
+    fresh: Dict[str, dict] = {}
+
     # Find all *-report*.json files (including -full-compressed.json)
     for pattern in ["*-report.json", "*-report-full-compressed.json"]:
         full_pattern = os.path.join(artifacts_dir, pattern)
-        for json_file in glob.glob(full_pattern):
-            try:
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
-                    if 'Benchmarks' in data:
-                        for bench in data['Benchmarks']:
-                            result = parse_bdn_benchmark(bench)
-                            if result:
-                                results.append(result)
-            except Exception as e:
-                print(f"Warning: Failed to parse {json_file}: {e}")
-
+        for json_file in sorted(glob.glob(full_pattern)):
+            st = os.stat(json_file)
+            name = os.path.basename(json_file)
+            hit = files.get(name)
+            if not (hit and hit['size'] == st.st_size and hit['mtime_ns'] == st.st_mtime_ns):
+                try:
+                    rows = [r for r in map(parse_bdn_benchmark, iter_bdn_benchmarks(json_file)) if r]
+                except Exception as e:
+                    print(f"Warning: Failed to parse {json_file}: {e}")
+                    continue
+                hit = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'rows': rows}
+            fresh[name] = hit
+            results.extend(hit['rows'])
+
+    if fresh != files:
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': PARSE_CACHE_VERSION, 'files': fresh}, f)
+        except OSError:
+            pass  # read-only artifacts: parse again next time
+    if not keep_samples:
+        results = [{k: v for k, v in r.items() if k != 'samples_ns'} for r in results]
     return results
 
 
+def iter_bdn_benchmarks(path: str):
+    """Yield the entries of a BDN report's top-level "Benchmarks" array one at a time.
+
+    The file is read in STREAM_CHUNK pieces and each entry is decoded on its own with
+    raw_decode, so the HostEnvironmentInfo block is never parsed and only one benchmark's
+    Measurements are alive at a time (a full-compressed report is mostly Measurements)."""
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = ''
+        while True:
+            i = buf.find('"Benchmarks"')
+            j = buf.find('[', i) if i >= 0 else -1
+            if j >= 0:
+                pos = j + 1
+                break
+            chunk = f.read(STREAM_CHUNK)
+            if not chunk:
+                return
+            buf = (buf[i:] if i >= 0 else buf[-len('"Benchmarks"'):]) + chunk
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if pos == len(buf):
+                buf, pos = f.read(STREAM_CHUNK), 0
+                if not buf:
+                    raise ValueError("truncated Benchmarks array")
+                continue
+            if buf[pos] == ']':
+                return
+            try:
+                bench, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # entry split across chunks: grow the window (at least doubling) and retry
+                chunk = f.read(max(STREAM_CHUNK, len(buf) - pos))
+                if not chunk:
+                    raise
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            yield bench
+
+
 def parse_bdn_benchmark(bench: dict) -> Optional[dict]:
     """Parse a single BenchmarkDotNet benchmark result."""
     try:
@@ -108,6 +240,17 @@ def parse_bdn_benchmark(bench: dict) -> Optional[dict]:
 
         stddev_ns = stats.get('StandardDeviation', stats.get('StdDev', 0))
         stddev_ms = stddev_ns / 1_000_000
+        stderr_ms = stats['StandardError'] / 1_000_000 if 'StandardError' in stats else None
+
+        # BDN's 99.9% CI on the mean (ns); absent on dry/failed runs.
+        ci = stats.get('ConfidenceInterval') or {}
+        ci_low_ms = ci['Lower'] / 1_000_000 if 'Lower' in ci else None
+        ci_high_ms = ci['Upper'] / 1_000_000 if 'Upper' in ci else None
+
+        # MemoryDiagnoser counts managed allocations only; NumSharp's array buffers are
+        # unmanaged, so this is the per-op object overhead, not the buffer bytes.
+        alloc = (bench.get('Memory') or {}).get('BytesAllocatedPerOperation')
+        alloc_mb = alloc / (1024 * 1024) if alloc is not None else None
 
         # Map dtype to numpy names
         dtype_map = {
@@ -120,6 +263,7 @@ def parse_bdn_benchmark(bench: dict) -> Optional[dict]:
 
         # Clean up method title
         operation = method_title.strip("'")
+        samples = bdn_samples(bench)
 
         return {
             'name': operation,
@@ -127,13 +271,64 @@ def parse_bdn_benchmark(bench: dict) -> Optional[dict]:
             'dtype': dtype,
             'n': n,
             'mean_ms': mean_ms,
-            'stddev_ms': stddev_ms
+            'stddev_ms': stddev_ms,
+            'stderr_ms': stderr_ms,
+            'ci_low_ms': ci_low_ms,
+            'ci_high_ms': ci_high_ms,
+            'alloc_mb': alloc_mb,
+            **bdn_percentiles(bench, samples),
+            'samples_ns': encode_samples(samples) if samples else None,
         }
     except Exception as e:
         print(f"Warning: Failed to parse benchmark: {e}")
         return None
 
 
+def bdn_samples(bench: dict) -> List[float]:
+    """Per-op ns of each workload Result iteration (Actual when Result is missing); [] when
+    the report has no Measurements (brief exporter, dry runs)."""
+    for stage in ('Result', 'Actual'):
+        samples = [m['Nanoseconds'] / m['Operations'] for m in bench.get('Measurements') or []
+                   if m.get('IterationMode') == 'Workload' and m.get('IterationStage') == stage
+                   and m.get('Operations')]
+        if samples:
+            return samples
+    return []
+
+
+def encode_samples(samples_ns: List[float]) -> str:
+    """Base64 of little-endian float32 ns — numpy_benchmark.py's samples_ns encoding."""
+    a = array('f', samples_ns)
+    if sys.byteorder != 'little':
+        a.byteswap()
+    return base64.b64encode(a.tobytes()).decode('ascii')
+
+
+def decode_samples(text: str) -> array:
+    """Inverse of encode_samples (either side's samples_ns) as a compact array('f')."""
+    a = array('f')
+    a.frombytes(base64.b64decode(text))
+    if sys.byteorder != 'little':
+        a.byteswap()
+    return a
+
+
+def bdn_percentiles(bench: dict, samples: Optional[List[float]] = None) -> Dict[str, Optional[float]]:
+    """p50/p90/p99/p99.9 per-op latency in ms from BDN's raw workload measurements.
+
+    BDN's Statistics.Percentiles stop at P95 (P100 = max), so the tail is recomputed from the
+    Measurements list (full JSON exporter): each workload Result/Actual iteration is one
+    sample of Nanoseconds / Operations. Falls back to Statistics.Percentiles (no p99) when the
+    measurements are not exported."""
+    samples = sorted(bdn_samples(bench) if samples is None else samples)
+    if samples:
+        pick = lambda q: samples[max(int(math.ceil(q / 100 * len(samples))), 1) - 1] / 1_000_000
+        return {'p50_ms': pick(50), 'p90_ms': pick(90), 'p99_ms': pick(99), 'p999_ms': pick(99.9)}
+    pct = (bench.get('Statistics') or {}).get('Percentiles') or {}
+    ms = lambda k: pct[k] / 1_000_000 if k in pct else None
+    return {'p50_ms': ms('P50'), 'p90_ms': ms('P90'), 'p99_ms': None, 'p999_ms': None}
+
+
 def method_to_operation(method: str) -> str:
     """Convert C# method name to operation name matching NumPy results."""
     # Map common method names to NumPy-style names
@@ -176,10 +371,20 @@ def method_to_operation(method: str) -> str:
     return mappings.get(method, method)
 
 
-def get_status(ratio: Optional[float]) -> str:
-    """Status band from ratio = NumPy ÷ NumSharp (>1.0× = NumSharp faster)."""
+def get_status(ratio: Optional[float], ratio_high: Optional[float] = None,
+               ratio_low: Optional[float] = None) -> str:
+    """Status band from ratio = NumPy ÷ NumSharp (>1.0× = NumSharp faster).
+
+    With a ratio interval, a band is only assigned when the whole interval lies in it: "faster"
+    needs the interval entirely above 1.0 (parity within noise is "close"), and an op whose
+    interval reaches into the next band up is judged by that end, so run-to-run noise is
+    reported neither as a win nor as a regression."""
     if ratio is None:
         return "no_data"
+    if ratio_high is not None:
+        ratio = max(ratio, ratio_high)
+    if ratio_low is not None and ratio_low <= 1.0:
+        ratio = min(ratio, 0.999)
     if ratio >= 1.0:
         return "faster"          # NumSharp ≥ NumPy speed
     if ratio >= 0.5:
@@ -200,16 +405,113 @@ def get_status(ratio: Optional[float]) -> str:
 WORK_FLOOR_MS = 0.001          # 1 µs — below this an op isn't doing comparable array work
 MAX_CREDIBLE_SPEEDUP = 20.0    # ratio > 20 ⇒ "NumSharp >20x faster" ⇒ artifact, not a win
 CREDIBLE = ("faster", "close", "slower", "much_slower")
+MEMORY_BOUND_PCT = 60.0        # ≥ this % of STREAM peak ⇒ the op runs at the memory roof
 
 
-def classify(numpy_ms: float, numsharp_ms: Optional[float], ratio: Optional[float]) -> str:
+def classify(numpy_ms: float, numsharp_ms: Optional[float], ratio: Optional[float],
+             ratio_high: Optional[float] = None, ratio_low: Optional[float] = None) -> str:
     """Status that also gates credibility (see WORK_FLOOR_MS / MAX_CREDIBLE_SPEEDUP)."""
     if numsharp_ms is None or ratio is None:
         return "no_data"
     if (numpy_ms < WORK_FLOOR_MS or numsharp_ms < WORK_FLOOR_MS
             or ratio > MAX_CREDIBLE_SPEEDUP):
         return "negligible"
-    return get_status(ratio)
+    return get_status(ratio, ratio_high, ratio_low)
+
+
+def mean_interval(result: dict) -> Optional[tuple]:
+    """95% normal CI on one side's mean time: BDN's StandardError, or NumPy's stddev over its
+    timed samples. The sides' stored ci_*_ms are not comparable (NumPy's is a 95% CI on the
+    median, BDN's a 99.9% CI on the mean), so the ratio bounds never use them."""
+    mean, se = result.get('mean_ms'), result.get('stderr_ms')
+    if se is None and result.get('stddev_ms') is not None and result.get('iterations'):
+        se = result['stddev_ms'] / math.sqrt(result['iterations'])
+    if not mean or se is None:
+        return None
+    return mean - CI_Z * se, mean + CI_Z * se
+
+
+def ratio_interval(np_result: dict, cs_result: Optional[dict]) -> tuple:
+    """(low, high) bounds on the ratio of means NumPy ÷ NumSharp from both sides' 95% mean
+    CIs. (None, None) unless both sides have one with a positive lower bound."""
+    if not cs_result:
+        return None, None
+    np_ci, cs_ci = mean_interval(np_result), mean_interval(cs_result)
+    if not np_ci or not cs_ci or np_ci[0] <= 0 or cs_ci[0] <= 0:
+        return None, None
+    return np_ci[0] / cs_ci[1], np_ci[1] / cs_ci[0]
+
+
+# Percentile bootstrap of the ratio of means: each side's raw samples are resampled
+# independently, BOOTSTRAP_REPS times, with a fixed seed so a report is reproducible.
+BOOTSTRAP_REPS = 2000
+BOOTSTRAP_MIN_SAMPLES = 5      # fewer samples a side: fall back to ratio_interval
+BOOTSTRAP_BLOCK = 1 << 22      # resampled values materialized per step (memory bound)
+CI_Z = 1.959964                # two-sided 95%
+
+
+def _boot_means(x, reps: int, rng):
+    """Means of ``reps`` with-replacement resamples of x, in blocks of BOOTSTRAP_BLOCK values."""
+    import numpy as np
+    out = np.empty(reps)
+    step = max(1, BOOTSTRAP_BLOCK // x.size)
+    for i in range(0, reps, step):
+        k = min(step, reps - i)
+        out[i:i + k] = x[rng.integers(0, x.size, (k, x.size), dtype=np.int32)].mean(axis=1)
+    return out
+
+
+def bootstrap_ratio(np_samples, cs_samples, reps: int = BOOTSTRAP_REPS, seed: int = 0) -> Optional[tuple]:
+    """95% percentile-bootstrap interval on mean(NumPy) ÷ mean(NumSharp) from the raw per-call
+    samples of both sides (any float sequences, e.g. decode_samples output). None when numpy
+    is unavailable, a side has fewer than BOOTSTRAP_MIN_SAMPLES samples, or no resampled
+    ratio is finite (e.g. a side's samples are all 0 ns)."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    a = np.asarray(np_samples, dtype=np.float64)
+    b = np.asarray(cs_samples, dtype=np.float64)
+    if a.size < BOOTSTRAP_MIN_SAMPLES or b.size < BOOTSTRAP_MIN_SAMPLES:
+        return None
+    rng = np.random.default_rng(seed)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        boot = _boot_means(a, reps, rng) / _boot_means(b, reps, rng)
+    boot = boot[np.isfinite(boot)]
+    if not boot.size:
+        return None
+    lo, hi = np.percentile(boot, [2.5, 97.5])
+    return float(lo), float(hi)
+
+
+def row_ratio_ci(np_result: dict, cs_result: Optional[dict]) -> tuple:
+    """(low, high, method) for one joined row: bootstrap over both sides' samples_ns when
+    both carry them, else ratio_interval's per-side mean CIs."""
+    if cs_result and np_result.get('samples_ns') and cs_result.get('samples_ns'):
+        ci = bootstrap_ratio(decode_samples(np_result['samples_ns']),
+                             decode_samples(cs_result['samples_ns']))
+        if ci:
+            return ci[0], ci[1], 'bootstrap'
+    lo, hi = ratio_interval(np_result, cs_result)
+    return lo, hi, ('bounds' if lo is not None else None)
+
+
+def geomean_ci(rows: List[tuple]) -> Optional[tuple]:
+    """(geomean, low, high) over (ratio, low, high) tuples; low/high may be None.
+
+    Each row's 95% interval is read as a normal error on its log ratio (half-width / CI_Z)
+    and the independent errors add in quadrature through the mean of logs — the limit of
+    resampling every row's bootstrap draws jointly. Rows without an interval count as exact;
+    low/high are None when no row has one."""
+    rows = [r for r in rows if r[0] and r[0] > 0]
+    if not rows:
+        return None
+    mean = sum(math.log(r) for r, _, _ in rows) / len(rows)
+    widths = [math.log(hi) - math.log(lo) for _, lo, hi in rows if lo and hi and lo > 0 and hi > 0]
+    if not widths:
+        return math.exp(mean), None, None
+    half = CI_Z * math.sqrt(sum((w / (2 * CI_Z)) ** 2 for w in widths)) / len(rows)
+    return math.exp(mean), math.exp(mean - half), math.exp(mean + half)
 
 
 def pct_fmt(pct: Optional[float]) -> str:
@@ -238,6 +540,21 @@ def get_status_icon(status: str) -> str:
     return icons.get(status, "⚪")
 
 
+_DTYPE_TAG = re.compile(r'\s*\((int32|int64|float32|float64|uint8|int16|uint16|uint32|uint64|bool|decimal)\)\s*$')
+_SPACES = re.compile(r'\s+')
+_ANNOTATION = re.compile(r'\s+\[[^\]]*\]')
+_AXIS_ARGS = re.compile(r'\(\s*(?:[a-z_][a-z0-9_]*\s*,\s*)?axis\s*=\s*(\d+)\s*\)')
+_IDENT_ARGS = re.compile(r'\(\s*[a-z_][a-z0-9_]*(?:\s*,\s*[a-z_][a-z0-9_]*)*\s*\)')
+_EMPTY_ARGS = re.compile(r'\(\s*\)')
+_ARROW = re.compile(r'\s*->\s*')
+_AROUND = re.compile(r'\bnp\.around\b')
+_WHERE_FORMS = {
+    'np.where(cond, a, b)': 'np.where ternary',
+    'np.where(cond)': 'np.where nonzero',
+}
+
+
+@lru_cache(maxsize=None)
 def normalize_op_name(name: str) -> str:
     """Canonicalize an op name so the C# [Benchmark(Description)] and the Python suite name
     collapse to the same string. Applied identically to both sides.
@@ -250,27 +567,23 @@ def normalize_op_name(name: str) -> str:
       * strip identifier-only argument lists ("(a)", "(a, b)", "(cond, a, b)") but KEEP
         numeric args ("(a, 50)", "(a, 2)") that distinguish percentile / shift / etc.
     The two np.where forms are disambiguated up front so arg-stripping doesn't collide them.
+    A run repeats each name once per dtype and size, so results are memoized per distinct name.
     """
-    import re
-    name = re.sub(r'\s*\((int32|int64|float32|float64|uint8|int16|uint16|uint32|uint64|bool|decimal)\)\s*$', '', name)
+    name = _DTYPE_TAG.sub('', name)
     name = name.strip("'\"")
-    name = re.sub(r'\s+', ' ', name).lower()
+    name = _SPACES.sub(' ', name).lower()
 
     # Disambiguate the two where ops before arg-stripping would collapse both to "np.where".
-    pre = {
-        'np.where(cond, a, b)': 'np.where ternary',
-        'np.where(cond)': 'np.where nonzero',
-    }
-    name = pre.get(name, name)
+    name = _WHERE_FORMS.get(name, name)
 
     # Strip a space-separated " [annotation]" ([full]/[method]/[columns]/[asarray equivalent]/…)
     # but NOT array-indexing brackets attached to an identifier ("a[100:1000]", "a[::2]"): those
     # are part of the op identity. Stripping them collapsed the Slicing-suite "np.copy(a[100:1000])"
     # (a 900-element slice copy, ~3.6µs at every N) onto the Creation "np.copy(a)" key, where it
     # overwrote the real full-array measurement (the bogus "copy float64 = 0.0036ms").
-    name = re.sub(r'\s+\[[^\]]*\]', '', name)
-    name = re.sub(r'\(\s*(?:[a-z_][a-z0-9_]*\s*,\s*)?axis\s*=\s*(\d+)\s*\)', r' axis=\1', name)  # (a, axis=0) -> axis=0
-    name = re.sub(r'\(\s*[a-z_][a-z0-9_]*(?:\s*,\s*[a-z_][a-z0-9_]*)*\s*\)', '', name)           # strip ident-only arg lists
+    name = _ANNOTATION.sub('', name)
+    name = _AXIS_ARGS.sub(r' axis=\1', name)   # (a, axis=0) -> axis=0
+    name = _IDENT_ARGS.sub('', name)           # strip ident-only arg lists
 
     # Alias passes so a measured C# op JOINS its NumPy counterpart instead of being discarded as
     # "C#-only" — each recovers ⚪ "C# benchmark not run" cells the merge was silently dropping:
@@ -278,28 +591,63 @@ def normalize_op_name(name: str) -> str:
     #   * spacing around "->": C# "reshape 2d -> 1d" meets NumPy's "reshape 2d->1d".
     #   * np.around IS np.round (NumPy alias): C# benchmarks it as np.around, NumPy emits np.round.
     # (verified against the archive: +10 joined cells, 0 regressions, 0 new key collisions.)
-    name = re.sub(r'\(\s*\)', '', name)
-    name = re.sub(r'\s*->\s*', '->', name)
-    name = re.sub(r'\bnp\.around\b', 'np.round', name)
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _EMPTY_ARGS.sub('', name)
+    name = _ARROW.sub('->', name)
+    name = _AROUND.sub('np.round', name)
+    name = _SPACES.sub(' ', name).strip()
     return name
 
 
-def merge_results(numpy_results: List[dict], csharp_results: List[dict]) -> List[UnifiedResult]:
-    """Merge NumPy and C# results into unified comparison."""
-    unified = []
+def join_key(r: dict) -> tuple:
+    """(normalized op, dtype, N) — the key both sides are joined on."""
+    return (normalize_op_name(r.get('name', '')), (r.get('dtype') or 'float64').lower(),
+            r.get('n', 10_000_000))
 
-    # Index C# results by (normalized_operation, dtype)
-    csharp_index: Dict[tuple, dict] = {}
+
+@dataclass
+class Join:
+    """Hash join of NumPy rows onto C# rows by join_key."""
+    matches: List[Optional[dict]]                              # C# row per NumPy row (or None)
+    numpy_only: List[tuple] = field(default_factory=list)      # distinct keys, NumPy order
+    csharp_only: List[tuple] = field(default_factory=list)     # distinct keys, C# order
+    duplicates: List[tuple] = field(default_factory=list)      # C# keys timed twice (last wins)
+
+
+def hash_join(numpy_results: List[dict], csharp_results: List[dict]) -> Join:
+    """Build side = C# (one row per key); probe side = NumPy, which may repeat a key (one
+    row per BLAS thread count) and so is never indexed."""
+    index: Dict[tuple, dict] = {}
+    duplicates = []
     for r in csharp_results:
-        norm_name = normalize_op_name(r['name'])
-        key = (norm_name, r['dtype'].lower(), r['n'])
-        csharp_index[key] = r
-        # Debug
-        # print(f"C# key: {key}")
+        key = join_key(r)
+        if key in index:
+            duplicates.append(key)
+        index[key] = r
+    matches, probed = [], set()
+    numpy_only = []
+    for r in numpy_results:
+        key = join_key(r)
+        hit = index.get(key)
+        matches.append(hit)
+        if hit is None and key not in probed:
+            numpy_only.append(key)
+        probed.add(key)
+    csharp_only = [k for k in index if k not in probed]
+    return Join(matches, numpy_only, csharp_only, duplicates)
+
+
+def _ms(v: Optional[float]) -> Optional[float]:
+    return round(v, 4) if v else None
+
+
+def merge_results(numpy_results: List[dict], csharp_results: List[dict],
+                  join: Optional[Join] = None) -> List[UnifiedResult]:
+    """Merge NumPy and C# results into unified comparison (``join``: a precomputed hash_join)."""
+    unified = []
+    join = join or hash_join(numpy_results, csharp_results)
 
     # Process each NumPy result
-    for np_result in numpy_results:
+    for np_result, cs_result in zip(numpy_results, join.matches):
         name = np_result.get('name', '')
         dtype = np_result.get('dtype', 'float64')
         n = np_result.get('n', 10_000_000)
@@ -307,15 +655,20 @@ def merge_results(numpy_results: List[dict], csharp_results: List[dict]) -> List
         category = np_result.get('category', '')
         numpy_ms = np_result.get('mean_ms', 0)
 
-        # Look for matching C# result at the SAME size (op, dtype, N)
-        norm_name = normalize_op_name(name)
-        key = (norm_name, dtype.lower(), n)
-        cs_result = csharp_index.get(key)
-
+        # cs_result: the C# row at the SAME size (op, dtype, N). BLAS ops have one NumPy row per
+        # swept thread count (the " [threads=k]" tag is stripped by the join key); every k joins
+        # the same NumSharp row, so single- and multi-threaded parity are reported separately.
         numsharp_ms = cs_result['mean_ms'] if cs_result else None
         ratio = numpy_ms / numsharp_ms if (numsharp_ms and numsharp_ms > 0) else None         # NP/NS, >1 = faster
         pct = numsharp_ms / numpy_ms * 100 if (numsharp_ms is not None and numpy_ms > 0) else None  # share of NumPy time
-        status = classify(numpy_ms, numsharp_ms, ratio)
+        ratio_low, ratio_high, ci_method = row_ratio_ci(np_result, cs_result)
+
+        # Both sides move the same compulsory bytes, so NumSharp's bandwidth follows from the
+        # NumPy model and NumSharp's time.
+        nbytes, peak = np_result.get('bytes_moved'), np_result.get('peak_gbps')
+        np_gbps = np_result.get('gbps')
+        ns_gbps = nbytes / (numsharp_ms * 1e6) if (nbytes and numsharp_ms) else None
+        status = classify(numpy_ms, numsharp_ms, ratio, ratio_high, ratio_low)
 
         unified.append(UnifiedResult(
             operation=name,
@@ -327,12 +680,50 @@ def merge_results(numpy_results: List[dict], csharp_results: List[dict]) -> List
             numsharp_ms=round(numsharp_ms, 4) if numsharp_ms is not None else None,
             ratio=round(ratio, 3) if ratio is not None else None,
             pct_numpy=round(pct, 1) if pct is not None else None,
-            status=status
+            status=status,
+            ratio_low=round(ratio_low, 3) if ratio_low is not None else None,
+            ratio_high=round(ratio_high, 3) if ratio_high is not None else None,
+            ratio_ci_method=ci_method,
+            numpy_alloc_mb=round(np_result['allocated_mb'], 4) if 'allocated_mb' in np_result else None,
+            numsharp_alloc_mb=(round(cs_result['alloc_mb'], 4)
+                               if cs_result and cs_result.get('alloc_mb') is not None else None),
+            bytes_moved=nbytes,
+            numpy_gbps=round(np_gbps, 2) if np_gbps is not None else None,
+            numsharp_gbps=round(ns_gbps, 2) if ns_gbps is not None else None,
+            numpy_pct_peak=round(np_gbps / peak * 100, 1) if (np_gbps and peak) else None,
+            numsharp_pct_peak=round(ns_gbps / peak * 100, 1) if (ns_gbps and peak) else None,
+            threads=np_result.get('threads'),
+            numpy_p90_ms=_ms(np_result.get('p90_ms')),
+            numpy_p99_ms=_ms(np_result.get('p99_ms')),
+            numsharp_p90_ms=_ms(cs_result.get('p90_ms')) if cs_result else None,
+            numsharp_p99_ms=_ms(cs_result.get('p99_ms')) if cs_result else None,
+            p99_ratio=(round(np_result['p99_ms'] / cs_result['p99_ms'], 3)
+                       if cs_result and cs_result.get('p99_ms') and np_result.get('p99_ms') else None),
         ))
 
     return unified
 
 
+def carry_results(fresh: List[UnifiedResult], path: str, label: str) -> List[UnifiedResult]:
+    """Rows of an older merged report for suites this run did not re-time (incremental runs).
+
+    A suite present in ``fresh`` is taken wholly from the fresh run; every other suite is
+    copied over and tagged ``carried_from=label``.
+    """
+    with open(path, encoding='utf-8') as f:
+        old = json.load(f)
+    fields = set(UnifiedResult.__dataclass_fields__)
+    timed = {r.suite for r in fresh}
+    carried = []
+    for row in old:
+        if row.get('suite') in timed:
+            continue
+        r = UnifiedResult(**{k: v for k, v in row.items() if k in fields})
+        r.carried_from = r.carried_from or label
+        carried.append(r)
+    return carried
+
+
 def generate_json(results: List[UnifiedResult], output_path: str):
     """Generate JSON output."""
     data = [r.to_dict() for r in results]
@@ -347,7 +738,11 @@ def generate_csv(results: List[UnifiedResult], output_path: str):
     with open(output_path, 'w', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['Operation', 'Suite', 'Category', 'DType', 'N',
-                        'NumPy (ms)', 'NumSharp (ms)', 'Ratio (NumPy/NumSharp)', '%NumPy', 'Status'])
+                        'NumPy (ms)', 'NumSharp (ms)', 'Ratio (NumPy/NumSharp)', '%NumPy', 'Status',
+                        'Ratio CI low', 'Ratio CI high', 'Ratio CI method', 'NumPy alloc (MB)', 'NumSharp managed alloc (MB)',
+                        'Bytes moved', 'NumPy GB/s', 'NumSharp GB/s', 'NumPy %peak', 'NumSharp %peak',
+                        'NumPy BLAS threads', 'NumPy p90 (ms)', 'NumPy p99 (ms)',
+                        'NumSharp p90 (ms)', 'NumSharp p99 (ms)', 'p99 ratio (NumPy/NumSharp)'])
         for r in results:
             writer.writerow([
                 r.operation, r.suite, r.category, r.dtype, r.n,
@@ -355,12 +750,29 @@ def generate_csv(results: List[UnifiedResult], output_path: str):
                 '' if r.numsharp_ms is None else r.numsharp_ms,
                 '' if r.ratio is None else r.ratio,
                 '' if r.pct_numpy is None else r.pct_numpy,
-                r.status
+                r.status,
+                '' if r.ratio_low is None else r.ratio_low,
+                '' if r.ratio_high is None else r.ratio_high,
+                r.ratio_ci_method or '',
+                '' if r.numpy_alloc_mb is None else r.numpy_alloc_mb,
+                '' if r.numsharp_alloc_mb is None else r.numsharp_alloc_mb,
+                '' if r.bytes_moved is None else r.bytes_moved,
+                '' if r.numpy_gbps is None else r.numpy_gbps,
+                '' if r.numsharp_gbps is None else r.numsharp_gbps,
+                '' if r.numpy_pct_peak is None else r.numpy_pct_peak,
+                '' if r.numsharp_pct_peak is None else r.numsharp_pct_peak,
+                '' if r.threads is None else r.threads,
+                '' if r.numpy_p90_ms is None else r.numpy_p90_ms,
+                '' if r.numpy_p99_ms is None else r.numpy_p99_ms,
+                '' if r.numsharp_p90_ms is None else r.numsharp_p90_ms,
+                '' if r.numsharp_p99_ms is None else r.numsharp_p99_ms,
+                '' if r.p99_ratio is None else r.p99_ratio,
             ])
     print(f"CSV written to: {output_path}")
 
 
-def generate_markdown(results: List[UnifiedResult], output_path: str):
+def generate_markdown(results: List[UnifiedResult], output_path: str,
+                      cold: Optional[Dict[tuple, float]] = None):
     """Generate concise Markdown comparison matrix."""
 
     # Count stats
@@ -391,6 +803,15 @@ def generate_markdown(results: List[UnifiedResult], output_path: str):
         "|▫| Negligible | <1µs / >20× | — | too fast to compare — excluded from rankings |",
         "|⚪| Pending | - | — | C# benchmark not run |",
         "",
+        "Bands use the 95% ratio CI, not the point ratio: ✅ needs the whole interval above 1.0× "
+        "(parity within noise is 🟡), and a slower band is assigned only when the whole interval "
+        "lies in it — an op whose interval reaches the next band up is rated there. The interval "
+        "is bootstrapped from both sides' raw samples where both were kept, else combined from each "
+        "side's 95% CI on its mean; geomean CIs propagate the per-op intervals.",
+        "",
+        "BLAS ops (dot, matmul) appear once per NumPy BLAS thread count (`[threads=k]`), each "
+        "against the same NumSharp row; geomeans use the single-threaded rows only.",
+        "",
         "---",
         "",
         f"**Summary:** {total} ops | ✅ {faster} | 🟡 {close} | 🟠 {slower} | 🔴 {much_slower} | ▫ {negligible} | ⚪ {no_data}",
@@ -399,22 +820,21 @@ def generate_markdown(results: List[UnifiedResult], output_path: str):
 
     # Per-size headline: geomean ratio (NumSharp/NumPy) across all matched ops at each N,
     # plus the status histogram. This is the "all ops at 3 sizes" summary.
-    import math
     sizes = sorted({r.n for r in results})
 
-    def _geo(vals):
-        vals = [v for v in vals if v and v > 0]
-        return math.exp(sum(math.log(v) for v in vals) / len(vals)) if vals else None
-
     lines.append("## Summary by size")
     lines.append("")
-    lines.append("| N | ops | ✅ faster | 🟡 close | 🟠 slower | 🔴 much | ▫ negl | ⚪ n/a | geomean | %NP🕐 |")
-    lines.append("|---:|----:|--------:|--------:|---------:|------:|-----:|-----:|--------:|------:|")
+    lines.append("| N | ops | ✅ faster | 🟡 close | 🟠 slower | 🔴 much | ▫ negl | ⚪ n/a | geomean | %NP🕐 | 95% CI |")
+    lines.append("|---:|----:|--------:|--------:|---------:|------:|-----:|-----:|--------:|------:|:------:|")
     for n in sizes:
         rs = [r for r in results if r.n == n]
-        gz = _geo([r.ratio for r in rs if r.status in CREDIBLE])   # credible rows only, NP/NS
+        # credible rows only, NP/NS; multi-threaded BLAS rows would count dot/matmul once per k
+        gci = geomean_ci([(r.ratio, r.ratio_low, r.ratio_high) for r in rs
+                          if r.status in CREDIBLE and (r.threads or 1) == 1])
+        gz = gci[0] if gci else None
         gz_s = f"{gz:.2f}x" if gz else "-"
         pz_s = pct_fmt(100.0 / gz) if gz else "-"
+        ci_s = f"{gci[1]:.2f}–{gci[2]:.2f}x" if gci and gci[1] else "-"
         lines.append(
             f"| {n:,} | {len(rs)} "
             f"| {sum(1 for r in rs if r.status == 'faster')} "
@@ -422,7 +842,7 @@ def generate_markdown(results: List[UnifiedResult], output_path: str):
             f"| {sum(1 for r in rs if r.status == 'slower')} "
             f"| {sum(1 for r in rs if r.status == 'much_slower')} "
             f"| {sum(1 for r in rs if r.status == 'negligible')} "
-            f"| {sum(1 for r in rs if r.status == 'no_data')} | {gz_s} | {pz_s} |")
+            f"| {sum(1 for r in rs if r.status == 'no_data')} | {gz_s} | {pz_s} | {ci_s} |")
     lines.append("")
     lines.append("---")
     lines.append("")
@@ -462,6 +882,84 @@ def generate_markdown(results: List[UnifiedResult], output_path: str):
         lines.append("---")
         lines.append("")
 
+    # Bandwidth roofline at the largest size: which side is at the memory roof per suite.
+    # Only rows with a traffic model and a STREAM peak on the NumPy side take part.
+    bw = [r for r in with_data if r.numpy_pct_peak is not None and r.numsharp_pct_peak is not None]
+    if bw:
+        n_max = max(r.n for r in bw)
+        bw = [r for r in bw if r.n == n_max]
+        lines.append(f"### Memory bandwidth at N={n_max:,} (% of single-core STREAM peak)")
+        lines.append("")
+        lines.append(f"_Compulsory bytes (inputs read + outputs written once) ÷ time. "
+                     f"≥{MEMORY_BOUND_PCT:.0f}% = at the memory roof (a faster kernel cannot help); "
+                     f"well below = compute/overhead-bound._")
+        lines.append("")
+        lines.append("| Suite | ops | NumPy median %peak | NumSharp median %peak | NumPy at roof | NumSharp at roof |")
+        lines.append("|-------|----:|-----:|-----:|-----:|-----:|")
+        by_suite: Dict[str, List[UnifiedResult]] = {}
+        for r in bw:
+            by_suite.setdefault(r.suite or "General", []).append(r)
+        for suite_name, rs in by_suite.items():
+            np_med = sorted(r.numpy_pct_peak for r in rs)[len(rs) // 2]
+            ns_med = sorted(r.numsharp_pct_peak for r in rs)[len(rs) // 2]
+            lines.append(f"| {suite_name} | {len(rs)} | {np_med:.0f}% | {ns_med:.0f}% "
+                         f"| {sum(1 for r in rs if r.numpy_pct_peak >= MEMORY_BOUND_PCT)} "
+                         f"| {sum(1 for r in rs if r.numsharp_pct_peak >= MEMORY_BOUND_PCT)} |")
+        lines.append("")
+        lines.append("---")
+        lines.append("")
+
+    # Tail latency: the mean ratio hides ops whose typical call is fine but whose slow calls
+    # (GC pauses, page faults, lock waits) are not. Per suite and N, compare the median
+    # p99 ratio with the median mean ratio, then list the ops whose p99 ratio is furthest
+    # below their mean ratio.
+    tail = [r for r in with_data if r.p99_ratio is not None and r.status in CREDIBLE]
+    if tail:
+        lines.append("### Tail latency (p99)")
+        lines.append("")
+        lines.append("_p99 ratio = NumPy p99 ÷ NumSharp p99 over the timed samples (same convention as "
+                     "Ratio). A p99 ratio well below the mean ratio means NumSharp's slow calls are "
+                     "disproportionately slow._")
+        lines.append("")
+        lines.append("| Suite | N | ops | median ratio | median p99 ratio |")
+        lines.append("|-------|--:|----:|-----:|-----:|")
+        cells: Dict[tuple, List[UnifiedResult]] = {}
+        for r in tail:
+            cells.setdefault((r.suite or "General", r.n), []).append(r)
+        for (suite_name, n), rs in sorted(cells.items()):
+            med = sorted(r.ratio for r in rs)[len(rs) // 2]
+            p99 = sorted(r.p99_ratio for r in rs)[len(rs) // 2]
+            lines.append(f"| {suite_name} | {n:,} | {len(rs)} | {ratio_fmt(med)} | {ratio_fmt(p99)} |")
+        lines.append("")
+        heavy = sorted((r for r in tail if r.p99_ratio < r.ratio / 1.5), key=lambda r: r.p99_ratio / r.ratio)
+        if heavy:
+            lines.append("| Tail-heavy op | Type | N | Ratio | p99 ratio | NumPy p99 (ms) | NumSharp p99 (ms) |")
+            lines.append("|--------------|:----:|--:|-----:|-----:|-----:|-----:|")
+            for r in heavy[:15]:
+                lines.append(f"| {r.operation} | {r.dtype} | {r.n:,} | {ratio_fmt(r.ratio)} | {ratio_fmt(r.p99_ratio)} "
+                             f"| {r.numpy_p99_ms:.4f} | {r.numsharp_p99_ms:.4f} |")
+            lines.append("")
+        lines.append("---")
+        lines.append("")
+
+    if cold:
+        cold_sizes = sorted({n for _, n in cold})
+        lines.append("### Cold-cache NumPy (median cold ÷ warm time)")
+        lines.append("")
+        lines.append("_Cold samples evict the caches (2× LLC scratch pass) before each single call. "
+                     "The ratios above are warm on both sides; a large factor here means warm "
+                     "timings overstate the speed of fresh, streamed arrays at that size._")
+        lines.append("")
+        lines.append("| Suite | " + " | ".join(f"N={n:,}" for n in cold_sizes) + " |")
+        lines.append("|-------|" + "|".join("-----:" for _ in cold_sizes) + "|")
+        for suite_name in sorted({s for s, _ in cold}):
+            cells = [f"{cold[(suite_name, n)]:.2f}×" if (suite_name, n) in cold else "-"
+                     for n in cold_sizes]
+            lines.append(f"| {suite_name} | " + " | ".join(cells) + " |")
+        lines.append("")
+        lines.append("---")
+        lines.append("")
+
     # Group by suite
     suites: Dict[str, List[UnifiedResult]] = {}
     for r in results:
@@ -474,7 +972,8 @@ def generate_markdown(results: List[UnifiedResult], output_path: str):
     # 3-size comparison explicit. Sorted by op, then dtype, then size so the three sizes of
     # each op sit together.
     for suite_name, suite_results in suites.items():
-        lines.append(f"### {suite_name}")
+        src = suite_results[0].carried_from
+        lines.append(f"### {suite_name}" + (f" _(carried from {src})_" if src else ""))
         lines.append("")
         lines.append("| | Operation | Type | N | NumPy (ms) | NumSharp (ms) | Ratio | %NumPy🕐 |")
         lines.append("|:-:|-----------|:----:|----:|----------:|-------------:|------:|--------:|")
@@ -493,40 +992,52 @@ def generate_markdown(results: List[UnifiedResult], output_path: str):
 
 def main():
     parser = argparse.ArgumentParser(description='Merge NumPy and NumSharp benchmark results')
-    parser.add_argument('--numpy', default='benchmark-report.json', help='Path to NumPy results JSON')
+    parser.add_argument('--numpy', default='benchmark-report.json', help='Path to NumPy results (.json or streamed .jsonl)')
     parser.add_argument('--csharp', default='NumSharp.Benchmark.CSharp/BenchmarkDotNet.Artifacts/results',
                        help='Path to BenchmarkDotNet artifacts directory')
     parser.add_argument('--output', default='benchmark-report', help='Output file base name (without extension)')
     parser.add_argument('--format', choices=['all', 'json', 'csv', 'md'], default='all',
                        help='Output format(s)')
+    parser.add_argument('--carry', default=None, metavar='REPORT_JSON',
+                       help='Older merged report; suites missing from this run are copied from it')
+    parser.add_argument('--carry-label', default='previous run',
+                       help='Provenance shown on carried suites (e.g. the snapshot commit)')
     args = parser.parse_args()
 
     # Load results
     print("Loading NumPy results...")
-    numpy_results = load_numpy_results(args.numpy)
-    print(f"  Found {len(numpy_results)} NumPy results")
+    numpy_results, cold_results = split_cache_modes(load_numpy_results(args.numpy))
+    print(f"  Found {len(numpy_results)} NumPy results"
+          + (f" (+{len(cold_results)} cold-cache, reported separately)" if cold_results else ""))
 
     print("Loading C# results...")
-    csharp_results = load_csharp_results(args.csharp)
+    csharp_results = load_csharp_results(args.csharp, keep_samples=True)
     print(f"  Found {len(csharp_results)} C# results")
 
     # Merge
     print("Merging results...")
-    unified = merge_results(numpy_results, csharp_results)
+    join = hash_join(numpy_results, csharp_results)
+    unified = merge_results(numpy_results, csharp_results, join)
     print(f"  Generated {len(unified)} unified results")
+    if args.carry and os.path.exists(args.carry):
+        carried = carry_results(unified, args.carry, args.carry_label)
+        unified += carried
+        print(f"  Carried {len(carried)} results from {args.carry} ({args.carry_label})")
 
     # Coverage check (P3): C# benchmarks that found NO NumPy counterpart at the same
     # (op, dtype, N). Expected for NumSharp-only dtypes (char/decimal) and experimental
     # suites; anything else is a join mismatch worth fixing.
-    np_keys = {(normalize_op_name(r.get('name', '')), r.get('dtype', '').lower(), r.get('n'))
-               for r in numpy_results}
-    cs_only = [r for r in csharp_results
-               if (normalize_op_name(r['name']), r['dtype'].lower(), r['n']) not in np_keys]
-    if cs_only:
-        distinct = sorted({f"{normalize_op_name(r['name'])} ({r['dtype']})" for r in cs_only})
-        print(f"  C#-only (no NumPy match): {len(cs_only)} cases, {len(distinct)} distinct op×dtype:")
+    if join.csharp_only:
+        distinct = sorted({f"{name} ({dtype})" for name, dtype, _ in join.csharp_only})
+        print(f"  C#-only (no NumPy match): {len(join.csharp_only)} cases, {len(distinct)} distinct op×dtype:")
         for nm in distinct[:50]:
             print(f"    - {nm}")
+    if join.numpy_only:
+        print(f"  NumPy-only (no C# match): {len(join.numpy_only)} cases, "
+              f"{len({(name, dtype) for name, dtype, _ in join.numpy_only})} distinct op×dtype")
+    if join.duplicates:
+        print(f"  Warning: {len(join.duplicates)} C# keys timed more than once (last one kept): "
+              + ", ".join(f"{name} ({dtype}, N={n:,})" for name, dtype, n in join.duplicates[:10]))
 
     # Generate outputs
     if args.format in ('all', 'json'):
@@ -534,7 +1045,7 @@ def main():
     if args.format in ('all', 'csv'):
         generate_csv(unified, f"{args.output}.csv")
     if args.format in ('all', 'md'):
-        generate_markdown(unified, f"{args.output}.md")
+        generate_markdown(unified, f"{args.output}.md", cold_penalty(numpy_results, cold_results))
 
     # Print summary
     print("\n" + "=" * 60)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Environment fingerprint and calibration probe for the benchmark noise gate.
+
+``run_benchmark.py`` runs a probe before the first suite (pre-flight) and before and after
+every timed suite task. A probe records what makes timings drift on a shared machine, and
+times a fixed calibration kernel:
+
+    governor      cpufreq scaling governors in use ("performance" is the only quiet one)
+    turbo         True/False/None — boost state (intel_pstate/no_turbo or cpufreq/boost)
+    freq_mhz      mean current clock across CPUs
+    load          1/5/15-minute load averages
+    throttle      sum of thermal_throttle core+package counters (only the delta matters)
+    busy          other processes using >= 10% of a core over a short window
+    calibration   {"compute_ms", "memory_ms"}: an L2-resident sqrt and a DRAM-bound add,
+                  fixed sizes, best of rounds (bench_timing)
+
+A suite whose before/after calibration (or either one against the pre-flight baseline)
+moved by more than the threshold, or during which the CPU throttled, is re-run, then
+flagged. Everything is Linux sysfs/procfs; elsewhere the fields are None and only the
+calibration gates.
+
+Usage
+-----
+  python benchmark/scripts/noise_gate.py                       # fingerprint + warnings
+  python benchmark/scripts/noise_gate.py --probe --out p.json  # + calibration, as JSON
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import bench_timing as bt  # noqa: E402
+
+CPU_SYS = "/sys/devices/system/cpu"
+BUSY_PCT = 10.0
+
+
+def _read(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def governors():
+    vals = {_read(p) for p in glob.glob(f"{CPU_SYS}/cpu[0-9]*/cpufreq/scaling_governor")}
+    vals.discard(None)
+    return sorted(vals) or None
+
+
+def turbo():
+    no_turbo = _read(f"{CPU_SYS}/intel_pstate/no_turbo")
+    if no_turbo is not None:
+        return no_turbo == "0"
+    boost = _read(f"{CPU_SYS}/cpufreq/boost")
+    return None if boost is None else boost == "1"
+
+
+def freq_mhz():
+    khz = [int(v) for v in (_read(p) for p in glob.glob(f"{CPU_SYS}/cpu[0-9]*/cpufreq/scaling_cur_freq"))
+           if v and v.isdigit()]
+    return round(sum(khz) / len(khz) / 1000.0) if khz else None
+
+
+def throttle_count():
+    paths = (glob.glob(f"{CPU_SYS}/cpu[0-9]*/thermal_throttle/core_throttle_count")
+             + glob.glob(f"{CPU_SYS}/cpu[0-9]*/thermal_throttle/package_throttle_count"))
+    counts = [int(v) for v in (_read(p) for p in paths) if v and v.isdigit()]
+    return sum(counts) if counts else None
+
+
+def _proc_stats():
+    """{pid: (ppid, comm, utime+stime ticks)} from /proc."""
+    out = {}
+    for stat in glob.glob("/proc/[0-9]*/stat"):
+        s = _read(stat)
+        if not s:
+            continue
+        # comm may contain spaces/parens: split around the LAST ')'
+        head, _, rest = s.rpartition(")")
+        pid, _, comm = head.partition(" (")
+        f = rest.split()
+        try:
+            out[int(pid)] = (int(f[1]), comm, int(f[11]) + int(f[12]))
+        except (ValueError, IndexError):
+            continue
+    return out
+
+
+def busy_processes(window=0.5, exclude_tree=None):
+    """Processes using >= BUSY_PCT of a core over `window` s, outside `exclude_tree`'s descendants."""
+    if not os.path.isdir("/proc"):
+        return None
+    a = _proc_stats()
+    time.sleep(window)
+    b = _proc_stats()
+    hz = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+    mine = {os.getpid()}
+    if exclude_tree:
+        roots = {exclude_tree}
+        grew = True
+        while grew:
+            new = {pid for pid, (ppid, _, _) in b.items() if ppid in roots and pid not in roots}
+            grew = bool(new)
+            roots |= new
+        mine |= roots
+    busy = []
+    for pid, (_, comm, ticks) in b.items():
+        if pid in mine or pid not in a:
+            continue
+        pct = (ticks - a[pid][2]) / hz / window * 100.0
+        if pct >= BUSY_PCT:
+            busy.append({"pid": pid, "comm": comm, "cpu_pct": round(pct)})
+    return sorted(busy, key=lambda p: -p["cpu_pct"])
+
+
+def fingerprint(exclude_tree=None):
+    return {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "cpus": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+        "governor": governors(),
+        "turbo": turbo(),
+        "freq_mhz": freq_mhz(),
+        "load": list(os.getloadavg()) if hasattr(os, "getloadavg") else None,
+        "throttle": throttle_count(),
+        "busy": busy_processes(exclude_tree=exclude_tree),
+    }
+
+
+def warnings(fp):
+    """Pre-flight findings that make a machine a poor benchmark host."""
+    w = []
+    if fp["governor"] and fp["governor"] != ["performance"]:
+        w.append(f"cpufreq governor {'/'.join(fp['governor'])} (not 'performance'): clocks ramp with load")
+    if fp["turbo"]:
+        w.append("turbo/boost on: clocks depend on load and temperature")
+    if fp["load"] and fp["cpus"] and fp["load"][0] > 0.25 * fp["cpus"]:
+        w.append(f"load average {fp['load'][0]:.2f} on {fp['cpus']} CPUs")
+    for p in fp["busy"] or []:
+        w.append(f"busy process {p['comm']} (pid {p['pid']}, {p['cpu_pct']}% of a core)")
+    return w
+
+
+# Fixed operands, created once per probe process (sizes never depend on the machine).
+_COMPUTE = np.linspace(1.0, 2.0, 64 * 1024)           # 512 KB: L2-resident
+_MEM_A = np.linspace(1.0, 2.0, 4 * 1024 * 1024)        # 3 x 32 MB: DRAM-bound
+_MEM_B = _MEM_A[::-1].copy()
+_MEM_OUT = np.empty_like(_MEM_A)
+
+
+def calibrate():
+    return {
+        "compute_ms": bt.time_ms(lambda: np.sqrt(_COMPUTE), 200, 50, 5, estimator="min"),
+        "memory_ms": bt.time_ms(lambda: np.add(_MEM_A, _MEM_B, out=_MEM_OUT), 5, 2, 5, estimator="min"),
+    }
+
+
+def drift(a, b):
+    """Largest relative change between two calibrations (0.05 = 5%); None if either is missing."""
+    if not a or not b:
+        return None
+    ks = [k for k in a if k in b and a[k] > 0]
+    return max(abs(b[k] / a[k] - 1.0) for k in ks) if ks else None
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0].strip())
+    ap.add_argument("--probe", action="store_true", help="Also time the calibration kernel")
+    ap.add_argument("--out", type=Path, default=None, help="Write the probe as JSON here")
+    ap.add_argument("--exclude-tree", type=int, default=None, metavar="PID",
+                    help="Don't count PID and its descendants as competing processes")
+    args = ap.parse_args()
+
+    probe = fingerprint(args.exclude_tree)
+    probe["warnings"] = warnings(probe)
+    if args.probe:
+        probe["calibration"] = calibrate()
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(probe, indent=2), encoding="utf-8")
+    else:
+        print(json.dumps(probe, indent=2))
+    for w in probe["warnings"]:
+        print(f"[noise] {w}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,13 @@
 #   python benchmark/scripts/render_dashboard.py
 #     reads  benchmark/benchmark-report.json     (merged op-matrix, from merge-results.py)
 #     writes benchmark/benchmark-dashboard.md     (the dense sheet, ```-fenced)
+#   python benchmark/scripts/render_dashboard.py --db benchmark/.results.db [--run NAME]
+#     reads the rows of one run (default: newest) from the results store (results_db.py)
+#   python benchmark/scripts/render_dashboard.py --history [--since 5]
+#     adds the trajectory over benchmark/history/*/benchmark-report.json: per-suite and
+#     per-op sparklines (one glyph per snapshot, oldest → newest) and the ops most
+#     improved / regressed since N snapshots ago. Parsed snapshots are cached in
+#     benchmark/.dashboard-history.json keyed by each report's SHA-256.
 #
 # CONVENTION (house default):
 #   speedup = NumPy ÷ NumSharp   ·   >1.0× = NumSharp FASTER · 1.0 = parity · <1.0 = slower
@@ -16,27 +23,56 @@
 #              (30% = NumSharp takes only 30% of the time NumPy would; <100% = faster)
 # Only CREDIBLE comparisons (both sides ≥1µs, within 20×) are charted; negligible /
 # no-data rows are excluded (see merge-results.py classify()).
+# [lo–hi] = 95% CI of a geomean, from the merge's per-op ratio intervals (geomean_ci); a
+# "win" is an op whose whole interval lies above 1.0×, as for merge-results.py's ✅.
 # =============================================================================
+import argparse
 import datetime
+import hashlib
 import json
 import math
 import os
+import sys
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 REPO = os.path.abspath(os.path.join(HERE, "..", ".."))
 SRC = os.path.join(REPO, "benchmark", "benchmark-report.json")
 OUT = os.path.join(REPO, "benchmark", "benchmark-dashboard.md")
+HISTORY = os.path.join(REPO, "benchmark", "history")
+HISTORY_CACHE = os.path.join(REPO, "benchmark", ".dashboard-history.json")
+HISTORY_CACHE_VERSION = 2      # bump when trend_rows' output changes (2: normalized ratios)
 
 CREDIBLE = {"faster", "close", "slower", "much_slower"}
 SCALE, WIDTH = 10.0, 20            # bar units: length 10 = parity (1.0×), 20 = 2.0× (then ▶)
 EIGHTHS = ["", "▏", "▎", "▍", "▌", "▋", "▊", "▉"]
 HDR = "          slower ◄───────── 1.0 (parity) ─────────► faster"
+SPARK = "▁▂▃▄▅▆▇█"                    # per-row log scale; " " = not timed in that snapshot
+
+
+CI_Z = 1.959964
 
 
 def geomean(v):
     return math.exp(sum(math.log(x) for x in v) / len(v)) if v else float("nan")
 
 
+def geomean_ci(rows, key="sp"):
+    """(low, high) of the geomean of r[key] — merge-results.py geomean_ci over the rows'
+    ratio_low/ratio_high (mean-ratio intervals only); None when no row has an interval."""
+    ci = [r for r in rows if (r.get("ratio_low") or 0) > 0 and (r.get("ratio_high") or 0) > 0]
+    if key != "sp" or not ci:
+        return None
+    var = sum(((math.log(r["ratio_high"]) - math.log(r["ratio_low"])) / (2 * CI_Z)) ** 2 for r in ci)
+    g, half = geomean([r[key] for r in rows]), CI_Z * math.sqrt(var) / len(rows)
+    return g * math.exp(-half), g * math.exp(half)
+
+
+def won(r, key="sp"):
+    if key == "sp" and r.get("ratio_low") is not None:
+        return r["ratio_low"] > 1.0
+    return r[key] > 1.0
+
+
 def bar(s):
     u = s * SCALE
     if u >= WIDTH:
@@ -56,9 +92,80 @@ def pct_str(pct):
     return f"{pct:4.0f}%"
 
 
+def load_rows(db=None, run=None):
+    if not db:
+        with open(SRC, encoding="utf-8") as f:
+            return json.load(f)
+    sys.path.insert(0, HERE)
+    import results_db
+    conn = results_db.connect(db)
+    run = run or results_db.latest_run(conn)
+    if run is None:
+        raise SystemExit(f"no runs in {db} (python benchmark/scripts/results_db.py ingest)")
+    return results_db.run_rows(conn, run)
+
+
+def trend_rows(rows):
+    """{store key: [suite, status, ratio, threads]} — all the trend sections need of a report.
+    Ratios go through the store's normalize_ratios, so legacy NumSharp ÷ NumPy reports trend
+    on the same NumPy ÷ NumSharp scale as the rest."""
+    sys.path.insert(0, HERE)
+    from results_db import matrix_keys, normalize_ratios
+    rows = normalize_ratios(rows)
+    return {k: [r.get("suite"), r.get("status"), r.get("ratio"), r.get("threads")]
+            for k, r in zip(matrix_keys(rows), rows)}
+
+
+def load_history():
+    """[(snapshot, trend_rows)] of every history snapshot, oldest first (``latest`` is only a
+    pointer). A snapshot whose report hashes the same as a cached one is not re-parsed."""
+    try:
+        with open(HISTORY_CACHE, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    if cache.pop("version", None) != HISTORY_CACHE_VERSION:
+        cache = {}
+    fresh, snaps = {}, []
+    for name in sorted(os.listdir(HISTORY)) if os.path.isdir(HISTORY) else []:
+        path = os.path.join(HISTORY, name, "benchmark-report.json")
+        if os.path.islink(os.path.join(HISTORY, name)) or not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest not in cache:
+            cache[digest] = trend_rows(json.loads(raw))
+        fresh[digest] = cache[digest]
+        snaps.append((name, fresh[digest]))
+    if fresh.keys() != cache.keys() or not os.path.exists(HISTORY_CACHE):
+        try:
+            with open(HISTORY_CACHE, "w", encoding="utf-8") as f:
+                json.dump({"version": HISTORY_CACHE_VERSION, **fresh}, f, separators=(",", ":"))
+        except OSError:
+            pass
+    return snaps
+
+
+def spark(vals):
+    logs = [math.log(v) for v in vals if v]
+    if not logs:
+        return " " * len(vals)
+    lo, hi = min(logs), max(logs)
+    step = (hi - lo) / (len(SPARK) - 1) if hi - lo > 1e-9 else None
+    return "".join(" " if not v else SPARK[round((math.log(v) - lo) / step) if step else 3] for v in vals)
+
+
 def main():
-    with open(SRC, encoding="utf-8") as f:
-        data = json.load(f)
+    ap = argparse.ArgumentParser(description="Render the op-matrix dashboard")
+    ap.add_argument("--db", default=None, help="Read from this results store instead of the JSON")
+    ap.add_argument("--run", default=None, help="Run name in --db (default: newest)")
+    ap.add_argument("--history", action="store_true",
+                    help="Add trend sparklines across benchmark/history snapshots")
+    ap.add_argument("--since", type=int, default=5, metavar="N",
+                    help="Most improved / regressed: compare with the snapshot N back (default 5)")
+    args = ap.parse_args()
+    data = load_rows(args.db, args.run)
 
     total = len(data)
     negligible = sum(1 for r in data if r["status"] == "negligible")
@@ -76,31 +183,51 @@ def main():
         r["sp"] = r["ratio"]                                              # NP/NS — >1 = NumSharp faster
         r["pct"] = r["pct_numpy"] if r.get("pct_numpy") is not None else 100.0 / r["sp"]
 
+    # timeline: every history snapshot, then this report unless it IS the newest snapshot
+    timeline = []
+    if args.history:
+        current = trend_rows(data)
+        for r, key in zip(data, current):
+            r["key"] = key
+        timeline = load_history()
+        if not timeline or timeline[-1][1] != current:
+            timeline.append(("this report", current))
+
+    def series(key):
+        return [(snap.get(key) or [None, None, None])[2] for _, snap in timeline]
+
     L = []
 
     def out(s=""):
         L.append(s)
 
-    def barline(label, rows, width=13):
-        sps = [r["sp"] for r in rows]
+    def barline(label, rows, width=13, key="sp"):
+        sps = [r[key] for r in rows]
         if not sps:
             out(f"{label:<{width}}(no data)")
             return
         g = geomean(sps)
         pct = 100.0 / g                                      # = geomean(NS/NP) × 100
-        win = sum(1 for x in sps if x > 1.0)
-        tag = "  ◄ PARITY" if 0.97 <= g <= 1.03 else ("  ◄ SLOWER" if g < 0.97 else "")
-        out(f"{label:<{width}}{bar(g)}  {g:5.2f}×  {pct_str(pct)}🕐  ({win:4d} win /{len(sps) - win:4d} lose){tag}")
+        win = sum(1 for r in rows if won(r, key))
+        ci = geomean_ci(rows, key)
+        parity = 0.97 <= g <= 1.03 or (ci is not None and ci[0] <= 1.0 <= ci[1])
+        tag = "  ◄ PARITY" if parity else ("  ◄ SLOWER" if g < 0.97 else "")
+        ci_s = f"  [{ci[0]:.2f}–{ci[1]:.2f}]" if ci else ""
+        out(f"{label:<{width}}{bar(g)}  {g:5.2f}×{ci_s}  {pct_str(pct)}🕐  "
+            f"({win:4d} win /{len(sps) - win:4d} lose){tag}")
 
     stamp = os.environ.get("BENCH_STAMP", datetime.date.today().isoformat())
     g_all = geomean([r["sp"] for r in cred])
-    win = sum(1 for r in cred if r["sp"] > 1.0)
+    ci_all = geomean_ci(cred)
+    win = sum(1 for r in cred if won(r))
 
     out(f"NumSharp vs NumPy — operation matrix · {stamp} · speedup = NumPy ÷ NumSharp (>1.0× = NumSharp faster)")
     out(f"{len(cred)} credible comparisons of {total} ops · {negligible} negligible + {no_data} no-data excluded · BenchmarkDotNet vs NumPy 2.4.2")
     out("%NumPy🕐 = NumSharp ÷ NumPy × 100 = share of NumPy's time NumSharp uses (30% = takes only 30% as long; <100% = faster)")
     out()
-    out(f"HEADLINE — {g_all:.2f}× geomean · {100.0 / g_all:.0f}%🕐 of NumPy's time · over {len(cred)} cells · {win} faster / {len(cred) - win} slower")
+    ci_s = f" (95% CI {ci_all[0]:.2f}–{ci_all[1]:.2f}×)" if ci_all else ""
+    out(f"HEADLINE — {g_all:.2f}× geomean{ci_s} · {100.0 / g_all:.0f}%🕐 of NumPy's time · over {len(cred)} cells"
+        f" · {win} faster / {len(cred) - win} not faster")
     out()
 
     out("BY ARRAY-SIZE TIER  (geomean over all credible ops at that size)")
@@ -130,6 +257,61 @@ def main():
         barline(name, rows)
     out()
 
+    if len(timeline) >= 2:
+        def suite_geo(snap, suite):
+            sps = [v[2] for v in snap.values() if v[1] in CREDIBLE and v[2] and (v[3] or 1) == 1
+                   and (suite is None or (v[0] or "?").lower() == suite)]
+            return geomean(sps) if sps else None
+
+        out(f"TREND BY SUITE  (geomean per snapshot, oldest → newest · {len(timeline)} snapshots "
+            f"{timeline[0][0]} … {timeline[-1][0]})")
+        for name in sorted(suites) + [None]:
+            vals = [suite_geo(snap, name) for _, snap in timeline]
+            known = [v for v in vals if v]
+            if len(known) < 2:
+                continue
+            change = (known[-1] / known[0] - 1) * 100
+            out(f"{name or 'ALL':<13}{spark(vals)}  {known[0]:5.2f}× → {known[-1]:5.2f}×  {change:+5.0f}%")
+        out()
+
+        base = max(0, len(timeline) - 1 - args.since)
+        moved = []
+        for r in cred:
+            then = (timeline[base][1].get(r["key"]) or [None] * 4)
+            if then[1] in CREDIBLE and then[2]:
+                moved.append((r["sp"] / then[2], r))
+        hdr_t = f"  {'operation':<30} {'dtype':<8} {'N':>4}  {'trend':<{len(timeline)}}  {'then':>7} → {'now':>7}   change"
+
+        def trow(change, r):
+            op = r["operation"] if len(r["operation"]) <= 30 else r["operation"][:29] + "…"
+            then = r["sp"] / change
+            return (f"  {op:<30} {r['dtype']:<8} {sizelabel(r['n']):>4}  {spark(series(r['key']))}  "
+                    f"{then:6.2f}× → {r['sp']:6.2f}×  {(change - 1) * 100:+6.0f}%")
+
+        since = f"SINCE {timeline[base][0]} ({len(timeline) - 1 - base} snapshots back)"
+        out(f"MOST IMPROVED {since}")
+        out(hdr_t)
+        for change, r in sorted((t for t in moved if t[0] > 1), key=lambda t: t[0], reverse=True)[:12]:
+            out(trow(change, r))
+        out()
+        out(f"MOST REGRESSED {since}")
+        out(hdr_t)
+        for change, r in sorted((t for t in moved if t[0] < 1), key=lambda t: t[0])[:12]:
+            out(trow(change, r))
+        out()
+
+    # p99 ratio = NumPy p99 ÷ NumSharp p99 over the timed samples; needs a merge with percentiles.
+    tail = [r for r in cred if r.get("p99_ratio")]
+    if tail:
+        out("TAIL LATENCY BY SIZE  (geomean of NumPy p99 ÷ NumSharp p99 — the slow calls, not the mean)")
+        out(HDR)
+        for n in sorted({r["n"] for r in tail}):
+            rows = [r for r in tail if r["n"] == n]
+            if len(rows) >= 10:
+                barline(sizelabel(n), rows, key="p99_ratio")
+        barline("ALL", tail, key="p99_ratio")
+        out()
+
     out("STATUS MIX  (NumSharp ÷ NumPy bands; credible only)")
     bands = [("✅ faster   ≤100% NumPy", "faster"), ("🟡 close    100–200%", "close"),
              ("🟠 slower   200–500%", "slower"), ("🔴 much     >500%", "much_slower")]
@@ -144,9 +326,13 @@ def main():
         sp, pct = r["sp"], r["pct"]
         sp_s = f"{sp:6.2f}×" if sp >= 0.1 else f"{sp:6.3f}×"
         op = r["operation"] if len(r["operation"]) <= 30 else r["operation"][:29] + "…"
-        return f"  {op:<30} {r['dtype']:<8} {sizelabel(r['n']):>4}  {r['numpy_ms']:8.3f} →{r['numsharp_ms']:9.3f} ms  {sp_s}  {pct_str(pct)}🕐"
+        trend = f"  {spark(series(r['key']))}" if len(timeline) >= 2 else ""
+        return (f"  {op:<30} {r['dtype']:<8} {sizelabel(r['n']):>4}  {r['numpy_ms']:8.3f} →{r['numsharp_ms']:9.3f} ms  "
+                f"{sp_s}  {pct_str(pct)}🕐{trend}")
 
     hdr = f"  {'operation':<30} {'dtype':<8} {'N':>4}  {'NumPy':>8}  {'NumSharp':>9}    NP/NS   %NumPy🕐"
+    if len(timeline) >= 2:
+        hdr += "  trend"
     out("TOP 12 FASTEST  (NumPy ÷ NumSharp — biggest NumSharp wins)")
     out(hdr)
     for r in sorted(cred, key=lambda r: r["sp"], reverse=True)[:12]:
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# =============================================================================
+# render_html_dashboard.py — a self-contained, interactive HTML view of the merged
+# op-matrix: filter by suite / dtype / N / status, drill into one op's raw samples
+# (both sides' per-call distributions) and its ratio trend across every
+# benchmark/history snapshot. One static file — no server, no external assets.
+#
+#   python benchmark/scripts/render_html_dashboard.py
+#     reads  benchmark/benchmark-report.json     (merged op-matrix, from merge-results.py)
+#            benchmark/.results.db               (history trend; snapshots not yet in the
+#                                                 store are ingested first, results_db.py)
+#            benchmark/results/<ts>/             (raw samples of the newest run, if kept)
+#     writes benchmark/benchmark-dashboard.html
+#   python benchmark/scripts/render_html_dashboard.py --run NAME [--results DIR]
+#     renders one stored run instead (its samples from results/<run_ts>/ when present)
+#
+# The data is embedded as one compact JSON object, columnar so every history snapshot
+# fits in a file that opens instantly:
+#   * string columns (suite/op/dtype/N/status) are dictionary-encoded, and the index
+#     columns delta-encoded (the report is grouped by suite/op, so most deltas are 0);
+#   * ratios are stored as round(1000·ln ratio) — 0.1% resolution — and the CI bounds
+#     as offsets from the ratio;
+#   * the trend is one column per snapshot, each delta-encoded against the previous
+#     snapshot (an unchanged op costs "0,");
+#   * raw samples stay in merge-results.py's base64 float32 encoding, thinned to
+#     MAX_SAMPLES per side.
+# CONVENTION as render_dashboard.py: ratio = NumPy ÷ NumSharp, >1.0× = NumSharp faster.
+# =============================================================================
+import argparse
+import json
+import math
+import os
+import sys
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+import results_db  # noqa: E402
+from detect_regressions import raw_samples  # noqa: E402
+from render_dashboard import SRC, load_rows  # noqa: E402
+from snapshot_history import RESULTS, newest_results_dir  # noqa: E402
+
+OUT = HERE.parent / "benchmark-dashboard.html"
+Q = 1000.0              # ratio quantum: round(Q · ln ratio)
+MAX_SAMPLES = 256       # per side, per op, in the drill-down
+
+
+def q(ratio):
+    return round(Q * math.log(ratio)) if ratio and ratio > 0 else None
+
+
+def delta(xs):
+    """Delta-encode a column of ints/None; a None keeps the running value (JS: undelta)."""
+    out, prev = [], 0
+    for x in xs:
+        if x is None:
+            out.append(None)
+        else:
+            out.append(x - prev)
+            prev = x
+    return out
+
+
+def dictionary(values):
+    """(distinct values in first-seen order, delta-encoded index column)."""
+    index, codes = {}, []
+    for v in values:
+        codes.append(index.setdefault(v, len(index)))
+    return list(index), delta(codes)
+
+
+def sig(v, digits=4):
+    return float(f"{v:.{digits}g}") if v is not None else None
+
+
+def columns(rows):
+    cols = {}
+    for name, field in (("suite", "suite"), ("op", "operation"), ("dtype", "dtype"),
+                        ("n", "n"), ("status", "status")):
+        cols[name] = dictionary([r.get(field) for r in rows])
+    ratio = [q(r.get("ratio")) for r in rows]
+    cols["ratio"] = delta(ratio)
+    for name, field in (("lo", "ratio_low"), ("hi", "ratio_high")):
+        cols[name] = [None if rq is None or q(r.get(field)) is None else q(r.get(field)) - rq
+                      for r, rq in zip(rows, ratio)]
+    cols["np_ms"] = [sig(r.get("numpy_ms")) for r in rows]
+    cols["ns_ms"] = [sig(r.get("numsharp_ms")) for r in rows]
+    cols["threads"] = [r.get("threads") for r in rows]
+    return cols
+
+
+def history(conn, keys, current=None):
+    """(runs, per-run delta columns aligned to `keys`); `current` {key: ratio} is appended
+    as a final point when it is not already the newest stored run."""
+    runs = [dict(r) for r in conn.execute(
+        "SELECT name, commit_sha, run_ts FROM runs ORDER BY run_ts, name")]
+    cols = [[q(v) for v in map(results_db.run_values(conn, r["name"]).get, keys)] for r in runs]
+    if current is not None:
+        point = [q(current.get(k)) for k in keys]
+        if not cols or point != cols[-1]:
+            runs.append({"name": "this report", "commit_sha": None, "run_ts": None})
+            cols.append(point)
+    out, prev = [], [0] * len(keys)
+    for col in cols:
+        # delta per op against that op's last stored value (None = not timed in this run)
+        d = []
+        for i, v in enumerate(col):
+            d.append(None if v is None else v - prev[i])
+            if v is not None:
+                prev[i] = v
+        out.append(d)
+    return runs, out
+
+
+def samples(rows, directory):
+    """{row index: [numpy b64 | None, numsharp b64 | None]} from a results dir's raw files."""
+    if directory is None or not directory.is_dir():
+        return {}
+    mr = results_db._merge_module()
+    raw = raw_samples(directory, mr)
+    out = {}
+    for i, r in enumerate(rows):
+        got = raw.get(mr.join_key({"name": r["operation"], "dtype": r["dtype"], "n": r["n"]}))
+        if got:
+            out[i] = [mr.encode_samples(got[s][::math.ceil(len(got[s]) / MAX_SAMPLES)])
+                      if got.get(s) else None for s in ("numpy", "numsharp")]
+    return out
+
+
+def build(rows, conn, run=None, results_dir=None, title=None):
+    rows = results_db.normalize_ratios(rows)   # a legacy NumSharp ÷ NumPy report, as the store does
+    keys = results_db.matrix_keys(rows)
+    current = None if run else dict(zip(keys, (r.get("ratio") for r in rows)))
+    runs, trend = history(conn, keys, current)
+    return {"title": title, "q": Q, "rows": len(rows), "cols": columns(rows),
+            "runs": runs, "trend": trend, "samples": samples(rows, results_dir)}
+
+
+def render(data):
+    blob = json.dumps(data, separators=(",", ":")).replace("</", "<\\/")
+    return TEMPLATE.replace("/*DATA*/null", blob)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Render the interactive HTML op-matrix dashboard")
+    ap.add_argument("--db", default=str(results_db.DEFAULT_DB), help="Results store (history trend)")
+    ap.add_argument("--run", default=None, help="Render this stored run instead of the JSON report")
+    ap.add_argument("--results", type=Path, default=None,
+                    help="Raw results dir for the sample drill-down (default: the run's / newest)")
+    ap.add_argument("--output", type=Path, default=OUT)
+    args = ap.parse_args()
+
+    conn = results_db.connect(args.db)
+    done = results_db.ingest_history(conn, missing_only=True)
+    if done:
+        print(f"Ingested {len(done)} snapshots into {args.db}")
+    rows = load_rows(args.db if args.run else None, args.run)
+    results_dir = args.results
+    if results_dir is None and args.run:
+        ts = conn.execute("SELECT run_ts FROM runs WHERE name=?", (args.run,)).fetchone()
+        results_dir = RESULTS / ts["run_ts"] if ts and ts["run_ts"] else None
+    elif results_dir is None:
+        results_dir = newest_results_dir()
+    title = args.run or os.path.relpath(SRC, HERE.parent.parent)
+    data = build(rows, conn, args.run, results_dir, title)
+    html = render(data)
+    args.output.write_text(html, encoding="utf-8")
+    print(f"{len(rows)} ops · {len(data['runs'])} snapshots · samples for {len(data['samples'])} ops "
+          f"-> {args.output} ({len(html) / 1024:.0f} KB)")
+
+
+TEMPLATE = r"""<!doctype html>
+<html lang="en"><head><meta charset="utf-8">
+<title>NumSharp vs NumPy — op matrix</title>
+<style>
+body{font:13px/1.4 system-ui,sans-serif;margin:0;color:#222;background:#fafafa}
+header{padding:10px 16px;background:#fff;border-bottom:1px solid #ddd;position:sticky;top:0;z-index:1}
+h1{font-size:16px;margin:0 0 6px}
+select,input{font:inherit;margin-right:8px}
+#summary{margin-top:6px;color:#444}
+main{display:flex;gap:16px;padding:12px 16px}
+#list{flex:1 1 60%;overflow:auto;max-height:calc(100vh - 120px)}
+#detail{flex:1 1 40%;position:sticky;top:100px;align-self:flex-start}
+table{border-collapse:collapse;width:100%;background:#fff}
+th,td{padding:3px 6px;border-bottom:1px solid #eee;text-align:right;white-space:nowrap}
+th{cursor:pointer;background:#f3f3f3;position:sticky;top:0}
+td:nth-child(2),td:nth-child(3),th:nth-child(2),th:nth-child(3){text-align:left}
+tr.sel{background:#e8f0fe}
+tbody tr:hover{background:#f5f8ff;cursor:pointer}
+.faster{color:#2e9e4f}.close{color:#c98a2b}.slower{color:#d6453d}.much_slower{color:#a0201a}
+.negligible,.no_data{color:#999}
+svg{background:#fff;border:1px solid #ddd;display:block;margin-bottom:10px}
+.muted{color:#777}
+</style></head><body>
+<header><h1>NumSharp vs NumPy — op matrix <span class="muted" id="src"></span></h1>
+<select id="f-suite"></select><select id="f-dtype"></select><select id="f-n"></select>
+<select id="f-status"></select><input id="f-text" placeholder="filter ops…" size="24">
+<div id="summary"></div></header>
+<main><div id="list"><table><thead><tr>
+<th data-k="icon"></th><th data-k="op">operation</th><th data-k="dtype">dtype</th><th data-k="n">N</th>
+<th data-k="np">NumPy ms</th><th data-k="ns">NumSharp ms</th><th data-k="ratio">NP/NS</th>
+<th data-k="ci">95% CI</th><th data-k="tr">trend</th></tr></thead><tbody id="rows"></tbody></table></div>
+<div id="detail"><p class="muted">Select an op for its samples and trend.</p></div></main>
+<script>
+const D = /*DATA*/null;
+const ICON = {faster:"✅", close:"🟡", slower:"🟠", much_slower:"🔴", negligible:"▫", no_data:"⚪"};
+const CREDIBLE = new Set(["faster", "close", "slower", "much_slower"]);
+function undelta(a) { let p = 0; return a.map(d => d == null ? null : (p += d)); }
+function dict([values, codes]) { return undelta(codes).map(i => values[i]); }
+const C = D.cols, N = D.rows;
+const R = [];
+{
+  const suite = dict(C.suite), op = dict(C.op), dtype = dict(C.dtype), n = dict(C.n), st = dict(C.status);
+  const ratio = undelta(C.ratio), ex = v => v == null ? null : Math.exp(v / D.q);
+  // trend: per-snapshot deltas against each op's last stored value
+  const last = new Array(N).fill(0), trend = Array.from({length: N}, () => []);
+  D.trend.forEach(col => col.forEach((d, i) => trend[i].push(d == null ? null : ex(last[i] += d))));
+  for (let i = 0; i < N; i++) {
+    const q = ratio[i];
+    R.push({i, suite: suite[i], op: op[i], dtype: dtype[i], n: n[i], status: st[i],
+            np: C.np_ms[i], ns: C.ns_ms[i], ratio: ex(q), threads: C.threads[i],
+            lo: q == null || C.lo[i] == null ? null : ex(q + C.lo[i]),
+            hi: q == null || C.hi[i] == null ? null : ex(q + C.hi[i]), trend: trend[i]});
+  }
+}
+function decode(b64) {
+  const s = atob(b64), u = new Uint8Array(s.length);
+  for (let i = 0; i < s.length; i++) u[i] = s.charCodeAt(i);
+  return Array.from(new Float32Array(u.buffer));  // little-endian float32 ns per call
+}
+const $ = id => document.getElementById(id);
+const fmtR = r => r == null ? "-" : (r >= 0.1 ? r.toFixed(2) : r.toFixed(3)) + "×";
+const fmtN = n => n.toLocaleString("en-US");
+function fill(sel, label, values) {
+  sel.innerHTML = `<option value="">${label}: all</option>` +
+    values.map(v => `<option>${v}</option>`).join("");
+}
+fill($("f-suite"), "suite", [...new Set(R.map(r => r.suite))].sort());
+fill($("f-dtype"), "dtype", [...new Set(R.map(r => r.dtype))].sort());
+fill($("f-n"), "N", [...new Set(R.map(r => r.n))].sort((a, b) => a - b));
+fill($("f-status"), "status", Object.keys(ICON));
+$("src").textContent = "· " + (D.title || "") + " · " + D.runs.length + " snapshots";
+let sortKey = null, sortDir = 1, selected = null;
+function spark(t, w = 80, h = 16) {
+  const pts = t.map((v, i) => [i, v]).filter(p => p[1] != null);
+  if (pts.length < 2) return "";
+  const ys = pts.map(p => Math.log(p[1])), lo = Math.min(0, ...ys), hi = Math.max(0, ...ys);
+  const X = i => (i / (t.length - 1)) * (w - 2) + 1, Y = y => h - 1 - (y - lo) / ((hi - lo) || 1) * (h - 2);
+  return `<svg width="${w}" height="${h}" style="border:0;margin:0;display:inline"><line x1="0" x2="${w}" y1="${Y(0)}" y2="${Y(0)}" stroke="#ccc"/>` +
+    `<polyline fill="none" stroke="#36c" points="${pts.map(p => X(p[0]) + "," + Y(Math.log(p[1]))).join(" ")}"/></svg>`;
+}
+function geomean(rows) {
+  if (!rows.length) return null;
+  const m = rows.reduce((s, r) => s + Math.log(r.ratio), 0) / rows.length;
+  let v = 0;
+  for (const r of rows) if (r.lo && r.hi) v += ((Math.log(r.hi) - Math.log(r.lo)) / 3.919928) ** 2;
+  const half = 1.959964 * Math.sqrt(v) / rows.length;
+  return [Math.exp(m), v ? Math.exp(m - half) : null, v ? Math.exp(m + half) : null];
+}
+function view() {
+  const f = {suite: $("f-suite").value, dtype: $("f-dtype").value, n: $("f-n").value,
+             status: $("f-status").value, text: $("f-text").value.toLowerCase()};
+  let rows = R.filter(r => (!f.suite || r.suite === f.suite) && (!f.dtype || r.dtype === f.dtype) &&
+    (!f.n || String(r.n) === f.n) && (!f.status || r.status === f.status) &&
+    (!f.text || r.op.toLowerCase().includes(f.text)));
+  if (sortKey) {
+    const k = sortKey === "ci" ? "lo" : sortKey === "icon" ? "status" : sortKey === "tr" ? "ratio" : sortKey;
+    rows = rows.slice().sort((a, b) => (a[k] == null) - (b[k] == null) || (a[k] > b[k] ? 1 : a[k] < b[k] ? -1 : 0) * sortDir);
+  }
+  const cred = rows.filter(r => CREDIBLE.has(r.status) && r.ratio && (r.threads || 1) === 1);
+  const g = geomean(cred), counts = {};
+  rows.forEach(r => counts[r.status] = (counts[r.status] || 0) + 1);
+  $("summary").innerHTML = `${rows.length} ops · geomean ${g ? fmtR(g[0]) : "-"}` +
+    (g && g[1] ? ` (95% CI ${g[1].toFixed(2)}–${g[2].toFixed(2)}×)` : "") + ` over ${cred.length} credible · ` +
+    Object.keys(ICON).map(s => `${ICON[s]} ${counts[s] || 0}`).join(" · ");
+  $("rows").innerHTML = rows.slice(0, 2000).map(r =>
+    `<tr data-i="${r.i}" class="${r.i === selected ? "sel" : ""}"><td>${ICON[r.status] || ""}</td><td>${r.op}</td><td>${r.dtype}</td>` +
+    `<td>${fmtN(r.n)}</td><td>${r.np == null ? "-" : r.np}</td><td>${r.ns == null ? "-" : r.ns}</td>` +
+    `<td class="${r.status}">${fmtR(r.ratio)}</td><td class="muted">${r.lo ? r.lo.toFixed(2) + "–" + r.hi.toFixed(2) : ""}</td>` +
+    `<td>${spark(r.trend)}</td></tr>`).join("");
+}
+function hist(a, b, w = 460, h = 160) {
+  const all = a.concat(b).filter(v => v > 0).map(Math.log);
+  if (!all.length) return "";
+  const lo = Math.min(...all), hi = Math.max(...all), bins = 40, span = (hi - lo) || 1;
+  const count = xs => { const c = new Array(bins).fill(0); xs.forEach(v => c[Math.min(bins - 1, Math.floor((Math.log(v) - lo) / span * bins))]++); return c.map(x => x / (xs.length || 1)); };
+  const ca = count(a), cb = count(b), top = Math.max(...ca, ...cb) || 1, bw = (w - 20) / bins;
+  const bars = (c, color, off) => c.map((v, i) => `<rect x="${10 + i * bw + off}" y="${h - 20 - v / top * (h - 30)}" width="${bw / 2}" height="${v / top * (h - 30)}" fill="${color}"/>`).join("");
+  const us = v => (Math.exp(v) / 1000).toPrecision(3) + " µs";
+  return `<svg width="${w}" height="${h}">${bars(ca, "#4c78a8", 0)}${bars(cb, "#f58518", bw / 2)}` +
+    `<text x="10" y="${h - 4}" font-size="10">${us(lo)}</text><text x="${w - 10}" y="${h - 4}" font-size="10" text-anchor="end">${us(hi)}</text>` +
+    `<text x="${w - 10}" y="14" font-size="11" text-anchor="end"><tspan fill="#4c78a8">■ NumPy (${a.length})</tspan> <tspan fill="#f58518">■ NumSharp (${b.length})</tspan></text></svg>`;
+}
+function pct(a) {
+  if (!a.length) return "-";
+  const s = a.slice().sort((x, y) => x - y), p = q => s[Math.max(Math.ceil(q * s.length), 1) - 1] / 1e6;
+  return `p50 ${p(.5).toPrecision(3)} · p90 ${p(.9).toPrecision(3)} · p99 ${p(.99).toPrecision(3)} ms`;
+}
+function trendChart(r, w = 460, h = 170) {
+  const pts = r.trend.map((v, i) => [i, v]).filter(p => p[1] != null);
+  if (!pts.length) return "<p class='muted'>No history for this op.</p>";
+  const ys = pts.map(p => Math.log(p[1])), lo = Math.min(0, ...ys) - 0.05, hi = Math.max(0, ...ys) + 0.05;
+  const X = i => 30 + (D.runs.length > 1 ? i / (D.runs.length - 1) : 0.5) * (w - 50), Y = y => h - 20 - (y - lo) / (hi - lo) * (h - 30);
+  const label = i => { const u = D.runs[i]; return (u.run_ts || u.name) + (u.commit_sha ? " · " + u.commit_sha.slice(0, 8) : ""); };
+  return `<svg width="${w}" height="${h}"><line x1="30" x2="${w - 20}" y1="${Y(0)}" y2="${Y(0)}" stroke="#bbb" stroke-dasharray="4 3"/>` +
+    `<text x="4" y="${Y(0) + 4}" font-size="10">1.0×</text>` +
+    `<polyline fill="none" stroke="#36c" stroke-width="1.5" points="${pts.map(p => X(p[0]) + "," + Y(Math.log(p[1]))).join(" ")}"/>` +
+    pts.map(p => `<circle cx="${X(p[0])}" cy="${Y(Math.log(p[1]))}" r="3" fill="#36c"><title>${label(p[0])}: ${fmtR(p[1])}</title></circle>`).join("") +
+    `<text x="30" y="${h - 4}" font-size="10">${label(pts[0][0])}</text><text x="${w - 20}" y="${h - 4}" font-size="10" text-anchor="end">${label(pts[pts.length - 1][0])}</text></svg>`;
+}
+function detail(i) {
+  selected = i;
+  const r = R[i], s = D.samples[i] || [null, null];
+  const a = s[0] ? decode(s[0]) : [], b = s[1] ? decode(s[1]) : [];
+  $("detail").innerHTML = `<h3>${ICON[r.status] || ""} ${r.op} <span class="muted">${r.dtype} · N=${fmtN(r.n)} · ${r.suite}</span></h3>` +
+    `<p>NP/NS <b>${fmtR(r.ratio)}</b>${r.lo ? ` (95% CI ${r.lo.toFixed(3)}–${r.hi.toFixed(3)})` : ""} · NumPy ${r.np ?? "-"} ms · NumSharp ${r.ns ?? "-"} ms</p>` +
+    `<h4>Ratio across snapshots</h4>${trendChart(r)}<h4>Raw samples (per-call time)</h4>` +
+    (a.length || b.length ? hist(a, b) + `<p class="muted">NumPy ${pct(a)}<br>NumSharp ${pct(b)}</p>`
+                          : "<p class='muted'>No raw samples kept for this run.</p>");
+  document.querySelectorAll("#rows tr").forEach(tr => tr.classList.toggle("sel", +tr.dataset.i === i));
+}
+["f-suite", "f-dtype", "f-n", "f-status"].forEach(id => $(id).addEventListener("change", view));
+$("f-text").addEventListener("input", view);
+document.querySelectorAll("th").forEach(th => th.addEventListener("click", () => {
+  sortDir = sortKey === th.dataset.k ? -sortDir : 1; sortKey = th.dataset.k; view();
+}));
+$("rows").addEventListener("click", e => { const tr = e.target.closest("tr"); if (tr) detail(+tr.dataset.i); });
+view();
+</script></body></html>
+"""
+
+
+if __name__ == "__main__":
+    main()
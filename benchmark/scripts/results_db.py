@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Indexed SQLite store of every benchmark result, across runs.
+
+Every producer writes its own file: the merged op-matrix (``benchmark-report.json``), raw
+NumPy rows (``numpy-results.json[l]``), BenchmarkDotNet per-class JSON, the subsystem TSVs
+(``*_results.tsv``) and the MANIFEST. ``ingest`` folds a ``history/<snap>/`` or
+``results/<ts>/`` directory into one table, keyed like the producers key their rows:
+
+    runs          (id, name, commit_sha, run_ts, source_dir, env_id)
+    envs          (id, cpu, os, dotnet, python, numpy)
+    measurements  (run_id, subsystem, key, side, value, status, extra, seq)
+                  PRIMARY KEY (subsystem, key, side, run_id)
+
+``subsystem`` is ``matrix`` (key ``suite|operation|n``), ``nditer`` (key = id), ``layout``
+(``bench|key``), ``operand`` or ``cast``. ``side`` is ``numpy`` / ``numsharp`` (ms) or
+``ratio`` (NumPy ÷ NumSharp, >1 = NumSharp faster). For the op-matrix the ratio row's
+``extra`` keeps the whole merged row (``seq`` its position), so renderers can rebuild a
+report from the store. A results dir without a merged report is merged from its raw
+NumPy/BDN files on ingest.
+
+Reports merged before the ratio convention flipped (``history/2026-06-05_*``: NumSharp ÷
+NumPy, no ``pct_numpy`` column) are inverted on ingest by ``normalize_ratios``; a store built
+before that is migrated in place on ``connect``.
+
+The database is derived data (``benchmark/.results.db``, gitignored). ``ingest`` with no
+paths rebuilds it from ``benchmark/history/``. ``snapshot_history.py`` ingests each new
+snapshot and reads the MANIFEST headline back from the store.
+
+Usage
+-----
+  python benchmark/scripts/results_db.py ingest                          # every history snapshot
+  python benchmark/scripts/results_db.py ingest benchmark/results/20260629-083502
+  python benchmark/scripts/results_db.py runs
+  python benchmark/scripts/results_db.py series cast "1M|f64|strided|i32" --last 30
+  python benchmark/scripts/results_db.py series matrix "Unary|np.sqrt (float64)|10000000" --side numsharp
+"""
+import argparse
+import importlib.util
+import json
+import math
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent      # benchmark/scripts
+BENCH = HERE.parent                          # benchmark
+HISTORY = BENCH / "history"
+DEFAULT_DB = BENCH / ".results.db"
+
+CREDIBLE = {"faster", "close", "slower", "much_slower"}
+STORE_VERSION = 2       # PRAGMA user_version; 2 = matrix ratios normalized to NumPy ÷ NumSharp
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS envs (
+    id INTEGER PRIMARY KEY,
+    cpu TEXT, os TEXT, dotnet TEXT, python TEXT, numpy TEXT,
+    UNIQUE (cpu, os, dotnet, python, numpy)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL,        -- snapshot name (2026-06-29_2d16f477) or results/<ts>
+    commit_sha TEXT,
+    run_ts TEXT,                      -- 20260629-083502
+    source_dir TEXT,
+    env_id INTEGER REFERENCES envs(id),
+    ingested REAL
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    subsystem TEXT NOT NULL,
+    key TEXT NOT NULL,
+    side TEXT NOT NULL,               -- numpy | numsharp (ms) | ratio (NumPy / NumSharp)
+    value REAL,
+    status TEXT,
+    extra TEXT,                       -- JSON (op-matrix ratio rows: the whole merged row)
+    seq INTEGER,                      -- row order in the producer's file
+    PRIMARY KEY (subsystem, key, side, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS measurements_run ON measurements(run_id, subsystem);
+CREATE INDEX IF NOT EXISTS runs_ts ON runs(run_ts);
+"""
+
+# *_results.tsv -> subsystem. Columns: [bench] key ns_ms np_ms (NA = NumSharp side ignored).
+TSV_SUBSYSTEMS = {"nditer_results.tsv": "nditer", "layout_results.tsv": "layout",
+                  "operand_results.tsv": "operand", "cast_results.tsv": "cast"}
+
+
+def connect(path=DEFAULT_DB):
+    conn = sqlite3.connect(str(path))
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    if conn.execute("PRAGMA user_version").fetchone()[0] < STORE_VERSION:
+        _migrate(conn)
+    return conn
+
+
+def _migrate(conn):
+    """Bring an older store up to STORE_VERSION: re-normalize each run's stored op-matrix rows
+    (the ratio rows keep the whole merged row, so no source dir is needed)."""
+    with conn:
+        for (run_id,) in conn.execute("SELECT id FROM runs").fetchall():
+            stored = conn.execute("SELECT key, extra FROM measurements WHERE run_id=? AND "
+                                  "subsystem='matrix' AND side='ratio' ORDER BY seq", (run_id,)).fetchall()
+            rows = [json.loads(extra) for _, extra in stored]
+            fixed = normalize_ratios(rows)
+            if fixed is rows:
+                continue
+            conn.executemany("UPDATE measurements SET value=?, extra=? WHERE run_id=? AND "
+                             "subsystem='matrix' AND side='ratio' AND key=?",
+                             [(r.get("ratio"), json.dumps(r), run_id, key)
+                              for (key, _), r in zip(stored, fixed)])
+        conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+
+
+def _merge_module():
+    """scripts/merge-results.py (hyphenated, so not importable by name)."""
+    spec = importlib.util.spec_from_file_location("merge_results", HERE / "merge-results.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# ---- reading producers -------------------------------------------------------
+def read_manifest(path):
+    """(commit, run_ts, env dict) from a snapshot MANIFEST.md."""
+    text = path.read_text(encoding="utf-8") if path.exists() else ""
+
+    def cell(label):
+        m = re.search(rf"^\| {re.escape(label)} \| (.+?) \|\s*$", text, re.M)
+        return m.group(1).strip() if m else None
+
+    head = cell("Git HEAD") or ""
+    ts = cell("Run timestamp") or ""
+    dotnet = cell(".NET SDK") or ""
+    env = {"CPU": cell("CPU"), "OS": cell("OS"), "dotnet": dotnet.split(" (")[0] or None,
+           "python": cell("Python"), "numpy": cell("NumPy")}
+    sha = re.match(r"`([0-9a-f]+)`", head)
+    return (sha.group(1) if sha else None), ts.strip("`") or None, env
+
+
+def matrix_rows(directory):
+    """The merged op-matrix rows of a run dir: its benchmark-report.json, else a fresh merge
+    of its raw numpy-results.json[l] + csharp/ BDN JSON (warm rows only, like the report)."""
+    report = directory / "benchmark-report.json"
+    if report.exists():
+        return normalize_ratios(json.loads(report.read_text(encoding="utf-8")))
+    raw = next((directory / n for n in ("numpy-results.jsonl", "numpy-results.json")
+                if (directory / n).exists()), None)
+    if raw is None:
+        return []
+    mr = _merge_module()
+    warm, _ = mr.split_cache_modes(mr.load_numpy_results(str(raw)))
+    csharp = (mr.load_csharp_results(str(directory / "csharp"), keep_samples=True)
+              if (directory / "csharp").exists() else [])
+    return [r.to_dict() for r in mr.merge_results(warm, csharp)]
+
+
+def normalize_ratios(rows):
+    """Op-matrix rows with ``ratio`` as NumPy ÷ NumSharp. A report without ``pct_numpy`` predates
+    that convention and stored NumSharp ÷ NumPy: its rows come back as inverted copies (with
+    ``pct_numpy`` filled in, so normalizing twice is a no-op); any other list is returned as is."""
+    if not rows or any("pct_numpy" in r for r in rows):
+        return rows
+    out = []
+    for r in rows:
+        r = dict(r)
+        if r.get("ratio"):
+            r["pct_numpy"] = r["ratio"] * 100
+            r["ratio"] = 1 / r["ratio"]
+        else:
+            r["pct_numpy"] = None
+        out.append(r)
+    return out
+
+
+def matrix_keys(rows):
+    """Store key of each op-matrix row: ``suite|operation|n``, ``|#k`` on the k-th repeat."""
+    seen, keys = set(), []
+    for r in rows:
+        base = key = f"{r['suite']}|{r['operation']}|{r['n']}"
+        dup = 1
+        while key in seen:
+            dup += 1    # the same op emitted twice by a producer: keep both, suffixed
+            key = f"{base}|#{dup}"
+        seen.add(key)
+        keys.append(key)
+    return keys
+
+
+def read_tsv(path):
+    """(key, ns_ms | None, np_ms) rows of a subsystem TSV."""
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        header = next(f, "").rstrip("\n").split("\t")
+        keyed = header[0] == "bench"   # layout: bench + key
+        for ln in f:
+            p = ln.rstrip("\n").split("\t")
+            if len(p) != len(header):
+                continue
+            key = f"{p[0]}|{p[1]}" if keyed else p[0]
+            ns, npy = p[-2], p[-1]
+            try:
+                rows.append((key, None if ns == "NA" else float(ns), float(npy)))
+            except ValueError:
+                continue
+    return rows
+
+
+# ---- ingest ------------------------------------------------------------------
+def _env_id(conn, env):
+    # unknown fields are stored as '', not NULL: UNIQUE treats NULLs as distinct, so a run with
+    # one would add a fresh envs row on every ingest
+    vals = tuple(env.get(k) or "" for k in ("CPU", "OS", "dotnet", "python", "numpy"))
+    conn.execute("INSERT OR IGNORE INTO envs(cpu, os, dotnet, python, numpy) VALUES(?, ?, ?, ?, ?)", vals)
+    return conn.execute("SELECT id FROM envs WHERE cpu=? AND os=? AND dotnet=? "
+                        "AND python=? AND numpy=?", vals).fetchone()[0]
+
+
+def ingest(conn, directory, name=None, commit=None, run_ts=None, env=None):
+    """Replace run `name` (default: the dir name) with everything found in `directory`.
+
+    Provenance not passed in comes from the dir's MANIFEST.md, else the dir name and the
+    current machine (``snapshot_history.detect_env``).
+    """
+    directory = Path(directory).resolve()
+    manifest = directory / "MANIFEST.md"
+    if manifest.exists():
+        sha, ts, found = read_manifest(manifest)
+    else:
+        sha, ts, found = None, directory.name, None
+        if env is None:
+            sys.path.insert(0, str(HERE))
+            from snapshot_history import detect_env
+            found = detect_env(directory)
+    run_ts, env = run_ts or ts, env or found
+    name = name or directory.name
+    commit = commit or sha or (name.rsplit("_", 1)[1] if re.match(r"\d{4}-\d\d-\d\d_", name) else None)
+
+    rows = {}   # (subsystem, key, side) -> row
+
+    def put(subsystem, key, side, value, status, extra=None):
+        rows[subsystem, key, side] = (subsystem, key, side, value, status, extra, len(rows))
+
+    matrix = matrix_rows(directory)
+    for key, r in zip(matrix_keys(matrix), matrix):
+        put("matrix", key, "numpy", r.get("numpy_ms"), r.get("status"))
+        put("matrix", key, "numsharp", r.get("numsharp_ms"), r.get("status"))
+        put("matrix", key, "ratio", r.get("ratio"), r.get("status"), json.dumps(r))
+    for fname, subsystem in TSV_SUBSYSTEMS.items():
+        path = directory / fname
+        if not path.exists():
+            continue
+        for key, ns, npy in read_tsv(path):
+            ratio = npy / ns if ns and ns > 0 and npy > 0 else None
+            status = "na" if ns is None else None
+            put(subsystem, key, "numsharp", ns, status)
+            put(subsystem, key, "numpy", npy, status)
+            put(subsystem, key, "ratio", ratio, status)
+
+    with conn:
+        old = conn.execute("SELECT id FROM runs WHERE name=?", (name,)).fetchone()
+        if old:
+            conn.execute("DELETE FROM measurements WHERE run_id=?", (old["id"],))
+            conn.execute("DELETE FROM runs WHERE id=?", (old["id"],))
+        run_id = conn.execute(
+            "INSERT INTO runs(name, commit_sha, run_ts, source_dir, env_id, ingested) VALUES(?, ?, ?, ?, ?, ?)",
+            (name, commit, run_ts, str(directory), _env_id(conn, env), time.time())).lastrowid
+        conn.executemany("INSERT INTO measurements VALUES(?, ?, ?, ?, ?, ?, ?, ?)",
+                         [(run_id, *r) for r in rows.values()])
+    return run_id, len(rows)
+
+
+def ingest_history(conn, missing_only=False):
+    """Every snapshot under benchmark/history/ (``latest`` is only a pointer)."""
+    have = {r[0] for r in conn.execute("SELECT name FROM runs")} if missing_only else set()
+    done = []
+    for snap in sorted(p for p in HISTORY.iterdir() if p.is_dir() and not p.is_symlink()):
+        if snap.name not in have:
+            done.append((snap.name, *ingest(conn, snap)))
+    return done
+
+
+# ---- queries -----------------------------------------------------------------
+def series(conn, subsystem, key, side="ratio", last=30):
+    """[(run name, commit, run_ts, value)] of one key over the newest `last` runs, oldest first."""
+    rows = conn.execute(
+        "SELECT r.name, r.commit_sha, r.run_ts, m.value FROM measurements m "
+        "JOIN runs r ON r.id = m.run_id WHERE m.subsystem=? AND m.key=? AND m.side=? "
+        "ORDER BY r.run_ts DESC LIMIT ?", (subsystem, key, side, last)).fetchall()
+    return [tuple(r) for r in reversed(rows)]
+
+
+def run_values(conn, name, subsystem="matrix", side="ratio"):
+    """{key: value} of one run's rows of a subsystem and side."""
+    return dict(conn.execute(
+        "SELECT m.key, m.value FROM measurements m JOIN runs r ON r.id = m.run_id "
+        "WHERE r.name=? AND m.subsystem=? AND m.side=?", (name, subsystem, side)).fetchall())
+
+
+def latest_run(conn):
+    r = conn.execute("SELECT name FROM runs ORDER BY run_ts DESC LIMIT 1").fetchone()
+    return r["name"] if r else None
+
+
+def run_rows(conn, name):
+    """The merged op-matrix rows of a run, as written to benchmark-report.json."""
+    return [json.loads(r[0]) for r in conn.execute(
+        "SELECT m.extra FROM measurements m JOIN runs r ON r.id = m.run_id "
+        "WHERE r.name=? AND m.subsystem='matrix' AND m.side='ratio' ORDER BY m.seq", (name,))]
+
+
+def size_summary(conn, name):
+    """Per-size headline of a run, shaped like snapshot_history.parse_size_summary's rows."""
+    by_n = {}
+    for r in run_rows(conn, name):
+        by_n.setdefault(r["n"], []).append(r)
+    out = []
+    for n in sorted(by_n):
+        rs = by_n[n]
+        if n < 1000 or len(rs) <= 5:
+            continue
+        # credible single-thread rows only, as merge-results.py's "Summary by size"
+        rat = [r["ratio"] for r in rs if r["status"] in CREDIBLE and r.get("ratio")
+               and (r.get("threads") or 1) == 1]
+        gm = math.exp(sum(math.log(x) for x in rat) / len(rat)) if rat else None
+        count = lambda s: str(sum(1 for r in rs if r["status"] == s))  # noqa: E731
+        out.append({"N": f"{n:,}", "ok": count("faster"), "close": count("close"),
+                    "slow": count("slower"), "red": count("much_slower"),
+                    "geomean": f"{gm:.2f}x" if gm else "-",
+                    "pnp": f"{100.0 / gm:.0f}%" if gm else "-"})
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark results store")
+    ap.add_argument("--db", type=Path, default=DEFAULT_DB)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("ingest", help="Ingest run dirs (default: all of benchmark/history/)")
+    p.add_argument("paths", nargs="*", type=Path)
+    p.add_argument("--commit", default=None, help="Commit of a results/<ts> dir (no MANIFEST)")
+    sub.add_parser("runs", help="List ingested runs")
+    p = sub.add_parser("series", help="One key across runs")
+    p.add_argument("subsystem")
+    p.add_argument("key")
+    p.add_argument("--side", default="ratio", choices=["ratio", "numpy", "numsharp"])
+    p.add_argument("--last", type=int, default=30)
+    args = ap.parse_args()
+
+    conn = connect(args.db)
+    if args.cmd == "ingest":
+        t = time.perf_counter()
+        done = ([(Path(d).name, *ingest(conn, d, commit=args.commit)) for d in args.paths]
+                if args.paths else ingest_history(conn))
+        for name, run_id, n in done:
+            print(f"  {name}: {n} measurements (run {run_id})")
+        print(f"Ingested {len(done)} runs in {time.perf_counter() - t:.1f}s -> {args.db}")
+    elif args.cmd == "runs":
+        for r in conn.execute("SELECT r.name, r.commit_sha, r.run_ts, e.cpu, COUNT(m.key) AS n "
+                              "FROM runs r LEFT JOIN envs e ON e.id = r.env_id "
+                              "LEFT JOIN measurements m ON m.run_id = r.id "
+                              "GROUP BY r.id ORDER BY r.run_ts"):
+            print(f"{r['name']:<28} {r['commit_sha'] or '-':<10} {r['run_ts'] or '-':<16} "
+                  f"{r['n']:>7}  {r['cpu'] or ''}")
+    else:
+        t = time.perf_counter()
+        rows = series(conn, args.subsystem, args.key, args.side, args.last)
+        for name, sha, _, v in rows:
+            print(f"{name:<28} {sha or '-':<10} {'-' if v is None else f'{v:.4g}'}")
+        print(f"{len(rows)} runs in {(time.perf_counter() - t) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,12 +16,18 @@ A snapshot contains *everything we commit and reference*:
     benchmark-report.json  unified machine-readable op-matrix results
     benchmark-report.csv   spreadsheet form
     numpy-results.json     raw NumPy timings (merge input)
+    environment.json       noise-gate probes: governor/turbo/load/throttle + calibration drift
+    failures.jsonl         bench sections that hit a memory/CPU/wall limit or crashed
+    regressions.md         per-key ratio shifts vs earlier snapshots (detect_regressions.py)
     nditer_results.md/.tsv + cards/{ops,cat}.png
     layout_results.md/.tsv · operand_results.md/.tsv · cast_results.md/.tsv · fusion_results.md
 
 Raw BenchmarkDotNet per-class JSON (~tens of MB) is intentionally NOT persisted
 (regenerable — reproduce with ``python benchmark/run_benchmark.py``).
 
+Each snapshot is also ingested into the results store (``results_db.py``,
+``benchmark/.results.db``), which supplies the MANIFEST headline.
+
 ``benchmark/history/latest`` is a relative symlink to the newest snapshot, committed
 to git as a mode-120000 object (the repo has ``core.symlinks=true`` and already
 tracks symlinks). Docs / CI reference the stable path
@@ -36,6 +42,7 @@ Usage
   python benchmark/scripts/snapshot_history.py --no-stage          # don't git add
 """
 import argparse
+import json
 import os
 import platform
 import re
@@ -114,6 +121,23 @@ def detect_env(results_dir):
         env["numpy"] = numpy.__version__
     except Exception:
         env["numpy"] = "unknown"
+    noise = (results_dir / "environment.json") if results_dir else None
+    if noise and noise.exists():
+        try:
+            gate = json.loads(noise.read_text(encoding="utf-8"))
+        except ValueError:
+            gate = None
+        fp = (gate or {}).get("preflight") or {}
+        if fp:
+            flagged = sum(1 for r in gate["suites"].values() if r["flagged"])
+            turbo = "n/a" if fp.get("turbo") is None else "on" if fp["turbo"] else "off"
+            parts = [f"governor {'/'.join(fp['governor']) if fp.get('governor') else 'n/a'}",
+                     f"turbo {turbo}"]
+            if fp.get("load"):
+                parts.append(f"load {fp['load'][0]:.2f}")
+            parts.append(f"{flagged}/{len(gate['suites'])} suite runs flagged "
+                         f"(>{gate['threshold']:.0%} drift)")
+            env["noise"] = " · ".join(parts)
     return env
 
 
@@ -195,13 +219,17 @@ def build_manifest(snap_name, run_ts, head, subject, dirty, dirty_files, env,
           f"| OS | {env['OS']} |",
           f"| .NET SDK | {env['dotnet']} (net10.0, Release) |",
           f"| Python | {env['python']} |",
-          f"| NumPy | {env['numpy']} |", "",
+          f"| NumPy | {env['numpy']} |"]
+    if env.get("noise"):
+        L.append(f"| Noise gate | {env['noise']} |")
+    L += ["",
           "## Convention",
           "**Ratio = NumPy_ms ÷ NumSharp_ms (NPY/NS) → `>1.0×` = NumSharp faster** (higher is better).", "",
           "## Methodology",
           "- **C#:** BenchmarkDotNet, `OfficialBenchmarkConfig` — InProcessEmit toolchain, 50 measured",
           "  iterations / 5 warmup, iteration time capped at 25 ms. MemoryDiagnoser on.",
-          "- **NumPy:** 50 timed iterations / 10 warmup per op (warm long-lived interpreter).",
+          "- **NumPy:** adaptive — inner loop calibrated to >=2 ms samples, sampled until the median's",
+          "  95% CI is within 2% (2 s budget per op). Ratio CIs gate the slower bands.",
           "- **Sizes:** 1,000 / 100,000 / 10,000,000 elements. Same seeds both sides.",
           "- Join keyed on (op, dtype, N).",
           "- **Subsystems** appended to `benchmark-report.md`: NDIter, Layout, Operand, Cast, Fusion.", ""]
@@ -222,6 +250,9 @@ def build_manifest(snap_name, run_ts, head, subject, dirty, dirty_files, env,
           "| `benchmark-report.md` | op-matrix (per-(op,dtype,N) ratio) + appended NDIter/Layout/Operand/Cast/Fusion |",
           "| `benchmark-report.json` / `.csv` | unified machine-readable / spreadsheet form |",
           "| `numpy-results.json` | raw NumPy timings (merge input) |",
+          "| `environment.json` | noise-gate probes (when the run had the gate on) |",
+          "| `failures.jsonl` | bench sections that hit a resource limit or crashed (when any did) |",
+          "| `regressions.md` | per-key ratio shifts vs earlier snapshots (`detect_regressions.py`) |",
           "| `nditer_results.*` + `cards/` | iterator benchmark sheet + README cards |",
           "| `layout_/operand_/cast_/fusion_results.*` | the four matrix-subsystem sheets |", "",
           "Raw BenchmarkDotNet per-class JSON (~tens of MB) is **not** persisted here "
@@ -287,19 +318,44 @@ def make_snapshot(results_dir=None, snap_name=None, head=None, stage=True,
             copied.append(src.name)
         else:
             log(f"  [warn] missing subsystem sheet: {src.name}")
+    for name in ("environment.json", "failures.jsonl"):
+        if results_dir and (results_dir / name).exists():
+            shutil.copy(results_dir / name, snap / name)
+            copied.append(name)
     for src in CARDS:
         if src.exists():
             shutil.copy(src, snap / "cards" / src.name)
             copied.append(f"cards/{src.name}")
 
     env = detect_env(results_dir)
+    size_rows = None
+    try:
+        # the store carries every run; the MANIFEST headline is read back from it
+        import results_db
+        conn = results_db.connect()
+        results_db.ingest(conn, snap, name=snap_name, commit=head, run_ts=run_ts, env=env)
+        size_rows = results_db.size_summary(conn, snap_name)
+        log(f"[snapshot] ingested into {results_db.DEFAULT_DB.name}")
+    except Exception as e:
+        log(f"  [warn] results store not updated: {type(e).__name__}: {e}")
     manifest = build_manifest(
         snap_name, run_ts, head, subject, dirty, dirty_files, env,
-        parse_size_summary(snap / "benchmark-report.md"),
+        size_rows or parse_size_summary(snap / "benchmark-report.md"),
         parse_overall(snap / "benchmark-report.md"),
         parse_nditer_headline(), parse_cast_headline())
     (snap / "MANIFEST.md").write_text(manifest, encoding="utf-8")
     log(f"[snapshot] benchmark/history/{snap_name} — {len(copied)} artifacts + MANIFEST.md")
+    if size_rows:   # the run is in the store: test it against the earlier snapshots
+        try:
+            import detect_regressions as dr
+            # the baseline window needs the earlier snapshots too, not just this run
+            results_db.ingest_history(conn, missing_only=True)
+            tests, hits, sigma = dr.detect(conn, snap_name)
+            dr.write_snapshot(snap_name, dr.render(snap_name, tests, hits, sigma))
+            log(f"[snapshot] regressions.md — {sum(t['shift'] < 0 for t in hits)} regressions, "
+                f"{sum(t['shift'] > 0 for t in hits)} improvements over {len(tests)} keys")
+        except Exception as e:
+            log(f"  [warn] regression report skipped: {type(e).__name__}: {e}")
 
     # latest -> <snap_name> (relative symlink; committed as mode-120000)
     latest = HISTORY / "latest"
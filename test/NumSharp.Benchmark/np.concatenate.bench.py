@@ -10,30 +10,28 @@ be diff-compared. Run with:
 Where section is one of: dtype, layout, size, count, promotion, kwargs.
 Omit for the full sweep.
 
-Reports median wall time (ms) per scenario.
+Reports median wall time (ms) per scenario, like the C# harness
+(BENCH_ESTIMATOR overrides; timing comes from benchmark/scripts/bench_timing.py).
 Aligns with NumPy 2.x; tested against 2.4.2.
 """
+import os
 import sys
-import time
+
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "benchmark", "scripts"))
+import bench_timing as bt  # noqa: E402
+
 
 WARMUP = 20
 DEFAULT_REPS = 100
+ESTIMATOR = bt.env_estimator("median")
 
 
 def bench(label: str, fn, warmup: int = WARMUP, reps: int = DEFAULT_REPS) -> float:
-    for _ in range(warmup):
-        fn()
-    ts = []
-    for _ in range(reps):
-        t0 = time.perf_counter()
-        fn()
-        ts.append(time.perf_counter() - t0)
-    ts.sort()
-    median_ms = ts[len(ts) // 2] * 1000.0
-    print(f"  {label:<44}  {median_ms:>9.3f} ms")
-    return median_ms
+    ms = bt.time_ms(fn, 1, warmup, reps, estimator=ESTIMATOR)
+    print(f"  {label:<44}  {ms:>9.3f} ms")
+    return ms
 
 
 def header(section: str) -> None:
@@ -183,7 +181,7 @@ def main() -> None:
     section = sys.argv[1] if len(sys.argv) > 1 else None
     print("=== NumPy np.concatenate variation sweep ===")
     print(f"Runtime: NumPy {np.__version__} on Python {sys.version.split()[0]}")
-    print(f"Warmup={WARMUP} iters, median-of-{DEFAULT_REPS}.")
+    print(f"Warmup={WARMUP} iters, {ESTIMATOR}-of-{DEFAULT_REPS}.")
 
     run_all = section is None
     if run_all or section == "dtype":     run_dtype_sweep()